@@ -0,0 +1,71 @@
+"""Base class for all benchmarks."""
+import time
+
+from mpf.benchmarks.results import collected_results
+from mpf.core.logging import LogMixin
+from mpf.tests.MpfFakeGameTestCase import MpfFakeGameTestCase
+
+
+class MpfBenchmarkTestCase(MpfFakeGameTestCase):
+
+    """Runs a benchmark on a machine driven by the TimeTravelLoop.
+
+    Measurements are taken in wall clock time (using ``time.perf_counter``)
+    while MPF itself runs on the test loop. This way we only measure the time
+    MPF spends in its own code and not the time it waits for delays.
+    """
+
+    def __init__(self, methodName='runTest'):
+        """Initialise benchmark."""
+        super().__init__(methodName)
+        # benchmarks run long on purpose
+        self.expected_duration = 60
+
+    def getConfigFile(self):
+        return 'hot_paths.yaml'
+
+    def getMachinePath(self):
+        return 'benchmarks/machine_files/hot_paths/'
+
+    def setUp(self):
+        # log like a production machine. unit tests always log info messages
+        LogMixin.unit_test = False
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+        LogMixin.unit_test = True
+
+    @staticmethod
+    def add_result(name, value, unit, higher_is_better=True):
+        """Record a benchmark result."""
+        collected_results.add(name, value, unit, higher_is_better)
+
+    def measure_rate(self, name, unit, callback, count):
+        """Call callback once and record ``count`` operations per second.
+
+        Args:
+            name: Name of the benchmark.
+            unit: Unit of one operation (e.g. "events/s").
+            callback: Callable which performs ``count`` operations.
+            count: Number of operations performed by callback.
+        """
+        start = time.perf_counter()
+        callback()
+        duration = time.perf_counter() - start
+        rate = count / duration if duration > 0 else float("inf")
+        self.add_result(name, rate, unit, higher_is_better=True)
+        return rate
+
+    def measure_duration(self, name, callback, repeat):
+        """Call callback ``repeat`` times and record the median duration in ms."""
+        durations = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            callback()
+            durations.append(time.perf_counter() - start)
+
+        durations.sort()
+        median = durations[len(durations) // 2] * 1000
+        self.add_result(name, median, "ms", higher_is_better=False)
+        return median
@@ -0,0 +1,4 @@
+"""Benchmarks for the hot paths in MPF.
+
+Run them with ``python -m mpf.benchmarks`` from the root of your MPF folder.
+"""
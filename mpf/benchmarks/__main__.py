@@ -0,0 +1,55 @@
+"""Run all MPF benchmarks and compare them against a baseline.
+
+Example:
+    python -m mpf.benchmarks -o results.json -b baseline.json
+"""
+import argparse
+import os
+import sys
+import unittest
+
+import mpf
+from mpf.benchmarks.results import BenchmarkResults, collected_results
+
+
+def main(argv=None):
+    """Run benchmarks, save results and compare them against a baseline."""
+    parser = argparse.ArgumentParser(description='Run the MPF benchmarks')
+    parser.add_argument("-o", "--output", default="benchmark_results.json",
+                        help="JSON file to write the results to")
+    parser.add_argument("-b", "--baseline", default=None,
+                        help="JSON file of a previous run to compare the results to")
+    parser.add_argument("-t", "--threshold", type=float, default=10,
+                        help="Changes (in percent) which are considered a regression. Default: 10")
+    parser.add_argument("-p", "--pattern", default="benchmark_*.py",
+                        help="Only run benchmark files matching this pattern")
+    args = parser.parse_args(argv)
+
+    benchmark_path = os.path.dirname(os.path.abspath(__file__))
+    top_level_path = os.path.abspath(os.path.join(mpf.__path__[0], os.pardir))
+    suite = unittest.defaultTestLoader.discover(benchmark_path, pattern=args.pattern, top_level_dir=top_level_path)
+    test_result = unittest.TextTestRunner(verbosity=1).run(suite)
+
+    collected_results.save(args.output)
+    print("\nResults written to {}".format(args.output))
+    for result in sorted(collected_results.results.values()):
+        print("{:55} {:>14.2f} {}".format(result.name, result.value, result.unit))
+
+    regressions = []
+    if args.baseline:
+        print("\nComparison with baseline {}:".format(args.baseline))
+        comparisons = collected_results.compare(BenchmarkResults.load(args.baseline), args.threshold / 100)
+        for comparison in comparisons:
+            print("{:55} {:>14.2f} -> {:>14.2f} {:10} {:+7.1f}% {}".format(
+                comparison.name, comparison.baseline, comparison.current, comparison.unit, comparison.change * 100,
+                "REGRESSION" if comparison.regression else ""))
+        regressions = [comparison for comparison in comparisons if comparison.regression]
+
+    if not test_result.wasSuccessful() or regressions:
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""Benchmark BCP encoding and decoding."""
+from mpf.benchmarks.MpfBenchmarkTestCase import MpfBenchmarkTestCase
+from mpf.core.bcp.bcp_socket_client import encode_command_string, decode_command_string
+
+
+class BenchmarkBcp(MpfBenchmarkTestCase):
+
+    messages = [
+        ("switch", dict(name="s_bench1", state=1)),
+        ("trigger", dict(name="ball_started", ball=1, player=1)),
+        ("player_variable", dict(name="score", value=123456, prev_value=120000, change=3456, player_num=1)),
+        ("machine_variable", dict(name="credits_string", value="FREE PLAY", prev_value=None, change=True)),
+        ("monitor_event", dict(event="bench", kwargs={"a": 1, "b": [1, 2, 3]}, registered_handlers=[])),
+    ]
+
+    def test_encode(self):
+        count = 5000
+
+        def _encode():
+            for _ in range(count):
+                for command, kwargs in self.messages:
+                    encode_command_string(command, **kwargs)
+
+        self.measure_rate("bcp.encode_per_sec", "messages/s", _encode, count * len(self.messages))
+
+    def test_decode(self):
+        count = 5000
+        encoded = [encode_command_string(command, **kwargs) for command, kwargs in self.messages]
+
+        def _decode():
+            for _ in range(count):
+                for message in encoded:
+                    decode_command_string(message)
+
+        self.measure_rate("bcp.decode_per_sec", "messages/s", _decode, count * len(encoded))
@@ -0,0 +1,36 @@
+"""Benchmark config loading."""
+import os
+import time
+
+from mpf.benchmarks.MpfBenchmarkTestCase import MpfBenchmarkTestCase
+from mpf.core.config_processor import ConfigProcessor
+from mpf.file_interfaces.yaml_interface import YamlInterface
+
+
+class BenchmarkConfig(MpfBenchmarkTestCase):
+
+    def _load_config(self):
+        ConfigProcessor.load_config_file(self.machine.options['mpfconfigfile'], config_type='machine')
+        ConfigProcessor.load_config_file(os.path.join(self.getAbsoluteMachinePath(), 'config', self.getConfigFile()),
+                                         config_type='machine')
+
+    def test_config_load(self):
+        # measure parsing and not the cache
+        cache = YamlInterface.cache
+        YamlInterface.cache = False
+        try:
+            self.measure_duration("config.load_time", self._load_config, 10)
+        finally:
+            YamlInterface.cache = cache
+
+    def test_machine_init(self):
+        durations = []
+        for _ in range(5):
+            self.tearDown()
+            start = time.perf_counter()
+            self.setUp()
+            durations.append(time.perf_counter() - start)
+
+        durations.sort()
+        self.add_result("config.machine_init_time", durations[len(durations) // 2] * 1000, "ms",
+                        higher_is_better=False)
@@ -0,0 +1,37 @@
+"""Benchmark the DelayManager."""
+from mpf.benchmarks.MpfBenchmarkTestCase import MpfBenchmarkTestCase
+
+
+class BenchmarkDelays(MpfBenchmarkTestCase):
+
+    def _callback(self):
+        self._calls += 1
+
+    def _add_delays(self, count):
+        # a few hundred delays at a time with typical lengths of timers, ball saves and shows
+        for i in range(count):
+            self.machine.delay.add(100 + (i % 50) * 10, self._callback)
+            if i % 500 == 499:
+                self.advance_time_and_run(.1)
+        self.advance_time_and_run(1)
+
+    def test_add_and_run(self):
+        self._calls = 0
+        wheel = self.machine.clock.timer_wheel
+        wakeups = wheel.wakeups
+        count = 20000
+        self.measure_rate("delays.add_and_run", "delays/s", lambda: self._add_delays(count), count)
+        self.assertEqual(count, self._calls)
+        self.add_result("delays.loop_wakeups_per_1000_delays", (wheel.wakeups - wakeups) * 1000 / count,
+                        "wakeups", higher_is_better=False)
+
+    def _add_and_remove(self, count):
+        for i in range(count):
+            self.machine.delay.add(1000, self._callback, "bench_delay_{}".format(i % 200))
+            self.machine.delay.remove("bench_delay_{}".format((i + 100) % 200))
+
+    def test_add_and_remove(self):
+        self._calls = 0
+        count = 50000
+        self.measure_rate("delays.add_and_remove", "delays/s", lambda: self._add_and_remove(count), count)
+        self.machine.delay.clear()
@@ -0,0 +1,73 @@
+"""Benchmark memory and attribute access of switches and lights."""
+import sys
+import tracemalloc
+
+from mpf.benchmarks.MpfBenchmarkTestCase import MpfBenchmarkTestCase
+from mpf.core.platform import SwitchConfig
+from mpf.platforms.virtual import VirtualSwitch, VirtualLight
+
+
+def _instance_bytes(obj):
+    """Return the size of an object and its instance dict (if any)."""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+class BenchmarkDevices(MpfBenchmarkTestCase):
+
+    def test_instance_size(self):
+        switch = self.machine.switches.s_bench1
+        light = self.machine.light_stripes.bench_strip.lights[0]
+
+        self.add_result("devices.switch_bytes", _instance_bytes(switch), "bytes", higher_is_better=False)
+        self.add_result("devices.light_bytes", _instance_bytes(light), "bytes", higher_is_better=False)
+        self.add_result("devices.hw_switch_bytes", _instance_bytes(switch.hw_switch), "bytes",
+                        higher_is_better=False)
+        self.add_result("devices.hw_light_bytes", _instance_bytes(light.hw_drivers["red"]), "bytes",
+                        higher_is_better=False)
+
+    def test_hw_object_memory(self):
+        # what a platform allocates for a machine with lots of switches and light channels
+        count = 1000
+        config = SwitchConfig(invert=0, debounce="auto")
+        tracemalloc.start()
+        try:
+            start = tracemalloc.get_traced_memory()[0]
+            switches = [VirtualSwitch(config, str(i)) for i in range(count)]
+            lights = [VirtualLight(str(i), {}) for i in range(count)]
+            used = tracemalloc.get_traced_memory()[0] - start
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(count, len(switches))
+        self.assertEqual(count, len(lights))
+        self.add_result("devices.hw_switch_and_light_bytes_per_pair", used / count, "bytes",
+                        higher_is_better=False)
+
+    def _read_switch_state(self, switches, count):
+        total = 0
+        for _ in range(count):
+            for switch in switches:
+                total += switch.state + switch.hw_state + switch.invert
+        return total
+
+    def test_switch_attribute_access(self):
+        switches = list(self.machine.switches)
+        count = 20000
+        self.measure_rate("devices.switch_attribute_reads", "reads/s",
+                          lambda: self._read_switch_state(switches, count), 3 * count * len(switches))
+
+    def _read_light_stack(self, lights, count):
+        total = 0
+        for _ in range(count):
+            for light in lights:
+                total += len(light.stack) + len(light.hw_drivers)
+        return total
+
+    def test_light_attribute_access(self):
+        lights = self.machine.light_stripes.bench_strip.lights
+        count = 5000
+        self.measure_rate("devices.light_attribute_reads", "reads/s",
+                          lambda: self._read_light_stack(lights, count), 2 * count * len(lights))
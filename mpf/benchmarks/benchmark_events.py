@@ -0,0 +1,29 @@
+"""Benchmark the EventManager."""
+from mpf.benchmarks.MpfBenchmarkTestCase import MpfBenchmarkTestCase
+
+
+class BenchmarkEvents(MpfBenchmarkTestCase):
+
+    def _handler(self, **kwargs):
+        del kwargs
+        self._calls += 1
+
+    def _post_events(self, event, count):
+        for _ in range(count):
+            self.machine.events.post(event, value=1)
+            self.machine.events.process_event_queue()
+
+    def test_post_with_handlers(self):
+        self._calls = 0
+        for priority in range(5):
+            self.machine.events.add_handler("bench_event", self._handler, priority=priority)
+
+        count = 20000
+        self.measure_rate("events.post_with_5_handlers", "events/s",
+                          lambda: self._post_events("bench_event", count), count)
+        self.assertEqual(5 * count, self._calls)
+
+    def test_post_without_handlers(self):
+        count = 50000
+        self.measure_rate("events.post_without_handlers", "events/s",
+                          lambda: self._post_events("bench_event_nobody_listens", count), count)
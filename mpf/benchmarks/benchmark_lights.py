@@ -0,0 +1,39 @@
+"""Benchmark light updates."""
+from mpf.benchmarks.MpfBenchmarkTestCase import MpfBenchmarkTestCase
+from mpf.core.rgb_color import RGBColor
+
+
+class BenchmarkLights(MpfBenchmarkTestCase):
+
+    def _update_lights(self, lights, colors, count, fade_ms):
+        for i in range(count):
+            color = colors[i % len(colors)]
+            for light in lights:
+                light.color(color, fade_ms=fade_ms, key="bench")
+                # read back the brightness like a platform would do on write
+                light.hw_drivers["red"].current_brightness
+
+    def test_light_updates(self):
+        lights = self.machine.light_stripes.bench_strip.lights
+        colors = [RGBColor("red"), RGBColor("green"), RGBColor("blue"), RGBColor("white")]
+        count = 200
+        self.measure_rate("lights.updates_per_sec", "updates/s",
+                          lambda: self._update_lights(lights, colors, count, 0), count * len(lights))
+
+    def test_light_updates_with_fade(self):
+        lights = self.machine.light_stripes.bench_strip.lights
+        colors = [RGBColor("red"), RGBColor("green"), RGBColor("blue"), RGBColor("white")]
+        count = 200
+        self.measure_rate("lights.updates_per_sec_with_fade", "updates/s",
+                          lambda: self._update_lights(lights, colors, count, 100), count * len(lights))
+
+    def test_light_group_color(self):
+        strip = self.machine.light_stripes.bench_strip
+        colors = [RGBColor("red"), RGBColor("green"), RGBColor("blue"), RGBColor("white")]
+        count = 200
+
+        def _update():
+            for i in range(count):
+                strip.color(colors[i % len(colors)], fade_ms=0, key="bench")
+
+        self.measure_rate("lights.group_updates_per_sec", "group updates/s", _update, count)
@@ -0,0 +1,16 @@
+"""Benchmark mode start and stop."""
+from mpf.benchmarks.MpfBenchmarkTestCase import MpfBenchmarkTestCase
+
+
+class BenchmarkModes(MpfBenchmarkTestCase):
+
+    def _start_stop_mode(self):
+        self.post_event("start_bench_mode")
+        self.post_event("stop_bench_mode")
+
+    def test_mode_start_stop(self):
+        self._start_stop_mode()
+        self.assertModeNotRunning("bench_mode")
+
+        self.measure_duration("modes.start_stop_time", self._start_stop_mode, 50)
+        self.assertModeNotRunning("bench_mode")
@@ -0,0 +1,33 @@
+"""Benchmark running shows."""
+from mpf.benchmarks.MpfBenchmarkTestCase import MpfBenchmarkTestCase
+
+
+class BenchmarkShows(MpfBenchmarkTestCase):
+
+    def _run_shows(self, num_shows):
+        shows = []
+        for i in range(num_shows):
+            shows.append(self.machine.shows['bench_chase'].play(
+                priority=i, show_tokens=dict(lights="bench_strip_light_{}".format(100 + (i % 64)))))
+
+        # every step is 100ms long
+        seconds = 10
+        self.measure_rate("shows.steps_per_sec_with_{}_shows".format(num_shows), "steps/s",
+                          lambda: self.advance_time_and_run(seconds), num_shows * seconds * 10)
+
+        for show in shows:
+            show.stop()
+
+    def test_10_shows(self):
+        self._run_shows(10)
+
+    def test_64_shows(self):
+        self._run_shows(64)
+
+    def test_strip_show(self):
+        # one show which changes all 64 lights of the strip per step
+        show = self.machine.shows['bench_chase'].play(show_tokens=dict(lights="bench_strip"))
+        seconds = 10
+        self.measure_rate("shows.steps_per_sec_64_light_strip", "steps/s",
+                          lambda: self.advance_time_and_run(seconds), seconds * 10)
+        show.stop()
@@ -0,0 +1,46 @@
+"""Benchmark switch processing in the SwitchController."""
+import time
+
+from mpf.benchmarks.MpfBenchmarkTestCase import MpfBenchmarkTestCase
+
+
+class BenchmarkSwitches(MpfBenchmarkTestCase):
+
+    def _handler(self):
+        self._handler_time = time.perf_counter()
+
+    def test_switch_to_handler_latency(self):
+        switch = self.machine.switches.s_bench4
+        self.machine.switch_controller.add_switch_handler("s_bench4", self._handler)
+        self.machine.switch_controller.add_switch_handler("s_bench4", self._handler, state=0)
+
+        count = 10000
+        latency = 0
+        for _ in range(count):
+            for state in (1, 0):
+                self._handler_time = None
+                start = time.perf_counter()
+                self.machine.switch_controller.process_switch_obj(switch, state, True)
+                latency += self._handler_time - start
+            self.machine.events.process_event_queue()
+
+        self.add_result("switches.process_switch_obj_to_handler_latency", latency / (2 * count) * 1000000, "us",
+                        higher_is_better=False)
+
+    def _hit_switches(self, count):
+        switch_controller = self.machine.switch_controller
+        switch = self.machine.switches.s_bench1
+        for _ in range(count):
+            switch_controller.process_switch_obj(switch, 1, True)
+            switch_controller.process_switch_obj(switch, 0, True)
+            self.machine.events.process_event_queue()
+
+    def test_switch_changes_in_mode(self):
+        # s_bench1 triggers event_players and a shot in bench_mode
+        self.start_game()
+        self.post_event("start_bench_mode")
+        self.assertModeRunning("bench_mode")
+
+        count = 2000
+        self.measure_rate("switches.changes_per_sec_in_mode", "switch changes/s",
+                          lambda: self._hit_switches(count), 2 * count)
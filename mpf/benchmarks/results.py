@@ -0,0 +1,96 @@
+"""Collects, stores and compares benchmark results."""
+import json
+import platform
+import time
+from collections import namedtuple
+
+from typing import Dict, List
+
+from mpf._version import __version__
+
+BenchmarkResult = namedtuple("BenchmarkResult", ["name", "value", "unit", "higher_is_better"])
+BenchmarkComparison = namedtuple("BenchmarkComparison", ["name", "baseline", "current", "unit", "change",
+                                                         "regression"])
+
+
+class BenchmarkResults(object):
+
+    """A set of benchmark results which can be saved to and compared against a JSON file."""
+
+    def __init__(self) -> None:
+        """Initialise empty result set."""
+        self.results = {}           # type: Dict[str, BenchmarkResult]
+        self.info = {
+            "mpf_version": __version__,
+            "python_version": platform.python_version(),
+            "platform": platform.platform(aliased=True),
+            "machine": platform.machine(),
+            "timestamp": time.time()
+        }
+
+    def add(self, name: str, value: float, unit: str, higher_is_better: bool=True) -> None:
+        """Add (or replace) a result."""
+        self.results[name] = BenchmarkResult(name, value, unit, higher_is_better)
+
+    def to_dict(self) -> dict:
+        """Return results as dict which can be serialised to JSON."""
+        return {
+            "info": self.info,
+            "results": {result.name: {"value": result.value,
+                                      "unit": result.unit,
+                                      "higher_is_better": result.higher_is_better}
+                        for result in self.results.values()}
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BenchmarkResults":
+        """Create results from a dict which was created by ``to_dict``."""
+        results = cls()
+        results.info = data.get("info", {})
+        for name, result in data.get("results", {}).items():
+            results.add(name, result["value"], result["unit"], result.get("higher_is_better", True))
+
+        return results
+
+    def save(self, filename: str) -> None:
+        """Save results to a JSON file."""
+        with open(filename, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2, sort_keys=True)
+
+    @classmethod
+    def load(cls, filename: str) -> "BenchmarkResults":
+        """Load results from a JSON file."""
+        with open(filename) as f:
+            return cls.from_dict(json.load(f))
+
+    def compare(self, baseline: "BenchmarkResults", threshold: float=0.1) -> List[BenchmarkComparison]:
+        """Compare these results against a baseline.
+
+        Args:
+            baseline: Results of a previous run.
+            threshold: Relative change (0.1 = 10%) in the wrong direction which
+                counts as a regression.
+
+        Returns a list of comparisons for all benchmarks which exist in both
+        result sets. ``change`` is positive if the result got better.
+        """
+        comparisons = []
+        for name, result in sorted(self.results.items()):
+            if name not in baseline.results:
+                continue
+            old_value = baseline.results[name].value
+            if not old_value:
+                change = 0.0
+            elif result.higher_is_better:
+                change = (result.value - old_value) / old_value
+            else:
+                change = (old_value - result.value) / old_value
+
+            comparisons.append(BenchmarkComparison(name, old_value, result.value, result.unit, change,
+                                                   change < -threshold))
+
+        return comparisons
+
+
+collected_results = BenchmarkResults()
+'''Results of all benchmarks which ran in this process.'''
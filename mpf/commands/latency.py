@@ -0,0 +1,66 @@
+"""Command to show the switch latency report written by the latency tracer."""
+import argparse
+import os
+import sys
+
+from mpf.core.file_manager import FileManager
+from mpf.core.latency_tracer import LatencyHistogram, LatencyTracer
+
+
+class Command(object):
+
+    """Prints the switch latency report."""
+
+    def __init__(self, mpf_path, machine_path, args):
+        """Print latency report."""
+        del mpf_path
+
+        parser = argparse.ArgumentParser(description='Shows the switch latencies collected with latency_tracing')
+
+        parser.add_argument("-f",
+                            action="store", dest="file", default=os.path.join("data", "latency.yaml"),
+                            metavar='file_name',
+                            help="The latency file relative to the machine folder. Default is data/latency.yaml")
+
+        parser.add_argument("-s",
+                            action="store", dest="stage", default="switch", choices=LatencyTracer.stages,
+                            help="Sort switches by the p99 latency of this stage. Default is switch")
+
+        args = parser.parse_args(args)
+
+        if machine_path:
+            filename = os.path.join(machine_path, args.file)
+        else:
+            filename = args.file
+
+        if not os.path.isfile(filename):
+            print("Did not find {}. Enable latency_tracing in the mpf section of your config and run "
+                  "your machine first.".format(filename))
+            sys.exit(1)
+
+        data = FileManager.load(filename, halt_on_error=False)
+        print(self.format_report(data, args.stage))
+        sys.exit()
+
+    @staticmethod
+    def format_report(data: dict, sort_stage: str="switch") -> str:
+        """Return a table with the latencies per switch and stage."""
+        if not data:
+            return "No latencies recorded."
+
+        def _sort_key(switch_name):
+            stage = data[switch_name].get(sort_stage)
+            return -(stage["p99"] or 0) if stage else 0
+
+        lines = ["{:<30} {:<8} {:>8} {:>9} {:>9} {:>9} {:>9}".format(
+            "Switch", "Stage", "Count", "Avg ms", "P50 ms", "P99 ms", "Max ms")]
+        for switch_name in sorted(data, key=_sort_key):
+            for stage in LatencyTracer.stages:
+                if stage not in data[switch_name]:
+                    continue
+                histogram = LatencyHistogram.from_dict(data[switch_name][stage])
+                stats = histogram.to_dict()
+                lines.append("{:<30} {:<8} {:>8} {:>9.3f} {:>9.3f} {:>9.3f} {:>9.3f}".format(
+                    switch_name, stage, stats["count"], stats["avg"], stats["p50"], stats["p99"], stats["max"]))
+
+        return "\n".join(lines)
@@ -0,0 +1,53 @@
+"""Light effect config player."""
+from mpf.config_players.device_config_player import DeviceConfigPlayer
+from mpf.core.light_effects import LightEffect
+from mpf.core.utility_functions import Util
+
+
+class LightEffectPlayer(DeviceConfigPlayer):
+
+    """Plays procedural light effects (sweeps, gradients, waves, noise and chases) on lights."""
+
+    config_file_section = 'light_effect_player'
+    show_section = 'light_effects'
+
+    def play(self, settings, context, calling_context, priority=0, **kwargs):
+        """Start or stop light effects."""
+        del kwargs
+        instance_dict = self._get_instance_dict(context)
+        full_context = self._get_full_context(context)
+
+        for target, s in settings.items():
+            key = s['key'] if s['key'] else target
+            if key in instance_dict:
+                instance_dict[key].stop()
+                del instance_dict[key]
+
+            if s['action'] == "stop":
+                continue
+
+            effect = LightEffect(self.machine, self._get_lights(target), s, s['priority'] + priority,
+                                 full_context + "." + key)
+            effect.start()
+            instance_dict[key] = effect
+
+    def _get_lights(self, target):
+        """Return lights for a light name, a tag (e.g. the name of a light group) or a list of lights."""
+        if target in self.machine.lights:
+            return [self.machine.lights[target]]
+
+        light_list = Util.string_to_list(target)
+        if len(light_list) > 1:
+            return [self.machine.lights[light] for light in light_list]
+
+        return self.machine.lights.items_tagged(target)
+
+    def clear_context(self, context):
+        """Stop all effects from context."""
+        for effect in self._get_instance_dict(context).values():
+            effect.stop()
+        self._reset_instance_dict(context)
+
+    def get_express_config(self, value):
+        """Parse express config."""
+        return dict(effect=value)
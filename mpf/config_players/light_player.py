@@ -3,6 +3,7 @@ from copy import deepcopy
 from mpf.config_players.device_config_player import DeviceConfigPlayer
 from mpf.core.rgb_color import RGBColor
 from mpf.core.utility_functions import Util
+from mpf.devices.light import Light
 
 
 class LightPlayer(DeviceConfigPlayer):
@@ -31,12 +32,12 @@ class LightPlayer(DeviceConfigPlayer):
                 else:
                     light_list = Util.string_to_list(light)
                     if len(light_list) > 1:
-                        for light1 in light_list:
-                            self._light_named_color(light1, instance_dict, full_context, **s)
+                        self._lights_color([self.machine.lights[light1] for light1 in light_list],
+                                           instance_dict, full_context, **s)
                     else:
                         # TODO: this case fails silently if leds do not exist
-                        for light1 in self.machine.lights.items_tagged(light):
-                            self._light_color(light1, instance_dict, full_context, **s)
+                        self._lights_color(self.machine.lights.items_tagged(light), instance_dict, full_context,
+                                           **s)
             else:
                 self._light_color(light, instance_dict, full_context, **s)
 
@@ -45,20 +46,37 @@ class LightPlayer(DeviceConfigPlayer):
         self._light_color(light, instance_dict, full_context, color, **s)
 
     @staticmethod
-    def _light_color(light, instance_dict, full_context, color, **s):
+    def _parse_color(color):
+        # hack to keep compatibility for matrix_light values
+        if len(color) == 1:
+            color = "0" + color + "0" + color + "0" + color
+        elif len(color) == 2:
+            color = color + color + color
+
+        return RGBColor(color)
+
+    @classmethod
+    def _light_color(cls, light, instance_dict, full_context, color, **s):
         if color == "on":
             color = light.config['default_on_color']
         else:
-            # hack to keep compatibility for matrix_light values
-            if len(color) == 1:
-                color = "0" + color + "0" + color + "0" + color
-            elif len(color) == 2:
-                color = color + color + color
-
-            color = RGBColor(color)
+            color = cls._parse_color(color)
         light.color(color, key=full_context, **s)
         instance_dict[light.name] = light
 
+    @classmethod
+    def _lights_color(cls, lights, instance_dict, full_context, color, **s):
+        """Set the same color on multiple lights and sync their platforms only once."""
+        if color == "on":
+            # every light may have a different default_on_color
+            for light in lights:
+                cls._light_color(light, instance_dict, full_context, color, **s)
+            return
+
+        Light.color_lights(lights, cls._parse_color(color), key=full_context, **s)
+        for light in lights:
+            instance_dict[light.name] = light
+
     def clear_context(self, context):
         """Remove all colors which were set in context."""
         full_context = self._get_full_context(context)
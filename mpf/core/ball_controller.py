@@ -4,6 +4,7 @@ import asyncio
 from typing import Generator, Union, Iterable
 
 from mpf.devices.ball_device.ball_device import BallDevice
+from mpf.devices.ball_device.ball_routing import BallRoutingTable
 
 from mpf.core.delays import DelayManager
 from mpf.core.machine import MachineController
@@ -29,6 +30,9 @@ class BallController(MpfController):
 
         self.num_balls_known = 0
 
+        self.routing = BallRoutingTable(self.machine)
+        # paths between ball devices. built on first use and again at init_done
+
         # register for events
         self.machine.events.add_handler('request_to_start_game',
                                         self.request_to_start_game)
@@ -36,6 +40,8 @@ class BallController(MpfController):
                                         self._initialize)
         self.machine.events.add_handler('init_phase_4',
                                         self._init4, priority=100)
+        self.machine.events.add_handler('init_done',
+                                        self.routing.build)
 
         self.machine.events.add_handler('shutdown',
                                         self._stop)
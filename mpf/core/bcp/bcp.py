@@ -96,7 +96,8 @@ class Bcp(MpfController):
         servers_start_futures = []
         for settings in self.machine.config['bcp']['servers'].values():
             settings = self.machine.config_validator.validate_config("bcp:servers", settings)
-            server = BcpServer(self.machine, settings['ip'], settings['port'], settings['type'])
+            server = BcpServer(self.machine, settings['ip'], settings['port'], settings['type'],
+                               settings['socket_path'])
             server_future = Util.ensure_future(server.start(), loop=self.machine.clock.loop)
             server_future.add_done_callback(lambda x: self.servers.append(server))
             servers_start_futures.append(server_future)
@@ -6,6 +6,23 @@ import asyncio
 from mpf.core.mpf_controller import MpfController
 
 
+class BcpMessage(object):
+
+    """A BCP command which is sent to one or more clients.
+
+    The message is encoded by the first client which needs it. All other
+    clients write the same encoded buffer.
+    """
+
+    __slots__ = ["bcp_command", "kwargs", "encoded"]
+
+    def __init__(self, bcp_command, kwargs):
+        """Initialise message."""
+        self.bcp_command = bcp_command
+        self.kwargs = kwargs
+        self.encoded = None     # type: bytes
+
+
 class BaseBcpClient(MpfController, metaclass=abc.ABCMeta):
 
     """Base class for bcp clients."""
@@ -35,6 +52,13 @@ class BaseBcpClient(MpfController, metaclass=abc.ABCMeta):
         """Send data to client."""
         raise NotImplementedError("implement")
 
+    def send_message(self, message: BcpMessage):
+        """Send a message which may be shared with other clients.
+
+        Clients which can reuse the encoded message should override this.
+        """
+        self.send(message.bcp_command, message.kwargs)
+
     def stop(self):
         """Stop client connection."""
         raise NotImplementedError("implement")
@@ -1,5 +1,5 @@
 """RPC Interface for BCP clients."""
-from copy import deepcopy
+from typing import TYPE_CHECKING
 
 from mpf.core.events import PostedEvent
 from mpf.core.player import Player
@@ -7,6 +7,9 @@ from mpf.core.utility_functions import Util
 from mpf.core.mpf_controller import MpfController
 from mpf.core.switch_controller import MonitoredSwitchChange
 
+if TYPE_CHECKING:   # pragma: no cover
+    from mpf.core.input_journal import InputJournal
+
 
 class BcpInterface(MpfController):
 
@@ -35,6 +38,9 @@ class BcpInterface(MpfController):
         """Initialise BCP."""
         super().__init__(machine)
 
+        self.input_journal = None   # type: InputJournal
+        # set by the input journal while it is recording
+
         if 'bcp' not in machine.config or not machine.config['bcp']:
             self.configured = False
             return
@@ -168,8 +174,13 @@ class BcpInterface(MpfController):
 
     def monitor_posted_event(self, posted_event: PostedEvent):
         """Send monitored posted event to bcp clients."""
-        self.machine.bcp.transport.send_to_clients_with_handler(
-            handler="_monitor_events",
+        clients = self.machine.bcp.transport.get_transports_for_handler("_monitor_events")
+        if not clients:
+            # do not simplify the payload when nobody is listening
+            return
+
+        self.machine.bcp.transport.send_to_clients(
+            clients,
             bcp_command="monitored_event",
             event_name=posted_event.event,
             event_type=posted_event.type,
@@ -181,6 +192,7 @@ class BcpInterface(MpfController):
 
     def _monitor_devices(self, client):
         """Register client to get notified of device changes."""
+        self.machine.device_manager.add_monitor(self.notify_device_changes)
         self.machine.bcp.transport.add_handler_to_transport("_devices", client)
         # trigger updates of lights
         self.machine.light_controller.monitor_lights()
@@ -200,13 +212,21 @@ class BcpInterface(MpfController):
         """Remove client to no longer get notified of device changes."""
         self.machine.bcp.transport.remove_transport_from_handle("_devices", client)
 
+        # If there are no more clients monitoring devices, remove monitor
+        if not self.machine.bcp.transport.get_transports_for_handler("_devices"):
+            self.machine.device_manager.remove_monitor(self.notify_device_changes)
+
     def notify_device_changes(self, device, attribute_name, old_value, new_value):
         """Notify all listeners about device change."""
         if not self.configured:
             return
 
-        self.machine.bcp.transport.send_to_clients_with_handler(
-            handler="_devices",
+        clients = self.machine.bcp.transport.get_transports_for_handler("_devices")
+        if not clients:
+            return
+
+        self.machine.bcp.transport.send_to_clients(
+            clients,
             bcp_command='device',
             type=device.class_label,
             name=device.name,
@@ -271,10 +291,10 @@ class BcpInterface(MpfController):
     def _send_machine_vars(self, client):
         self.machine.bcp.transport.send_to_client(
             client, bcp_command='settings', settings=Util.convert_to_simply_type(self.machine.settings.get_settings()))
-        for var_name, settings in self.machine.machine_vars.items():
+        for var_name, var in self.machine.machine_vars.items():
             self.machine.bcp.transport.send_to_client(client, bcp_command='machine_variable',
                                                       name=var_name,
-                                                      value=settings['value'])
+                                                      value=var.value)
 
     # pylint: disable-msg=too-many-arguments
     def _player_var_change(self, name, value, prev_value, change, player_num):
@@ -397,7 +417,8 @@ class BcpInterface(MpfController):
         """
         if self._debug_to_console or self._debug_to_file:
             if 'rawbytes' in kwargs:
-                debug_kwargs = deepcopy(kwargs)
+                # do not copy the raw bytes just to log their length
+                debug_kwargs = dict(kwargs)
                 debug_kwargs['rawbytes'] = '<{} bytes>'.format(
                     len(debug_kwargs.pop('rawbytes')))
 
@@ -411,6 +432,8 @@ class BcpInterface(MpfController):
             except TypeError as e:
                 self.machine.bcp.transport.send_to_client(client, "error", cmd=cmd, error=str(e), kwargs=kwargs)
             else:
+                if self.input_journal:
+                    self.input_journal.record_bcp(cmd, kwargs, client)
                 callback(client=client, **kwargs)
 
         else:
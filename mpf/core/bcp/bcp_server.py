@@ -1,4 +1,8 @@
 """Bcp server for clients which connect and disconnect randomly."""
+import os
+import socket
+import stat
+
 import asyncio
 
 from mpf.core.utility_functions import Util
@@ -7,15 +11,21 @@ from mpf.core.mpf_controller import MpfController
 
 class BcpServer(MpfController):
 
-    """Server socket which listens for incoming BCP clients."""
+    """Server socket which listens for incoming BCP clients.
+
+    If socket_path is set the server additionally listens on a Unix domain
+    socket at that path. Clients on the same host can use it instead of TCP.
+    """
 
-    def __init__(self, machine, ip, port, server_type):
+    def __init__(self, machine, ip, port, server_type, socket_path=None):
         """Initialise BCP server."""
         super().__init__(machine)
         self._server = None
+        self._unix_server = None
         self._ip = ip
         self._port = port
         self._type = server_type
+        self._socket_path = socket_path
 
     @asyncio.coroutine
     def start(self):
@@ -23,6 +33,39 @@ class BcpServer(MpfController):
         self._server = yield from self.machine.clock.start_server(
             self._accept_client, self._ip, self._port, loop=self.machine.clock.loop)
 
+        if self._socket_path and hasattr(socket, "AF_UNIX"):
+            self._remove_stale_socket()
+            self._unix_server = yield from self.machine.clock.start_unix_server(
+                self._accept_client, self._socket_path, loop=self.machine.clock.loop)
+            self.info_log("Listening for BCP clients on %s", self._socket_path)
+
+    def _remove_stale_socket(self):
+        """Remove a socket which is left over from a previous run.
+
+        The socket is only removed if nobody listens on it anymore.
+        """
+        try:
+            if not stat.S_ISSOCK(os.stat(self._socket_path).st_mode):
+                return
+        except FileNotFoundError:
+            return
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        probe.settimeout(1)
+        try:
+            probe.connect(self._socket_path)
+        except ConnectionRefusedError:
+            os.unlink(self._socket_path)
+            return
+        except FileNotFoundError:
+            return
+        except socket.timeout:
+            pass
+        finally:
+            probe.close()
+
+        raise AssertionError("Another process is listening on BCP socket {}".format(self._socket_path))
+
     def stop(self):
         """Stop the BCP server, i.e. closes the listening socket(s)."""
         if self._server:
@@ -30,6 +73,15 @@ class BcpServer(MpfController):
 
         self._server = None
 
+        if self._unix_server:
+            self._unix_server.close()
+            try:
+                os.unlink(self._socket_path)
+            except FileNotFoundError:
+                pass
+
+        self._unix_server = None
+
     @asyncio.coroutine
     def _accept_client(self, client_reader, client_writer):
         """Accept an connection and create client."""
@@ -1,11 +1,16 @@
 """BCP socket client."""
 import json
+import socket
 from urllib.parse import urlsplit, parse_qs, quote, unquote, urlunparse
 
 import asyncio
 
 from mpf._version import __version__, __bcp_version__
-from mpf.core.bcp.bcp_client import BaseBcpClient
+from mpf.core.bcp.bcp_client import BaseBcpClient, BcpMessage
+
+
+# hosts which are reachable through a Unix domain socket if one is configured
+LOCAL_HOSTS = (None, "", "localhost", "127.0.0.1", "::1")
 
 
 class MpfJSONEncoder(json.JSONEncoder):
@@ -156,15 +161,35 @@ class BCPClientSocket(BaseBcpClient):
             'bcp:connections', config, 'bcp:connections')
 
         # return a future
-        return self._setup_client_socket(config['host'], config['port'], config.get('required'))
+        return self._setup_client_socket(config['host'], config['port'], config.get('required'),
+                                         config.get('socket_path'))
 
     @asyncio.coroutine
-    def _setup_client_socket(self, client_host, client_port, required=True):
-        """Set up the client socket."""
-        self.info_log("Connecting BCP to '%s' at %s:%s...",
-                      self.name, client_host, client_port)
+    def _setup_client_socket(self, client_host, client_port, required=True, socket_path=None):
+        """Set up the client socket.
+
+        If socket_path is set and the server runs on this host the client
+        connects to the Unix domain socket at socket_path. It falls back to
+        TCP if that socket does not accept connections.
+        """
+        use_unix_socket = bool(socket_path) and client_host in LOCAL_HOSTS and hasattr(socket, "AF_UNIX")
+        if use_unix_socket:
+            self.info_log("Connecting BCP to '%s' at %s or %s:%s...",
+                          self.name, socket_path, client_host, client_port)
+        else:
+            self.info_log("Connecting BCP to '%s' at %s:%s...",
+                          self.name, client_host, client_port)
 
         while True:
+            if use_unix_socket:
+                try:
+                    self._receiver, self._sender = yield from self.machine.clock.open_unix_connection(socket_path)
+                except OSError:
+                    pass
+                else:
+                    self.info_log("Connected BCP to '%s' %s", self.name, socket_path)
+                    break
+
             connector = self.machine.clock.open_connection(client_host, client_port)
             try:
                 self._receiver, self._sender = yield from connector
@@ -177,10 +202,9 @@ class BCPClientSocket(BaseBcpClient):
                                   self.name, client_host, client_port)
                     return False
 
+            self.info_log("Connected BCP to '%s' %s:%s", self.name, client_host, client_port)
             break
 
-        self.info_log("Connected BCP to '%s' %s:%s", self.name, client_host, client_port)
-
         self.send_hello()
         return True
 
@@ -207,16 +231,27 @@ class BCPClientSocket(BaseBcpClient):
             bcp_command: command to send
             bcp_command_args: parameters to command
         """
-        try:
-            bcp_string = encode_command_string(bcp_command, **bcp_command_args)
-        # pylint: disable-msg=broad-except
-        except Exception as e:
-            self.warning_log("Failed to encode bcp_command %s with args %s. %s", bcp_command, bcp_command_args, e)
-            return
+        self.send_message(BcpMessage(bcp_command, bcp_command_args))
 
-        if self.debug_log:
-            self.debug_log('Sending "%s"', bcp_string)
-        self._sender.write((bcp_string + '\n').encode())
+    def send_message(self, message: BcpMessage):
+        """Send a message to the BCP host.
+
+        The message is only encoded once if it is sent to multiple clients.
+        """
+        if message.encoded is None:
+            try:
+                bcp_string = encode_command_string(message.bcp_command, **message.kwargs)
+            # pylint: disable-msg=broad-except
+            except Exception as e:
+                self.warning_log("Failed to encode bcp_command %s with args %s. %s", message.bcp_command,
+                                 message.kwargs, e)
+                return
+
+            message.encoded = (bcp_string + '\n').encode()
+
+        if self._debug_to_console or self._debug_to_file:
+            self.debug_log('Sending "%s"', message.encoded[:-1].decode())
+        self._sender.write(message.encoded)
 
     @asyncio.coroutine
     def read_message(self):
@@ -231,9 +266,10 @@ class BCPClientSocket(BaseBcpClient):
             # strip newline
             message = message[0:-1]
 
-            if b'&bytes=' in message:
-                message, bytes_needed = message.split(b'&bytes=')
-                bytes_needed = int(bytes_needed)
+            bytes_index = message.find(b'&bytes=')
+            if bytes_index >= 0:
+                bytes_needed = int(message[bytes_index + 7:])
+                message = message[:bytes_index]
 
                 rawbytes = yield from self._receiver.readexactly(bytes_needed)
 
@@ -3,7 +3,7 @@ import asyncio
 
 from typing import Union
 
-from mpf.core.bcp.bcp_client import BaseBcpClient
+from mpf.core.bcp.bcp_client import BaseBcpClient, BcpMessage
 
 
 class BcpTransportManager:
@@ -96,9 +96,15 @@ class BcpTransportManager:
         return False
 
     def send_to_clients(self, clients, bcp_command, **kwargs):
-        """Send command to a list of clients."""
+        """Send command to a list of clients.
+
+        The command is encoded only once for all clients.
+        """
+        if not clients:
+            return
+        message = BcpMessage(bcp_command, kwargs)
         for client in set(clients):
-            self.send_to_client(client, bcp_command, **kwargs)
+            self._send_message(client, message)
 
     def send_to_clients_with_handler(self, handler, bcp_command, **kwargs):
         """Send command to clients which registered for a specific handler."""
@@ -107,16 +113,19 @@ class BcpTransportManager:
 
     def send_to_client(self, client: BaseBcpClient, bcp_command, **kwargs):
         """Send command to a specific bcp client."""
+        self._send_message(client, BcpMessage(bcp_command, kwargs))
+
+    def _send_message(self, client: BaseBcpClient, message: BcpMessage):
+        """Send a (possibly shared) message to a client and drop the client on errors."""
         try:
-            client.send(bcp_command, kwargs)
+            client.send_message(message)
         except IOError:
             client.stop()
             self.unregister_transport(client)
 
     def send_to_all_clients(self, bcp_command, **kwargs):
         """Send command to all bcp clients."""
-        for client in self._transports:
-            self.send_to_client(client, bcp_command, **kwargs)
+        self.send_to_clients(self._transports, bcp_command, **kwargs)
 
     def shutdown(self, **kwargs):
         """Prepare the BCP clients for MPF shutdown."""
@@ -1,8 +1,10 @@
 """MPF clock and main loop."""
 import asyncio
+import math
 from functools import partial
+from operator import attrgetter
 
-from typing import Tuple, Generator
+from typing import Callable, Dict, List, Tuple, Generator
 
 from serial_asyncio import create_serial_connection
 
@@ -43,6 +45,120 @@ class PeriodicTask:
         self._canceled = True
 
 
+class TimerWheelEntry(object):
+
+    """A callback scheduled in a TimerWheel."""
+
+    __slots__ = ["due", "callback", "key", "cancelled", "_wheel"]
+
+    def __init__(self, wheel: "TimerWheel", due: float, callback: Callable[[], None], key: int) -> None:
+        """Initialise entry."""
+        self._wheel = wheel
+        self.due = due
+        self.callback = callback
+        self.key = key
+        self.cancelled = False
+
+    def cancel(self):
+        """Cancel the callback."""
+        if not self.cancelled:
+            self.cancelled = True
+            self._wheel.cancel(self)
+
+
+class TimerWheelBucket(object):
+
+    """All entries which are due in one tick and the loop handle which runs them."""
+
+    __slots__ = ["entries", "handle"]
+
+    def __init__(self) -> None:
+        """Initialise bucket."""
+        self.entries = dict()   # type: Dict[TimerWheelEntry, None]
+        self.handle = None      # type: asyncio.Handle
+
+
+class TimerWheel(object):
+
+    """Hashed timing wheel which runs all callbacks due in the same tick in one loop callback.
+
+    Buckets are hashed by tick number. Only one loop handle per non-empty
+    bucket is scheduled so adding and cancelling callbacks is O(1) and the
+    loop sorts buckets instead of single callbacks. Callbacks run at the start
+    of the first tick at or after their due time (i.e. up to one tick late)
+    and in order of their due time within a tick.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, tick: float=0.001) -> None:
+        """Initialise timer wheel."""
+        self.loop = loop
+        self.tick = tick
+        self._buckets = dict()      # type: Dict[int, TimerWheelBucket]
+        self.scheduled = 0
+        """Number of callbacks which have been scheduled."""
+        self.wakeups = 0
+        """Number of loop callbacks used to run them."""
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> TimerWheelEntry:
+        """Call callback in delay seconds."""
+        due = self.loop.time() + delay
+        # subtract a little to not round up times which are a tick because of float precision
+        key = math.ceil(due / self.tick - 1e-6)
+        entry = TimerWheelEntry(self, due, callback, key)
+        self.scheduled += 1
+
+        try:
+            bucket = self._buckets[key]
+        except KeyError:
+            bucket = self._buckets[key] = TimerWheelBucket()
+            bucket.handle = self.loop.call_at(key * self.tick, self._run_bucket, key)
+
+        bucket.entries[entry] = None
+        return entry
+
+    def cancel(self, entry: TimerWheelEntry):
+        """Remove an entry. Use TimerWheelEntry.cancel instead."""
+        bucket = self._buckets.get(entry.key)
+        if not bucket or entry not in bucket.entries:
+            # already running
+            return
+
+        del bucket.entries[entry]
+        if not bucket.entries:
+            bucket.handle.cancel()
+            del self._buckets[entry.key]
+
+    def __len__(self):
+        """Return the number of pending callbacks."""
+        return sum(len(bucket.entries) for bucket in self._buckets.values())
+
+    def _run_bucket(self, key: int):
+        bucket = self._buckets.pop(key)
+        self.wakeups += 1
+        entries = sorted(bucket.entries, key=attrgetter("due"))
+        for index, entry in enumerate(entries):
+            if entry.cancelled:
+                continue
+            entry.cancelled = True
+            try:
+                entry.callback()
+            except Exception:
+                # run the remaining callbacks in the next iteration as separate loop callbacks would
+                self._requeue(key, entries[index + 1:])
+                raise
+
+    def _requeue(self, key: int, entries: List[TimerWheelEntry]):
+        entries = [entry for entry in entries if not entry.cancelled]
+        if not entries:
+            return
+        bucket = self._buckets.get(key)
+        if not bucket:
+            bucket = self._buckets[key] = TimerWheelBucket()
+            bucket.handle = self.loop.call_soon(self._run_bucket, key)
+        for entry in entries:
+            bucket.entries[entry] = None
+
+
 class ClockBase(LogMixin):
 
     """A clock object with event support."""
@@ -63,9 +179,18 @@ class ClockBase(LogMixin):
 
         self.debug_log("Starting tickless clock")
         self.loop = self._create_event_loop()
+        self.timer_wheel = TimerWheel(self.loop)
 
-    # pylint: disable-msg=no-self-use
     def _create_event_loop(self):
+        if self.machine and self.machine.config.get('loop_monitor', {}).get('use_uvloop'):
+            try:
+                import uvloop
+            except ImportError:
+                self.warning_log("use_uvloop is set but uvloop is not installed. Using the default loop.")
+            else:
+                self.info_log("Using uvloop")
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
         return asyncio.get_event_loop()
 
     def run(self):
@@ -79,7 +204,12 @@ class ClockBase(LogMixin):
     @asyncio.coroutine
     def start_server(self, client_connected_cb, host=None, port=None, **kwd):
         """Start a server."""
-        yield from asyncio.streams.start_server(client_connected_cb, host, port, **kwd)
+        return (yield from asyncio.streams.start_server(client_connected_cb, host, port, **kwd))
+
+    @asyncio.coroutine
+    def start_unix_server(self, client_connected_cb, path=None, **kwd):
+        """Start a server on a Unix domain socket."""
+        return (yield from asyncio.streams.start_unix_server(client_connected_cb, path, **kwd))
 
     def open_connection(self, host=None, port=None, *,
                         limit=None, **kwds):
@@ -105,6 +235,17 @@ class ClockBase(LogMixin):
             limit = asyncio.streams._DEFAULT_LIMIT
         return asyncio.open_connection(host=host, port=port, loop=self.loop, limit=limit, **kwds)
 
+    def open_unix_connection(self, path=None, *, limit=None, **kwds):
+        """A wrapper for create_unix_connection() returning a (reader, writer) pair.
+
+        Works like open_connection but connects to the Unix domain socket at
+        path.
+        """
+        if not limit:
+            # pylint: disable-msg=protected-access
+            limit = asyncio.streams._DEFAULT_LIMIT
+        return asyncio.open_unix_connection(path=path, loop=self.loop, limit=limit, **kwds)
+
     @asyncio.coroutine
     def open_serial_connection(self, limit=None, **kwargs) ->\
             Generator[int, None, Tuple[asyncio.StreamReader, asyncio.StreamWriter]]:
@@ -185,7 +326,7 @@ class ClockBase(LogMixin):
         Args:
             event: Event to cancel
         """
-        if isinstance(event, (asyncio.Handle, PeriodicTask)):
+        if isinstance(event, (asyncio.Handle, PeriodicTask, TimerWheelEntry)):
             event.cancel()
         else:
             raise AssertionError("Broken unschedule")
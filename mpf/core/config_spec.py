@@ -9,7 +9,10 @@ accelerometers:
     __valid_in__: machine
     platform: single|str|None
     hit_limits: single|float:str|None
+    hit_debounce: single|ms|0
     level_limits: single|float:str|None
+    level_hysteresis: single|float|None
+    filter_alpha: single|float|0.95
     level_x: single|int|0
     level_y: single|int|0
     level_z: single|int|1
@@ -88,6 +91,7 @@ auditor:
     events: list|str|None
     player: list|str|None
     num_player_top_records: single|int|1
+    publish_interval: single|ms|1s
 autofire_coils:
     __valid_in__: machine
     coil: single|machine(coils)|
@@ -187,10 +191,12 @@ bcp:
         type: single|str|
         required: single|bool|True
         exit_on_close: single|bool|True
+        socket_path: single|str|None
     servers:
         ip: single|str|None
         port: single|int|5050
         type: single|str|
+        socket_path: single|str|None
 bitmap_fonts:
     __valid_in__: machine, mode
     file: single|str|None
@@ -556,6 +562,12 @@ images:
     __valid_in__: machine, mode
     file: single|str|None
     load: single|str|None
+input_journal:
+    __valid_in__: machine
+    enabled: single|bool|false
+    file: single|str|data/input_journal.bin
+    flush_interval: single|ms|1s
+    replay: single|str|None
 keyboard:
     __valid_in__: machine                           # todo add to validator
 kickbacks:
@@ -621,6 +633,21 @@ light_channels:
     subtype: single|str|None
     platform: single|str|None
     platform_settings: single|dict|None
+light_effect_player:
+    __valid_in__: machine, mode, show
+    action: single|enum(play,stop)|play
+    effect: single|enum(sweep,gradient,radial,noise,chase)|sweep
+    color: single|str|white
+    background: single|str|off
+    speed: single|float|1.0
+    width: single|float|0.25
+    direction: single|float|None
+    center_x: single|float|None
+    center_y: single|float|None
+    spacing: single|int|3
+    fps: single|int|30
+    key: single|str|None
+    __allow_others__:
 light_player:
     __valid_in__: machine, mode, show
     color: single|str|white
@@ -631,6 +658,8 @@ lisy:
     port: single|str|None
     baud: single|int|None
     poll_hz: single|int|1000
+    idle_poll_hz: single|int|100
+    idle_poll_after: single|secs|5s
     console_log: single|enum(none,basic,full)|none
     file_log: single|enum(none,basic,full)|basic
     connection: single|enum(network,serial)|network
@@ -665,6 +694,14 @@ sequences:
 logging:
     __valid_in__: machine
     __allow_others__: true
+loop_monitor:
+    __valid_in__: machine
+    enabled: single|bool|false
+    sample_interval: single|ms|100ms
+    slow_callback_threshold: single|ms|50ms
+    max_slow_callbacks: single|int|20
+    publish_interval: single|ms|5s
+    use_uvloop: single|bool|false
 machine:
     __valid_in__: machine
     balls_installed: single|int|1
@@ -729,6 +766,7 @@ mpf:
     save_machine_vars_to_disk: single|bool|true
     default_show_sync_ms: single|int|0
     default_platform_hz: single|float|1000
+    latency_tracing: single|bool|false
 mpf-mc:
     __valid_in__: machine                           # todo add to validator
 multiballs:
@@ -1128,6 +1166,8 @@ spike:
     baud: single|int|
     nodes: list|int|
     poll_hz: single|int|1000
+    idle_poll_hz: single|int|100
+    idle_poll_after: single|secs|5s
     use_send_key: single|bool|False
     connection: single|enum(shell)|shell
     console_log: single|enum(none,basic,full)|none
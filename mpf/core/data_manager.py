@@ -128,23 +128,41 @@ class DataManager(MpfController):
             delay_secs: Optional number of seconds to wait before writing the
                 data to disk. Default is 0.
         """
+        self.save_keys({key: value}, delay_secs=delay_secs)
+
+    def save_keys(self, values, delay_secs=0):
+        """Update several keys and then write the entire dictionary to disk once.
+
+        Args:
+            values: Dict with the keys to add/update and their values.
+            delay_secs: Optional number of seconds to wait before writing the
+                data to disk. Default is 0.
+        """
         try:
-            self.data[key] = value
-        except TypeError:
-            self.debug_log.warning('In-memory copy of %s is invalid. Re-creating', self.filename)
+            self.data.update(values)
+        except (TypeError, AttributeError):
+            self.warning_log('In-memory copy of %s is invalid. Re-creating', self.filename)
             # todo should we reload from disk here?
-            self.data = dict()
-            self.data[key] = value
+            self.data = dict(values)
 
         self.save_all(delay_secs=delay_secs)
 
     def remove_key(self, key):
         """Remove key by name."""
-        try:
-            del self.data[key]
+        self.remove_keys([key])
+
+    def remove_keys(self, keys):
+        """Remove several keys by name and write the dictionary to disk once."""
+        removed = False
+        for key in keys:
+            try:
+                del self.data[key]
+                removed = True
+            except KeyError:
+                pass
+
+        if removed:
             self.save_all()
-        except KeyError:
-            pass
 
     def _writing_thread(self):  # pragma: no cover
         while not self.machine.thread_stopper.is_set():
@@ -1,7 +1,7 @@
 """Contains the DelayManager and DelayManagerRegistry base classes."""
 
-import uuid
 from functools import partial
+from itertools import count
 
 from typing import Any, Callable, Dict, Set, TYPE_CHECKING
 
@@ -44,8 +44,12 @@ class DelayManager(MpfController):
     mode code via ``self.delay``. (Delays in mode-based delay managers
     are automatically removed when the mode stops.)
 
+    Delays are scheduled in the timer wheel of the clock. All delays which
+    end in the same millisecond are run by one loop callback.
     """
 
+    _names = count()
+
     def __init__(self, registry: DelayManagerRegistry) -> None:
         """Initialise delay manager."""
         self.delays = {}        # type: Dict[str, Any]
@@ -62,27 +66,25 @@ class DelayManager(MpfController):
             callback: The method that is called when this delay ends.
             name: String name of this delay. This name is arbitrary and only
                 used to identify the delay later if you want to remove or
-                change it. If you don't provide it, a UUID4 name will be
+                change it. If you don't provide it, a unique name will be
                 created.
             **kwargs: Any other (optional) kwarg pairs you pass will be
                 passed along as kwargs to the callback method.
 
         Returns:
-            String name or UUID4 of the delay which you can use to remove it
-            later.
+            String name of the delay which you can use to remove it later.
         """
         if not name:
-            name = str(uuid.uuid4())
+            name = "_delay_{}".format(next(self._names))
         self.debug_log("Adding delay. Name: '%s' ms: %s, callback: %s, "
                        "kwargs: %s", name, ms, callback, kwargs)
 
         if name in self.delays:
-            self.machine.clock.unschedule(self.delays[name])
+            self.delays[name].cancel()
             del self.delays[name]
 
-        self.delays[name] = self.machine.clock.schedule_once(
-            partial(self._process_delay_callback, name, callback, **kwargs),
-            ms / 1000.0)
+        self.delays[name] = self.machine.clock.timer_wheel.schedule(
+            ms / 1000.0, partial(self._process_delay_callback, name, callback, **kwargs))
 
         return name
 
@@ -98,7 +100,7 @@ class DelayManager(MpfController):
         """
         self.debug_log("Removing delay: '%s'", name)
         if name in self.delays:
-            self.machine.clock.unschedule(self.delays[name])
+            self.delays[name].cancel()
             try:
                 del self.delays[name]
             except KeyError:
@@ -151,14 +153,13 @@ class DelayManager(MpfController):
             callback: The method that is called when this delay ends.
             name: String name of this delay. This name is arbitrary and only
                 used to identify the delay later if you want to remove or
-                change it. If you don't provide it, a UUID4 name will be
+                change it. If you don't provide it, a unique name will be
                 created.
             **kwargs: Any other (optional) kwarg pairs you pass will be
                 passed along as kwargs to the callback method.
 
         Returns:
-            String name or UUID4 of the delay which you can use to remove it
-            later.
+            String name of the delay which you can use to remove it later.
         """
         if name in self.delays:
             self.remove(name)
@@ -167,9 +168,8 @@ class DelayManager(MpfController):
 
     def clear(self) -> None:
         """Remove (clear) all the delays associated with this DelayManager."""
-        for name in list(self.delays.keys()):
-            self.machine.clock.unschedule(self.delays[name])
-            self.remove(name)
+        for delay in self.delays.values():
+            delay.cancel()
 
         self.delays = {}
 
@@ -187,8 +187,7 @@ class DelayManager(MpfController):
                 # have to save the callback ref first, since if the callback
                 # schedules a new delay with the same name, then the removal
                 # will remove it
-                # pylint: disable-msg=protected-access
-                cb = self.delays[name]._callback
+                cb = self.delays[name].callback
                 self.remove(name)
                 cb()
             except KeyError:
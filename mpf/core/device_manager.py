@@ -2,6 +2,7 @@
 from collections import OrderedDict
 from typing import Sized, Iterable, Container, Generic, TypeVar, TYPE_CHECKING
 
+from mpf.core.device_monitor import DeviceMonitor
 from mpf.core.utility_functions import Util
 from mpf.core.case_insensitive_dict import CaseInsensitiveDict
 from mpf.core.mpf_controller import MpfController
@@ -19,6 +20,7 @@ class DeviceManager(MpfController):
         super().__init__(machine)
 
         self._monitorable_devices = {}
+        self._monitors = []
 
         self.collections = OrderedDict()
         self.device_classes = OrderedDict()  # collection_name: device_class
@@ -53,24 +55,77 @@ class DeviceManager(MpfController):
             self._monitorable_devices[device.collection] = {}
         self._monitorable_devices[device.collection][device.name] = device
 
+    def add_monitor(self, monitor):
+        """Add a monitor which is called on every change of a monitorable device.
+
+        Changes are only tracked while there is at least one monitor.
+
+        Args:
+            monitor: Callback which is called with device, attribute_name,
+                old_value and new_value.
+        """
+        if monitor in self._monitors:
+            return
+        if not self._monitors:
+            DeviceMonitor.enable_monitoring()
+        self._monitors.append(monitor)
+
+    def remove_monitor(self, monitor):
+        """Remove a device monitor."""
+        if monitor not in self._monitors:
+            return
+        self._monitors.remove(monitor)
+        if not self._monitors:
+            DeviceMonitor.disable_monitoring()
+
     def notify_device_changes(self, device, notify, old, value):
         """Notify subscribers about changes in a registered device.
 
         Args:
             device: The device that changed.
-            notify:
+            notify: The name of the attribute which changed.
             old: The old value.
             value: The new value.
 
         """
-        self.machine.bcp.interface.notify_device_changes(device, notify, old, value)
+        for monitor in self._monitors:
+            monitor(device, notify, old, value)
 
-    def _load_device_config_spec(self, **kwargs):
-        del kwargs
+    def _get_device_types(self):
+        """Return all device modules which have to be imported.
+
+        Modules with a known collection in device_collections are skipped if
+        neither the machine config nor any mode config uses their section.
+        """
+        known_collections = {device_type: (collection_name, config_section) for
+                             config_section, (collection_name, device_type) in
+                             self.machine.config['mpf'].get('device_collections', {}).items()}
         for device_type in self.machine.config['mpf']['device_modules']:
-            device_cls = Util.string_to_class(device_type)      # type: Device
+            if device_type in known_collections:
+                collection_name, config_section = known_collections[device_type]
+                if not self._is_section_used(config_section):
+                    yield device_type, None, collection_name, config_section
+                    continue
+
+            device_cls = self.machine.import_class(device_type)      # type: Device
+            collection_name, config_section = device_cls.get_config_info()
+            yield device_type, device_cls, collection_name, config_section
+
+    def _is_section_used(self, config_section):
+        """Return true if the machine config or any mode config contains config_section."""
+        if self.machine.config.get(config_section):
+            return True
 
-            if device_cls.get_config_spec():
+        for mode in self.machine.modes:
+            if mode.config.get(config_section):
+                return True
+
+        return False
+
+    def _load_device_config_spec(self, **kwargs):
+        del kwargs
+        for _, device_cls, _, _ in self._get_device_types():
+            if device_cls and device_cls.get_config_spec():
                 # add specific config spec if device has any
                 self.machine.config_validator.load_device_config_spec(
                     device_cls.config_section, device_cls.get_config_spec())
@@ -79,22 +134,21 @@ class DeviceManager(MpfController):
         del kwargs
         # step 1: create devices in machine collection
         self.debug_log("Creating devices...")
-        for device_type in self.machine.config['mpf']['device_modules']:
-            device_cls = Util.string_to_class(device_type)      # type: Device
-
-            collection_name, config = device_cls.get_config_info()
-
-            self.device_classes[collection_name] = device_cls
-
+        for device_type, device_cls, collection_name, config_section in self._get_device_types():
             # create the collection
-            collection = DeviceCollection(self.machine, collection_name,
-                                          device_cls.config_section)
+            collection = DeviceCollection(self.machine, collection_name, config_section)
 
             self.collections[collection_name] = collection
             setattr(self.machine, collection_name, collection)
 
+            if not device_cls:
+                self.debug_log("Not importing %s because %s is not used", device_type, config_section)
+                continue
+
+            self.device_classes[collection_name] = device_cls
+
             # Get the config section for these devices
-            config = self.machine.config.get(config, None)
+            config = self.machine.config.get(config_section, None)
 
             # create the devices
             if config:
@@ -117,9 +171,10 @@ class DeviceManager(MpfController):
 
     def stop_devices(self):
         """Stop all devices in the machine."""
-        for device_type in self.machine.config['mpf']['device_modules']:
-            device_cls = Util.string_to_class(device_type)
-            collection_name, config = device_cls.get_config_info()
+        for monitor in list(self._monitors):
+            self.remove_monitor(monitor)
+
+        for collection_name in self.device_classes:
             for device in getattr(self.machine, collection_name):
                 if hasattr(device, "stop_device"):
                     device.stop_device()
@@ -151,11 +206,9 @@ class DeviceManager(MpfController):
     def load_devices_config(self, validate=True):
         """Load all devices."""
         if validate:
-            for device_type in self.machine.config['mpf']['device_modules']:
-
-                device_cls = Util.string_to_class(device_type)
+            for collection_name, device_cls in self.device_classes.items():
 
-                collection_name, config_name = device_cls.get_config_info()
+                config_name = device_cls.config_section
 
                 if config_name not in self.machine.config:
                     continue
@@ -169,11 +222,9 @@ class DeviceManager(MpfController):
                     config[device_name] = collection[device_name].prepare_config(config[device_name], False)
                     config[device_name] = collection[device_name].validate_and_parse_config(config[device_name], False)
 
-        for device_type in self.machine.config['mpf']['device_modules']:
-
-            device_cls = Util.string_to_class(device_type)
+        for collection_name, device_cls in self.device_classes.items():
 
-            collection_name, config_name = device_cls.get_config_info()
+            config_name = device_cls.config_section
 
             if config_name not in self.machine.config:
                 continue
@@ -188,11 +239,9 @@ class DeviceManager(MpfController):
 
     def initialize_devices(self):
         """Initialise devices."""
-        for device_type in self.machine.config['mpf']['device_modules']:
-
-            device_cls = Util.string_to_class(device_type)
+        for collection_name, device_cls in self.device_classes.items():
 
-            collection_name, config_name = device_cls.get_config_info()
+            config_name = device_cls.config_section
 
             if config_name not in self.machine.config:
                 continue
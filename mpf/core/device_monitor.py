@@ -1,20 +1,74 @@
 """Decorator to monitor devices."""
 from mpf.core.utility_functions import Util
 
+_SENTINEL = object()
+
+
+class MonitoredAttribute:
+
+    """Data descriptor which notifies about changes of one attribute of a device.
+
+    Plain attributes are stored in the instance dict under their own name so
+    that removing the descriptor leaves the device untouched. Properties with
+    a setter are wrapped.
+    """
+
+    __slots__ = ["name", "notify_name", "wrapped"]
+
+    def __init__(self, name, notify_name, wrapped):
+        """Initialise descriptor."""
+        self.name = name
+        self.notify_name = notify_name
+        self.wrapped = wrapped
+
+    def __get__(self, instance, owner):
+        """Return value."""
+        if instance is None:
+            return self
+        if hasattr(self.wrapped, "__set__"):
+            return self.wrapped.__get__(instance, owner)
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            if self.wrapped is _SENTINEL:
+                raise AttributeError(self.name)
+            return self.wrapped
+
+    def __set__(self, instance, value):
+        """Set value and notify subscribers if it changed."""
+        if hasattr(self.wrapped, "__set__"):
+            old = self.wrapped.__get__(instance, type(instance))
+            self.wrapped.__set__(instance, value)
+        else:
+            old = instance.__dict__.get(self.name, self.wrapped)
+            instance.__dict__[self.name] = value
+
+        if old is not _SENTINEL and old != value:
+            instance.machine.device_manager.notify_device_changes(instance, self.notify_name, old, value)
+
 
 class DeviceMonitor:
 
-    """Monitor variables of a device."""
+    """Monitor variables of a device.
+
+    Changes are only tracked while monitoring is enabled (e.g. when a BCP
+    client monitors devices). Only then the monitored attributes are replaced
+    by MonitoredAttribute descriptors. Otherwise, setting an attribute costs
+    the same as on an undecorated class.
+    """
+
+    _monitored = []
+    _enabled = 0
 
     def __init__(self, *attributes_to_monitor, **aliased_attributes_to_monitor):
         """Initialise decorator and remember attributes to monitor."""
         self._attributes_to_monitor = attributes_to_monitor
         self._aliased_attributes_to_monitor = aliased_attributes_to_monitor
+        self._cls = None
+        self._previous = {}
 
     def __call__(self, cls):
         """Decorate class."""
-        _sentinel = object()
-
         old_init = getattr(cls, '__init__', None)
 
         def __init__(self_inner, *args, **kwargs):  # noqa
@@ -22,30 +76,6 @@ class DeviceMonitor:
             old_init(self_inner, *args, **kwargs)
             self_inner.machine.device_manager.register_monitorable_device(self_inner)
 
-        old_setattr = getattr(cls, '__setattr__', None)
-
-        # pylint: disable-msg=
-        def __setattr__(self_inner, name, value):   # noqa
-            """If the value changed notify subscribers."""
-            attribute_name = False
-            if name in self._attributes_to_monitor:
-                old = getattr(self_inner, name, _sentinel)
-                if old is not _sentinel and old != value:
-                    attribute_name = name
-            elif name in self._aliased_attributes_to_monitor:
-                old = getattr(self_inner, name, _sentinel)
-                if old is not _sentinel and old != value:
-                    attribute_name = self._aliased_attributes_to_monitor[name]
-
-            if old_setattr:
-                old_setattr(self_inner, name, value)
-            else:
-                # Old-style class
-                self_inner.__dict__[name] = value
-
-            if attribute_name:
-                self_inner.machine.device_manager.notify_device_changes(self_inner, attribute_name, old, value)
-
         def get_monitorable_state(self_inner):
             """Return monitorable state of device."""
             state = {}
@@ -58,7 +88,58 @@ class DeviceMonitor:
             return state
 
         cls.__init__ = __init__
-        cls.__setattr__ = __setattr__
         cls.get_monitorable_state = get_monitorable_state
 
+        self._cls = cls
+        DeviceMonitor._monitored.append(self)
+        if DeviceMonitor._enabled:
+            self._install()
+
         return cls
+
+    def _get_attributes(self):
+        """Return tuples of attribute and the name which is used in notifications."""
+        attributes = [(attribute, attribute) for attribute in self._attributes_to_monitor]
+        attributes.extend(self._aliased_attributes_to_monitor.items())
+        return attributes
+
+    def _install(self):
+        """Replace all monitored attributes by descriptors."""
+        for attribute, notify_name in self._get_attributes():
+            wrapped = getattr(self._cls, attribute, _SENTINEL)
+            if isinstance(wrapped, MonitoredAttribute):
+                # monitored in a parent class
+                wrapped = wrapped.wrapped
+            elif isinstance(wrapped, property) and wrapped.fset is None:
+                # read-only properties cannot be set
+                continue
+
+            self._previous[attribute] = self._cls.__dict__.get(attribute, _SENTINEL)
+            setattr(self._cls, attribute, MonitoredAttribute(attribute, notify_name, wrapped))
+
+    def _uninstall(self):
+        """Restore all monitored attributes."""
+        for attribute, previous in self._previous.items():
+            if previous is _SENTINEL:
+                delattr(self._cls, attribute)
+            else:
+                setattr(self._cls, attribute, previous)
+        self._previous = {}
+
+    @classmethod
+    def enable_monitoring(cls):
+        """Start to track changes of monitored attributes."""
+        cls._enabled += 1
+        if cls._enabled == 1:
+            for monitor in cls._monitored:
+                monitor._install()
+
+    @classmethod
+    def disable_monitoring(cls):
+        """Stop to track changes when the last subscriber is gone."""
+        if not cls._enabled:
+            return
+        cls._enabled -= 1
+        if not cls._enabled:
+            for monitor in reversed(cls._monitored):
+                monitor._uninstall()
@@ -1,24 +1,26 @@
 """Classes for the EventManager and QueuedEvents."""
 import inspect
 from collections import deque, namedtuple
+from contextlib import contextmanager
 import uuid
 
 import asyncio
 from functools import partial
 from unittest.mock import MagicMock
 
-from typing import Dict, Any, TYPE_CHECKING, Tuple, Optional, Generator, Callable, List
+from typing import Dict, Any, TYPE_CHECKING, Tuple, Optional, Generator, Callable, List, Set, Iterable
 
 from mpf.core.mpf_controller import MpfController
 
 if TYPE_CHECKING:   # pragma: no cover
     from mpf.core.machine import MachineController
     from mpf.core.placeholder_manager import BaseTemplate
+    from mpf.core.latency_tracer import LatencyTracer
     from typing import Deque
 
 EventHandlerKey = namedtuple("EventHandlerKey", ["key", "event"])
 RegisteredHandler = namedtuple("RegisteredHandler", ["callback", "priority", "kwargs", "key", "condition"])
-PostedEvent = namedtuple("PostedEvent", ["event", "type", "callback", "kwargs"])
+PostedEvent = namedtuple("PostedEvent", ["event", "type", "callback", "kwargs", "trace"])
 
 
 class EventManager(MpfController):
@@ -34,6 +36,10 @@ class EventManager(MpfController):
         self.callback_queue = deque([])     # type: Deque[Tuple[Any, dict]]
         self.monitor_events = False
         self._queue_tasks = []              # type: List[asyncio.Task]
+        self.latency_tracer = None          # type: LatencyTracer
+        self.events_processed = 0
+        self._batch_depth = 0
+        self._unsorted_events = set()       # type: Set[str]
 
     def get_event_and_condition_from_string(self, event_string: str) -> Tuple[str, Optional["BaseTemplate"]]:
         """Parse an event string to divide the event name from a possible placeholder / conditional in braces.
@@ -136,14 +142,50 @@ class EventManager(MpfController):
         except IndexError:
             pass
 
+        if self._batch_depth:
+            # sorted once when the batch ends
+            self._unsorted_events.add(event)
+        else:
+            self._sort_handlers(event)
+
+        return EventHandlerKey(key, event)
+
+    def _sort_handlers(self, event: str) -> None:
         # Sort the handlers for this event based on priority. We do it now
         # so the list is pre-sorted so we don't have to do that with each
-        # event post.
+        # event post. The sort is stable so handlers with the same priority
+        # stay in the order in which they were added.
         self.registered_handlers[event].sort(key=lambda x: x.priority, reverse=True)
 
         self._verify_handlers(event, self.registered_handlers[event])
 
-        return EventHandlerKey(key, event)
+    @contextmanager
+    def handler_batch(self):
+        """Add and remove a lot of handlers at once.
+
+        Handlers added inside the with block are sorted once per event when
+        the outermost block ends instead of once per added handler. Events are
+        always queued so no handler runs before the block ends.
+
+        For example:
+
+        .. code::
+
+            with self.machine.events.handler_batch():
+                for event in events:
+                    keys.append(self.machine.events.add_handler(event, self.test))
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                unsorted_events = self._unsorted_events
+                self._unsorted_events = set()
+                for event in unsorted_events:
+                    if event in self.registered_handlers:
+                        self._sort_handlers(event)
 
     def _verify_handlers(self, event, sorted_handlers):
         """Verify that no races can happen."""
@@ -269,25 +311,42 @@ class EventManager(MpfController):
         Args:
             key: The key of the handler you want to remove
         """
-        if key.event not in self.registered_handlers:
-            return
-        events_to_delete_if_empty = []
-        for handler_tup in self.registered_handlers[key.event][:]:  # copy via slice
-            if handler_tup.key == key.key:
-                self.registered_handlers[key.event].remove(handler_tup)
-                self.debug_log("Removing method %s from event %s", (str(handler_tup[0]).split(' '))[2], key.event)
-                events_to_delete_if_empty.append(key.event)
-        for event in events_to_delete_if_empty:
-            self._remove_event_if_empty(event)
+        self._remove_handlers_from_event(key.event, {key.key})
 
-    def remove_handlers_by_keys(self, key_list: List[EventHandlerKey]) -> None:
+    def remove_handlers_by_keys(self, key_list: Iterable[EventHandlerKey]) -> None:
         """Remove multiple event handlers based on a passed list of keys.
 
+        Every event is only visited once no matter how many of its handlers
+        are removed.
+
         Args:
             key_list: A list of keys of the handlers you want to remove
         """
+        keys_by_event = {}     # type: Dict[str, Set[uuid.UUID]]
         for key in key_list:
-            self.remove_handler_by_key(key)
+            keys_by_event.setdefault(key.event, set()).add(key.key)
+
+        for event, keys in keys_by_event.items():
+            self._remove_handlers_from_event(event, keys)
+
+    def _remove_handlers_from_event(self, event: str, keys: Set[uuid.UUID]) -> None:
+        """Remove all handlers with one of keys from event."""
+        if event not in self.registered_handlers:
+            return
+
+        handler_list = self.registered_handlers[event]
+        remaining_handlers = [handler_tup for handler_tup in handler_list if handler_tup.key not in keys]
+        if len(remaining_handlers) == len(handler_list):
+            return
+
+        if self._debug_to_console or self._debug_to_file:
+            for handler_tup in handler_list:
+                if handler_tup.key in keys:
+                    self.debug_log("Removing method %s from event %s", (str(handler_tup[0]).split(' '))[2], event)
+
+        # update the list in place. a running event works on a copy
+        handler_list[:] = remaining_handlers
+        self._remove_event_if_empty(event)
 
     def _remove_event_if_empty(self, event: str) -> None:
         # Checks to see if the event doesn't have any more registered handlers,
@@ -511,7 +570,10 @@ class EventManager(MpfController):
         if not self.event_queue and hasattr(self.machine.clock, "loop"):
             self.machine.clock.loop.call_soon(self.process_event_queue)
 
-        posted_event = PostedEvent(event, ev_type, callback, kwargs)
+        if self.latency_tracer:
+            posted_event = PostedEvent(event, ev_type, callback, kwargs, self.latency_tracer.current)
+        else:
+            posted_event = PostedEvent(event, ev_type, callback, kwargs, None)
 
         if self.monitor_events:
             self.machine.bcp.interface.monitor_posted_event(posted_event)
@@ -662,6 +724,9 @@ class EventManager(MpfController):
             # process them in the same loop.
             while len(self.event_queue) > 0:
                 event = self.event_queue.popleft()
+                self.events_processed += 1
+                if event.trace:
+                    self.latency_tracer.resume(event.trace, "event")
                 if event.type == "queue":
                     self._process_queue_event(event=event[0],
                                               callback=event[2],
@@ -671,6 +736,8 @@ class EventManager(MpfController):
                                         ev_type=event[1],
                                         callback=event[2],
                                         **event[3])
+                if event.trace:
+                    self.latency_tracer.current = None
 
             # when all events are processed run the _last_ callback. afterwards
             # continue with the loop and run all events. this makes sure all
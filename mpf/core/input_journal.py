@@ -0,0 +1,291 @@
+"""Records all inputs of a machine to a binary journal and replays them."""
+import os
+import struct
+from collections import namedtuple
+
+from typing import Iterator, Optional, TYPE_CHECKING
+
+from mpf.core.bcp.bcp_client import BaseBcpClient
+from mpf.core.bcp.bcp_socket_client import encode_command_string, decode_command_string
+from mpf.core.mpf_controller import MpfController
+
+if TYPE_CHECKING:   # pragma: no cover
+    import asyncio
+
+JournalEntry = namedtuple("JournalEntry", ["offset", "kind", "args"])
+
+JOURNAL_MAGIC = b"MPFJ"
+JOURNAL_VERSION = 1
+HEADER = struct.Struct("<4sB")
+RECORD = struct.Struct("<dBI")      # offset in seconds, kind, length of payload
+SWITCH = struct.Struct("<BB")       # state, logical
+
+KIND_SWITCH = 1
+KIND_BCP = 2
+
+
+def encode_switch_record(offset: float, name: str, state: int, logical: bool) -> bytes:
+    """Return the binary record for a switch change."""
+    payload = SWITCH.pack(1 if state else 0, 1 if logical else 0) + name.encode()
+    return RECORD.pack(offset, KIND_SWITCH, len(payload)) + payload
+
+
+def encode_bcp_record(offset: float, client_name: str, cmd: str, kwargs: dict) -> bytes:
+    """Return the binary record for an incoming BCP command.
+
+    Raw bytes (e.g. of dmd_frame) are appended after a newline which never
+    occurs in the encoded command string.
+    """
+    client = client_name.encode()
+    kwargs = dict(kwargs)
+    rawbytes = kwargs.pop('rawbytes', None)
+    payload = bytes((len(client),)) + client + encode_command_string(cmd, **kwargs).encode()
+    if rawbytes is not None:
+        payload += b"\n" + bytes(rawbytes)
+    return RECORD.pack(offset, KIND_BCP, len(payload)) + payload
+
+
+def read_journal(data: bytes) -> Iterator[JournalEntry]:
+    """Decode a journal.
+
+    Switch entries have (name, state, logical) as args. BCP entries have
+    (client_name, cmd, kwargs). Raw bytes of BCP commands are passed in
+    kwargs as rawbytes.
+    """
+    magic, version = HEADER.unpack_from(data)
+    if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION:
+        raise AssertionError("Not an input journal or unsupported version {}".format(version))
+
+    pos = HEADER.size
+    while pos + RECORD.size <= len(data):
+        offset, kind, length = RECORD.unpack_from(data, pos)
+        pos += RECORD.size
+        payload = data[pos:pos + length]
+        pos += length
+        if len(payload) < length:
+            # the last record was not completely written
+            return
+
+        if kind == KIND_SWITCH:
+            state, logical = SWITCH.unpack_from(payload)
+            yield JournalEntry(offset, kind, (payload[SWITCH.size:].decode(), state, bool(logical)))
+        elif kind == KIND_BCP:
+            client_length = payload[0]
+            client_name = payload[1:1 + client_length].decode()
+            command, separator, rawbytes = payload[1 + client_length:].partition(b"\n")
+            cmd, kwargs = decode_command_string(command.decode())
+            if separator:
+                kwargs['rawbytes'] = rawbytes
+            yield JournalEntry(offset, kind, (client_name, cmd, kwargs))
+        else:
+            raise AssertionError("Unknown journal entry kind {}".format(kind))
+
+
+class ReplayBcpClient(BaseBcpClient):
+
+    """Stands in for a BCP client which is not connected during a replay.
+
+    Everything sent to it is dropped.
+    """
+
+    def __init__(self, machine, name, bcp):
+        """Initialise replay client."""
+        self.module_name = 'BCPClientReplay.{}'.format(name)
+        self.config_name = 'bcp_client'
+        super().__init__(machine, name, bcp)
+
+    def connect(self, config):
+        """Do nothing."""
+        pass
+
+    def read_message(self):
+        """Do nothing."""
+        pass
+
+    def accept_connection(self, receiver, sender):
+        """Do nothing."""
+        pass
+
+    def send(self, bcp_command, kwargs):
+        """Drop message."""
+        pass
+
+    def stop(self):
+        """Do nothing."""
+        pass
+
+
+class InputJournal(MpfController):
+
+    """Records switch changes and incoming BCP commands to a binary journal.
+
+    Recording is disabled by default and enabled in the input_journal
+    section. Every switch change which a platform reports to
+    SwitchController.process_switch_by_num and every incoming BCP command
+    (including its raw bytes) is written with the loop time since the start
+    of the recording. Keyboard and other switch changes which arrive via BCP
+    are recorded as that BCP command. Records are buffered in memory and
+    appended to the file every flush_interval and on shutdown.
+
+    A replay feeds the journal back at the same loop time offsets. On the
+    TimeTravelLoop of the tests this runs faster than real time with
+    identical input timing. Everything the machine does on its own is not
+    journaled since it happens again during the replay. This includes
+    timers, delays and switch changes which are simulated by the
+    smart_virtual platform or the switch player.
+    """
+
+    def __init__(self, machine) -> None:
+        """Initialise input journal."""
+        super().__init__(machine)
+        self.config = self.machine.config_validator.validate_config(
+            "input_journal", self.machine.config.get('input_journal', {}))
+        self.filename = None        # type: Optional[str]
+        self.recording = False
+        self.replaying = False
+        self._buffer = bytearray()
+        self._start_time = None     # type: float
+        self._flush_task = None
+        self._replay_entries = None     # type: Iterator[JournalEntry]
+        self._replay_start = None       # type: float
+        self._replay_handle = None      # type: Optional[asyncio.Handle]
+        self._replay_clients = dict()
+
+        if self.config['replay']:
+            self.machine.events.add_handler('init_phase_5', self._start_replay)
+        elif self.config['enabled']:
+            self.machine.events.add_handler('init_phase_5', self._start_recording)
+
+    def _get_path(self, filename: str) -> str:
+        return os.path.join(self.machine.machine_path, filename)
+
+    def _start_recording(self, **kwargs):
+        del kwargs
+        self.start_recording(self._get_path(self.config['file']))
+
+    def _start_replay(self, **kwargs):
+        del kwargs
+        self.replay(self._get_path(self.config['replay']))
+
+    def start_recording(self, filename: str):
+        """Start a new journal in filename and record all inputs to it."""
+        if self.recording:
+            raise AssertionError("Already recording to {}".format(self.filename))
+        if self.replaying:
+            raise AssertionError("Cannot record during a replay")
+
+        self.info_log("Recording inputs to %s", filename)
+        self.filename = filename
+        self.recording = True
+        self._start_time = self.machine.clock.get_time()
+        self._buffer = bytearray(HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION))
+
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        with open(filename, "wb"):
+            pass
+
+        self.machine.switch_controller.input_journal = self
+        self.machine.bcp.interface.input_journal = self
+        self._flush_task = self.machine.clock.schedule_interval(self.flush, self.config['flush_interval'] / 1000)
+        self.machine.events.add_handler('shutdown', self.stop_recording)
+
+    def stop_recording(self, **kwargs):
+        """Stop recording and write the remaining records."""
+        del kwargs
+        if not self.recording:
+            return
+
+        self.machine.switch_controller.input_journal = None
+        self.machine.bcp.interface.input_journal = None
+        self.machine.events.remove_handler(self.stop_recording)
+        self._flush_task.cancel()
+        self._flush_task = None
+        self.flush()
+        self.recording = False
+        self.info_log("Stopped recording inputs to %s", self.filename)
+
+    def flush(self):
+        """Append all buffered records to the journal."""
+        if not self._buffer:
+            return
+
+        with open(self.filename, "ab") as f:
+            f.write(self._buffer)
+        self._buffer = bytearray()
+
+    def record_switch(self, name: str, state: int, logical: bool):
+        """Record a switch change from a platform."""
+        self._buffer += encode_switch_record(self.machine.clock.get_time() - self._start_time, name, state, logical)
+
+    def record_bcp(self, cmd: str, kwargs: dict, client: BaseBcpClient):
+        """Record an incoming BCP command."""
+        self._buffer += encode_bcp_record(self.machine.clock.get_time() - self._start_time, client.name,
+                                          cmd, kwargs)
+
+    def replay(self, filename: str):
+        """Feed all inputs in a journal into the machine starting now."""
+        if self.recording:
+            raise AssertionError("Cannot replay while recording")
+        if self.replaying:
+            raise AssertionError("Already replaying a journal")
+
+        with open(filename, "rb") as f:
+            data = f.read()
+
+        self.info_log("Replaying inputs from %s", filename)
+        self.filename = filename
+        self.replaying = True
+        self._replay_start = self.machine.clock.get_time()
+        self._replay_entries = read_journal(data)
+        self._schedule_next_entry()
+
+    def stop_replay(self):
+        """Stop a running replay."""
+        if self._replay_handle:
+            self._replay_handle.cancel()
+            self._replay_handle = None
+        self._replay_entries = None
+        self.replaying = False
+
+    def _schedule_next_entry(self):
+        entry = next(self._replay_entries, None)
+        if entry is None:
+            self._replay_handle = None
+            self._replay_entries = None
+            self.replaying = False
+            self.info_log("Replay of %s done", self.filename)
+            self.machine.events.post('input_journal_replay_done', filename=self.filename)
+            '''event: input_journal_replay_done
+
+            desc: All inputs of an input journal have been replayed.
+
+            args:
+
+            filename: The journal which has been replayed.
+            '''
+            return
+
+        self._replay_handle = self.machine.clock.loop.call_at(self._replay_start + entry.offset,
+                                                              self._replay_entry, entry)
+
+    def _replay_entry(self, entry: JournalEntry):
+        if entry.kind == KIND_SWITCH:
+            name, state, logical = entry.args
+            if name in self.machine.switches:
+                self.machine.switch_controller.process_switch_obj(self.machine.switches[name], state, logical)
+            else:
+                self.warning_log("Journal contains unknown switch %s", name)
+        else:
+            client_name, cmd, kwargs = entry.args
+            self.machine.bcp.interface.process_bcp_message(cmd, kwargs, self._get_replay_client(client_name))
+
+        self._schedule_next_entry()
+
+    def _get_replay_client(self, name: str) -> BaseBcpClient:
+        """Return the connected client with name or a client which drops everything sent to it."""
+        client = self.machine.bcp.transport.get_named_client(name)
+        if client:
+            return client
+        if name not in self._replay_clients:
+            self._replay_clients[name] = ReplayBcpClient(self.machine, name, self.machine.bcp)
+        return self._replay_clients[name]
@@ -0,0 +1,185 @@
+"""Traces the latency between switch changes in the hardware and the resulting outputs."""
+import time
+from bisect import bisect_left
+from collections import namedtuple
+
+from typing import Dict, Optional, List
+
+from mpf.core.mpf_controller import MpfController
+
+LatencyTrace = namedtuple("LatencyTrace", ["switch_name", "state", "timestamp"])
+
+
+class LatencyHistogram(object):
+
+    """Histogram of latencies in ms."""
+
+    __slots__ = ["counts", "count", "total", "min", "max"]
+
+    buckets = (0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 50, 100, 200)
+    """Upper bounds of the buckets in ms. The last bucket collects everything above."""
+
+    def __init__(self):
+        """Initialise empty histogram."""
+        self.counts = [0] * (len(self.buckets) + 1)     # type: List[int]
+        self.count = 0
+        self.total = 0.0
+        self.min = None     # type: float
+        self.max = None     # type: float
+
+    def add(self, value: float):
+        """Add a latency in ms."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Return the upper bound of the bucket which contains the percentile.
+
+        The value is capped at the maximum latency seen.
+        """
+        if not self.count:
+            return None
+        target = self.count * percent / 100.0
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                if index < len(self.buckets):
+                    return min(self.buckets[index], self.max)
+                break
+        return self.max
+
+    def to_dict(self) -> dict:
+        """Return the histogram as dict."""
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "avg": self.total / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "buckets": self.counts[:],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        """Create histogram from a dict created by to_dict."""
+        histogram = cls()
+        histogram.counts = list(data["buckets"])
+        histogram.count = data["count"]
+        histogram.total = (data["avg"] or 0.0) * data["count"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
+
+
+class LatencyTracer(MpfController):
+
+    """Measures how long it takes from a switch change to events, coils and lights.
+
+    Tracing is disabled by default and enabled with the latency_tracing
+    setting in the mpf section. Platforms stamp switch changes with
+    time.monotonic() when they receive them. The stamp follows the switch
+    change through the switch handlers, all events posted by them and the
+    resulting driver and light writes. Latencies are collected per switch and
+    stage:
+
+    switch:
+        Until all switch handlers have been called.
+    event:
+        Until the handlers of an event posted because of the switch change run.
+    driver:
+        Until a driver is pulsed or enabled.
+    light:
+        Until a new color is handed to the light platform.
+    """
+
+    stages = ("switch", "event", "driver", "light")
+
+    def __init__(self, machine) -> None:
+        """Initialise latency tracer."""
+        super().__init__(machine)
+        self.enabled = self.machine.config['mpf']['latency_tracing']
+        self.current = None         # type: Optional[LatencyTrace]
+        self.histograms = dict()    # type: Dict[str, Dict[str, LatencyHistogram]]
+        self._data_manager = None
+
+        if not self.enabled:
+            return
+
+        self.info_log("Latency tracing is enabled. This adds some overhead to every switch change.")
+        self.machine.events.latency_tracer = self
+        self.machine.bcp.interface.register_command_callback("latency_stats", self._bcp_receive_latency_stats)
+        self.machine.events.add_handler('init_phase_1', self._initialize)
+        self.machine.events.add_handler('shutdown', self.save)
+
+    def _initialize(self, **kwargs):
+        del kwargs
+        self._data_manager = self.machine.create_data_manager('latency')
+
+    def stamp(self) -> Optional[float]:
+        """Return the receive time for a switch change or None if tracing is disabled."""
+        if self.enabled:
+            return time.monotonic()
+        return None
+
+    def start(self, switch_name: str, state: int, timestamp: float=None) -> Optional[LatencyTrace]:
+        """Start a trace for a switch change and make it the current trace."""
+        if not self.enabled:
+            return None
+        if timestamp is None:
+            timestamp = time.monotonic()
+        self.current = LatencyTrace(switch_name, state, timestamp)
+        return self.current
+
+    def resume(self, trace: LatencyTrace, stage: str):
+        """Make a trace the current trace again and record the stage."""
+        self.current = trace
+        self.record(trace, stage)
+
+    def finish(self, trace: LatencyTrace, stage: str):
+        """Record the stage and clear the current trace."""
+        self.record(trace, stage)
+        self.current = None
+
+    def record(self, trace: LatencyTrace, stage: str):
+        """Record the latency between the receive time of the trace and now."""
+        latency = (time.monotonic() - trace.timestamp) * 1000
+        try:
+            histogram = self.histograms[trace.switch_name][stage]
+        except KeyError:
+            histogram = LatencyHistogram()
+            self.histograms.setdefault(trace.switch_name, dict())[stage] = histogram
+        histogram.add(latency)
+
+    def record_output(self, stage: str):
+        """Record an output (driver or light) for the current trace if there is one."""
+        if self.current:
+            self.record(self.current, stage)
+
+    def get_stats(self) -> dict:
+        """Return all histograms as dict by switch and stage."""
+        return {switch_name: {stage: histogram.to_dict() for stage, histogram in stages.items()}
+                for switch_name, stages in self.histograms.items()}
+
+    def reset(self):
+        """Remove all collected latencies."""
+        self.histograms = dict()
+
+    def save(self, **kwargs):
+        """Write the collected latencies to disk."""
+        del kwargs
+        if self._data_manager:
+            self._data_manager.save_all(self.get_stats())
+
+    def _bcp_receive_latency_stats(self, client, reset=False, **kwargs):
+        """Send latency stats to a BCP client."""
+        del kwargs
+        self.machine.bcp.transport.send_to_client(client, "latency_stats", stats=self.get_stats())
+        if reset:
+            self.reset()
@@ -1,6 +1,6 @@
 """Handles all light updates."""
 import asyncio
-from typing import Dict
+from typing import Dict, Tuple
 
 from mpf.core.machine import MachineController
 from mpf.core.settings_controller import SettingEntry
@@ -24,6 +24,15 @@ class LightController(MpfController):
         # will only get initialised if there are lights
         self._initialised = False
 
+        self.brightness_factor = None
+        self._brightness_luts = dict()      # type: Dict[RGBColorCorrectionProfile, Tuple[Tuple[float, ...], ...]]
+
+        self.last_fade = (None, None, None, None)
+        """Last fade step calculated by a light as (stack entry, time, max_fade_ms, result).
+
+        Lights which share a stack entry reuse the result for all their
+        channels."""
+
         self._monitor_update_task = None                    # type: asyncio.Task
 
         if 'named_colors' in self.machine.config:
@@ -69,6 +78,43 @@ class LightController(MpfController):
         # add setting for brightness
         self.machine.settings.add_setting(SettingEntry("brightness", "Brightness", 100, "brightness", 1.0,
                                                        {0.25: "25%", 0.5: "50%", 0.75: "75%", 1.0: "100% (default)"}))
+        self.brightness_factor = self.machine.get_machine_var("brightness")
+        self.machine.events.add_handler("machine_var_brightness", self._brightness_changed)
+
+    def _brightness_changed(self, value, **kwargs):
+        """Rebuild the brightness tables of all lights."""
+        del kwargs
+        self.brightness_factor = value
+        self._brightness_luts = dict()
+        for light in self.machine.lights:
+            light.update_brightness_lut()
+
+    def get_brightness_lut(self, profile: RGBColorCorrectionProfile=None) -> Tuple[Tuple[float, ...], ...]:
+        """Return a table which maps channel values (0-255) to the hardware brightness (0.0-1.0).
+
+        The table combines the brightness setting and the color correction
+        profile. There is one table per channel (red, green, blue) and they are
+        shared between all lights with the same profile.
+        """
+        try:
+            return self._brightness_luts[profile]
+        except KeyError:
+            pass
+
+        factor = self.brightness_factor
+        tables = []
+        for channel in range(3):
+            table = []
+            for value in range(256):
+                if factor:
+                    value = min(int(value * factor), 255)
+                if profile is not None:
+                    value = profile.lookup(channel, value)
+                table.append(value / 255.0)
+            tables.append(tuple(table))
+
+        self._brightness_luts[profile] = tuple(tables)
+        return self._brightness_luts[profile]
 
     def monitor_lights(self):
         """Update the color of lights for the monitor."""
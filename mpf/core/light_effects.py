@@ -0,0 +1,199 @@
+"""Procedural light effects which color lights based on their position."""
+import math
+import random
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from mpf.core.rgb_color import RGBColor
+from mpf.devices.light import Light
+
+
+def _get_positions(lights: List[Light]) -> List[Tuple[float, float]]:
+    """Return the position of every light.
+
+    Lights without x/y config are placed on a line by their index.
+    """
+    positions = []
+    for index, light in enumerate(lights):
+        if light.config.get('x') is None or light.config.get('y') is None:
+            positions.append((float(index), 0.0))
+        else:
+            positions.append((float(light.config['x']), float(light.config['y'])))
+    return positions
+
+
+def _normalise(values: List[float]) -> List[float]:
+    """Scale values to 0..1."""
+    low = min(values)
+    span = max(values) - low
+    if not span:
+        return [0.0] * len(values)
+    return [(value - low) / span for value in values]
+
+
+def _project(positions: List[Tuple[float, float]], direction: Optional[float]) -> List[float]:
+    """Return the position of every light along direction (in degrees) scaled to 0..1.
+
+    The direction uses the same convention as light_stripes. Without a
+    direction the axis along which the lights spread the most is used.
+    """
+    if direction is None:
+        x_span = max(x for x, _ in positions) - min(x for x, _ in positions)
+        y_span = max(y for _, y in positions) - min(y for _, y in positions)
+        direction = 90 if x_span >= y_span else 0
+    angle = direction / 180 * math.pi
+    dir_x = math.sin(angle)
+    dir_y = math.cos(angle)
+    return _normalise([x * dir_x + y * dir_y for x, y in positions])
+
+
+def _sweep(positions, settings) -> Callable[[float], List[float]]:
+    """Band of light which moves across the lights."""
+    projection = _project(positions, settings['direction'])
+    width = max(settings['width'], 0.001)
+    speed = settings['speed']
+
+    def _evaluate(time):
+        center = (time * speed) % 1.0 * (1 + 2 * width) - width
+        return [max(0.0, 1 - abs(pos - center) / width) for pos in projection]
+
+    return _evaluate
+
+
+def _gradient(positions, settings) -> Callable[[float], List[float]]:
+    """Gradient from background to color which scrolls with speed."""
+    projection = _project(positions, settings['direction'])
+    speed = settings['speed']
+
+    def _evaluate(time):
+        offset = time * speed
+        return [1 - abs((pos - offset) % 2.0 - 1) for pos in projection]
+
+    return _evaluate
+
+
+def _radial(positions, settings) -> Callable[[float], List[float]]:
+    """Waves which travel outwards from a center."""
+    if settings['center_x'] is None or settings['center_y'] is None:
+        center_x = sum(x for x, _ in positions) / len(positions)
+        center_y = sum(y for _, y in positions) / len(positions)
+    else:
+        center_x = settings['center_x']
+        center_y = settings['center_y']
+    distances = [math.hypot(x - center_x, y - center_y) for x, y in positions]
+    max_distance = max(distances) or 1.0
+    distances = [distance / max_distance for distance in distances]
+    wavelength = max(settings['width'], 0.001)
+    speed = settings['speed']
+    two_pi = 2 * math.pi
+
+    def _evaluate(time):
+        phase = time * speed
+        return [0.5 + 0.5 * math.cos(two_pi * (distance / wavelength - phase)) for distance in distances]
+
+    return _evaluate
+
+
+def _noise(positions, settings) -> Callable[[float], List[float]]:
+    """Smooth random flicker (value noise over time with a different offset per light)."""
+    rng = random.Random()
+    table = [rng.random() for _ in range(256)]
+    offsets = [rng.randrange(256) for _ in positions]
+    speed = settings['speed']
+
+    def _evaluate(time):
+        phase = time * speed
+        step = int(phase)
+        fraction = phase - step
+        # smoothstep between the lattice values
+        fraction = fraction * fraction * (3 - 2 * fraction)
+        levels = []
+        for offset in offsets:
+            start = table[(offset + step) & 255]
+            end = table[(offset + step + 1) & 255]
+            levels.append(start + (end - start) * fraction)
+        return levels
+
+    return _evaluate
+
+
+def _chase(positions, settings) -> Callable[[float], List[float]]:
+    """Every n-th light is on and the pattern moves along direction."""
+    projection = _project(positions, settings['direction'])
+    ranks = [0] * len(projection)
+    for rank, index in enumerate(sorted(range(len(projection)), key=projection.__getitem__)):
+        ranks[index] = rank
+    spacing = max(settings['spacing'], 1)
+    speed = settings['speed']
+
+    def _evaluate(time):
+        step = int(time * speed * spacing)
+        return [1.0 if (rank - step) % spacing == 0 else 0.0 for rank in ranks]
+
+    return _evaluate
+
+
+EFFECTS = {
+    "sweep": _sweep,
+    "gradient": _gradient,
+    "radial": _radial,
+    "noise": _noise,
+    "chase": _chase,
+}     # type: Dict[str, Callable]
+
+
+class LightEffect(object):
+
+    """A procedural effect on a list of lights.
+
+    The effect is evaluated once per frame. It calculates a level between 0
+    and 1 per light from the positions of the lights which are precomputed
+    when the effect is created. The level blends between background and color
+    and is written to the stack of the lights with priority and key.
+    """
+
+    # pylint: disable-msg=too-many-arguments
+    def __init__(self, machine, lights: List[Light], settings: dict, priority: int, key: str) -> None:
+        """Initialise light effect."""
+        if settings['effect'] not in EFFECTS:
+            raise AssertionError("Invalid light effect {}".format(settings['effect']))
+
+        self.machine = machine
+        self.lights = lights
+        self.priority = priority
+        self.key = key
+        self.fps = settings['fps']
+        self._evaluate = EFFECTS[settings['effect']](_get_positions(lights), settings) if lights else None
+
+        # one color per level
+        color = RGBColor(settings['color']).rgb
+        background = RGBColor(settings['background']).rgb
+        self._palette = [RGBColor([background[channel] + (color[channel] - background[channel]) * level // 255
+                                   for channel in range(3)]) for level in range(256)]
+
+        self._start_time = None     # type: float
+        self._task = None
+
+    def start(self):
+        """Start the effect."""
+        if not self.lights:
+            return
+        self._start_time = self.machine.clock.get_time()
+        self.update()
+        self._task = self.machine.clock.schedule_interval(self.update, 1 / self.fps)
+
+    def stop(self):
+        """Stop the effect and remove it from all lights."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        for light in self.lights:
+            light.remove_from_stack_by_key(self.key)
+
+    def update(self):
+        """Calculate the next frame and set it to the lights."""
+        levels = self._evaluate(self.machine.clock.get_time() - self._start_time)
+        palette = self._palette
+        Light.set_colors([(light, palette[min(255, max(0, int(level * 255 + 0.5)))])
+                          for light, level in zip(self.lights, levels)],
+                         fade_ms=0, priority=self.priority, key=self.key)
@@ -0,0 +1,191 @@
+"""Monitors the health of the asyncio event loop."""
+import asyncio
+import time
+import traceback
+from collections import deque, namedtuple
+
+from typing import List, Optional, TYPE_CHECKING
+
+from mpf.core.latency_tracer import LatencyHistogram
+from mpf.core.mpf_controller import MpfController
+
+if TYPE_CHECKING:   # pragma: no cover
+    from typing import Deque
+
+SlowCallback = namedtuple("SlowCallback", ["name", "duration", "timestamp", "stack"])
+
+
+def get_callback_name(callback) -> str:
+    """Return a qualified name for a loop callback or task step."""
+    task = getattr(callback, "__self__", None)
+    if isinstance(task, asyncio.Task):
+        coro = task._coro     # pylint: disable-msg=protected-access
+        return "Task {}".format(getattr(coro, "__qualname__", repr(coro)))
+
+    while hasattr(callback, "func"):
+        # functools.partial
+        callback = callback.func
+
+    module = getattr(callback, "__module__", None)
+    name = getattr(callback, "__qualname__", None) or repr(callback)
+    return "{}.{}".format(module, name) if module else name
+
+
+def get_callback_stack(callback) -> List[str]:
+    """Return the stack of a task or the source location of a callback."""
+    task = getattr(callback, "__self__", None)
+    if isinstance(task, asyncio.Task):
+        return traceback.format_list(traceback.StackSummary.extract(
+            (frame, frame.f_lineno) for frame in task.get_stack()))
+
+    while hasattr(callback, "func"):
+        callback = callback.func
+    code = getattr(getattr(callback, "__func__", callback), "__code__", None)
+    if code is None:
+        return []
+    return ['  File "{}", line {}, in {}\n'.format(code.co_filename, code.co_firstlineno, code.co_name)]
+
+
+class LoopMonitor(MpfController):
+
+    """Measures the scheduling lag of the event loop and finds callbacks which block it.
+
+    The monitor is disabled by default and enabled in the loop_monitor
+    section. It schedules a callback every sample_interval and records how
+    late it runs. Additionally, every callback and task step which runs longer
+    than slow_callback_threshold is recorded with its name and stack.
+
+    Every publish_interval lag percentiles are published as machine vars
+    (loop_lag_p50, loop_lag_p99, loop_lag_max and loop_slow_callbacks).
+    BCP clients can request all stats with the loop_stats command.
+
+    Slow callbacks are found by timing asyncio.Handle. This does not work
+    with uvloop which has its own handles. Lag sampling works with every loop.
+    """
+
+    def __init__(self, machine) -> None:
+        """Initialise loop monitor."""
+        super().__init__(machine)
+        self.config = self.machine.config_validator.validate_config(
+            "loop_monitor", self.machine.config.get('loop_monitor', {}))
+        self.enabled = self.config['enabled']
+        self.lag = LatencyHistogram()
+        self.slow_callbacks = deque(maxlen=self.config['max_slow_callbacks'])   # type: Deque[SlowCallback]
+        self.slow_callback_count = 0
+        self._original_run = None
+        self._sample_handle = None      # type: Optional[asyncio.Handle]
+        self._publish_task = None
+        self._next_sample = None        # type: float
+
+        if not self.enabled:
+            return
+
+        self.info_log("Loop monitoring is enabled. This adds some overhead to every callback.")
+        self.machine.bcp.interface.register_command_callback("loop_stats", self._bcp_receive_loop_stats)
+        self.machine.events.add_handler('init_phase_1', self._start)
+        self.machine.events.add_handler('shutdown', self.stop)
+
+    def _start(self, **kwargs):
+        del kwargs
+        self._install()
+        self._schedule_sample()
+        self._publish_task = self.machine.clock.schedule_interval(self.publish, self.config['publish_interval'] / 1000)
+
+    def _install(self):
+        """Time every handle which runs on the loop."""
+        if self._original_run:
+            return
+
+        original_run = asyncio.Handle._run      # pylint: disable-msg=protected-access
+        threshold = self.config['slow_callback_threshold'] / 1000
+        monitor = self
+
+        def _run(handle):
+            start = time.monotonic()
+            original_run(handle)
+            duration = time.monotonic() - start
+            if duration >= threshold:
+                monitor.record_slow_callback(handle._callback, duration)  # pylint: disable-msg=protected-access
+
+        self._original_run = original_run
+        asyncio.Handle._run = _run      # pylint: disable-msg=protected-access
+
+    def _uninstall(self):
+        """Restore the original Handle._run."""
+        if self._original_run:
+            asyncio.Handle._run = self._original_run    # pylint: disable-msg=protected-access
+            self._original_run = None
+
+    def _schedule_sample(self):
+        self._next_sample = self.machine.clock.get_time() + self.config['sample_interval'] / 1000
+        self._sample_handle = self.machine.clock.loop.call_at(self._next_sample, self._sample)
+
+    def _sample(self):
+        """Record how late this callback runs."""
+        self.lag.add(max(0.0, self.machine.clock.get_time() - self._next_sample) * 1000)
+        self._schedule_sample()
+
+    def record_slow_callback(self, callback, duration: float):
+        """Record a callback which blocked the loop for duration seconds."""
+        name = get_callback_name(callback)
+        self.slow_callback_count += 1
+        self.slow_callbacks.append(SlowCallback(name, duration * 1000, time.time(), get_callback_stack(callback)))
+        self.warning_log("%s blocked the loop for %.1f ms", name, duration * 1000)
+
+    def publish(self):
+        """Publish lag percentiles as machine vars."""
+        stats = self.lag.to_dict()
+        self.machine.set_machine_var("loop_lag_p50", stats["p50"])
+        '''machine_var: loop_lag_p50
+
+        desc: Median event loop lag in ms measured by the loop monitor.
+        '''
+        self.machine.set_machine_var("loop_lag_p99", stats["p99"])
+        '''machine_var: loop_lag_p99
+
+        desc: 99th percentile of the event loop lag in ms measured by the
+        loop monitor.
+        '''
+        self.machine.set_machine_var("loop_lag_max", stats["max"])
+        '''machine_var: loop_lag_max
+
+        desc: Maximum event loop lag in ms measured by the loop monitor.
+        '''
+        self.machine.set_machine_var("loop_slow_callbacks", self.slow_callback_count)
+        '''machine_var: loop_slow_callbacks
+
+        desc: Number of callbacks which blocked the event loop for longer than
+        slow_callback_threshold.
+        '''
+
+    def get_stats(self) -> dict:
+        """Return lag histogram and slow callbacks."""
+        return {
+            "lag": self.lag.to_dict(),
+            "slow_callback_count": self.slow_callback_count,
+            "slow_callbacks": [callback._asdict() for callback in self.slow_callbacks],
+        }
+
+    def reset(self):
+        """Remove all collected stats."""
+        self.lag = LatencyHistogram()
+        self.slow_callbacks.clear()
+        self.slow_callback_count = 0
+
+    def stop(self, **kwargs):
+        """Stop monitoring."""
+        del kwargs
+        self._uninstall()
+        if self._sample_handle:
+            self._sample_handle.cancel()
+            self._sample_handle = None
+        if self._publish_task:
+            self._publish_task.cancel()
+            self._publish_task = None
+
+    def _bcp_receive_loop_stats(self, client, reset=False, **kwargs):
+        """Send loop stats to a BCP client."""
+        del kwargs
+        self.machine.bcp.transport.send_to_client(client, "loop_stats", stats=self.get_stats())
+        if reset:
+            self.reset()
@@ -11,6 +11,8 @@ import threading
 from platform import platform, python_version, system, release, version, system_alias, machine
 
 import copy
+import time
+from collections import OrderedDict
 
 import asyncio
 
@@ -18,7 +20,6 @@ from pkg_resources import iter_entry_points
 from typing import Any, TYPE_CHECKING, Callable, Dict, List, Set, Generator
 
 from mpf._version import __version__, version as mpf_version, extended_version as mpf_extended_version
-from mpf.core.case_insensitive_dict import CaseInsensitiveDict
 from mpf.core.clock import ClockBase
 from mpf.core.config_processor import ConfigProcessor
 from mpf.core.config_validator import ConfigValidator
@@ -27,6 +28,8 @@ from mpf.core.delays import DelayManager, DelayManagerRegistry
 from mpf.core.device_manager import DeviceCollection, DeviceCollectionType
 from mpf.core.utility_functions import Util
 from mpf.core.logging import LogMixin
+from mpf.core.machine_vars import MachineVariables
+from mpf.platforms.interfaces.light_platform_interface import FadeScheduler
 
 if TYPE_CHECKING:   # pragma: no cover
     from mpf.modes.game.code.game import Game
@@ -97,10 +100,11 @@ class MachineController(LogMixin):
         self._done = False
         self.monitors = dict()      # type: Dict[str, Set[Callable]]
         self.plugins = list()       # type: List[Any]
+        self.import_times = OrderedDict()   # type: Dict[str, float]
         self.scriptlets = list()    # type: List[Scriptlet]
         self.modes = DeviceCollection(self, 'modes', None)          # type: Dict[str, Mode]
         self.game = None            # type: Game
-        self.machine_vars = CaseInsensitiveDict()
+        self.machine_vars = MachineVariables(self)
         self.machine_var_monitor = False
         self.machine_var_data_manager = None    # type: DataManager
         self.thread_stopper = threading.Event()
@@ -302,7 +306,7 @@ class MachineController(LogMixin):
         """Register config players."""
         # todo move this to config_player module
         for name, module_class in self.config['mpf']['config_players'].items():
-            config_player_class = Util.string_to_class(module_class)
+            config_player_class = self.import_class(module_class)
             setattr(self, '{}_player'.format(name),
                     config_player_class(self))
 
@@ -328,11 +332,27 @@ class MachineController(LogMixin):
     def _load_machine_vars(self) -> None:
         """Load machine vars from data manager."""
         self.machine_var_data_manager = self.create_data_manager('machine_vars')
+        self.machine_vars.data_manager = self.machine_var_data_manager
+        self.events.add_handler('shutdown', self.machine_vars.save)
 
         current_time = self.clock.get_time()
 
-        for name, settings in (
-                iter(self.machine_var_data_manager.get_data().items())):
+        # names are case insensitive and stored lowercase. migrate other
+        # spellings and prefer the lowercase one if there are several
+        machine_vars = self.machine_var_data_manager.get_data()
+        renamed = dict()
+        other_spellings = [name for name in machine_vars if name != name.lower()]
+        for name in other_spellings:
+            settings = machine_vars.pop(name)
+            if name.lower() not in machine_vars and name.lower() not in renamed:
+                renamed[name.lower()] = settings
+
+        if other_spellings:
+            self.machine_var_data_manager.remove_keys(other_spellings)
+            self.machine_var_data_manager.save_keys(renamed)
+            machine_vars.update(renamed)
+
+        for name, settings in machine_vars.items():
 
             if not isinstance(settings, dict) or "value" not in settings:
                 continue
@@ -504,12 +524,38 @@ class MachineController(LogMixin):
             self.log.info("Python version: %s.%s.%s (64-bit)", python_version_info[0],
                           python_version_info[1], python_version_info[2])
 
+    def import_class(self, class_string: str) -> Callable[..., Any]:
+        """Import and return a class and remember how long the import took.
+
+        Args:
+            class_string: Full path of the class (e.g.
+                mpf.core.events.EventManager).
+        """
+        if class_string in self.import_times:
+            return Util.string_to_class(class_string)
+
+        start = time.perf_counter()
+        cls = Util.string_to_class(class_string)
+        self.import_times[class_string] = time.perf_counter() - start
+        return cls
+
+    def _log_import_report(self) -> None:
+        """Log how much of the startup time was spent importing modules.
+
+        Only the first import of a module is slow. Classes which share an
+        already imported module will show up with almost no time.
+        """
+        self.log.info("Imported %s classes in %.1fms", len(self.import_times),
+                      sum(self.import_times.values()) * 1000)
+        for class_string, duration in sorted(self.import_times.items(), key=lambda x: -x[1]):
+            self.debug_log("Import of %s took %.1fms", class_string, duration * 1000)
+
     def _load_core_modules(self) -> None:
         """Load core modules."""
         self.debug_log("Loading core modules...")
         for name, module_class in self.config['mpf']['core_modules'].items():
             self.debug_log("Loading '%s' core module", module_class)
-            m = Util.string_to_class(module_class)(self)
+            m = self.import_class(module_class)(self)
             setattr(self, name, m)
 
     def _load_hardware_platforms(self) -> None:
@@ -544,7 +590,7 @@ class MachineController(LogMixin):
 
             self.debug_log("Loading '%s' plugin", plugin)
 
-            plugin_obj = Util.string_to_class(plugin)(self)
+            plugin_obj = self.import_class(plugin)(self)
             self.plugins.append(plugin_obj)
 
     def _load_scriptlets(self) -> None:
@@ -638,7 +684,7 @@ class MachineController(LogMixin):
                 raise AssertionError("Invalid platform {}".format(name))
 
             try:
-                hardware_platform = Util.string_to_class(self.config['mpf']['platforms'][name])
+                hardware_platform = self.import_class(self.config['mpf']['platforms'][name])
             except ImportError:     # pragma: no cover
                 raise ImportError("Cannot add hardware platform {}. This is "
                                   "not a valid platform name".format(name))
@@ -748,16 +794,8 @@ class MachineController(LogMixin):
         for hardware_platform in list(self.hardware_platforms.values()):
             hardware_platform.stop()
 
-    def _write_machine_var_to_disk(self, name: str) -> None:
-        """Write value to disk."""
-        if self.machine_vars[name]['persist'] and self.config['mpf']['save_machine_vars_to_disk']:
-            disk_var = CaseInsensitiveDict()
-            disk_var['value'] = self.machine_vars[name]['value']
-
-            if self.machine_vars[name]['expire_secs']:
-                disk_var['expire'] = self.clock.get_time() + self.machine_vars[name]['expire_secs']
-
-            self.machine_var_data_manager.save_key(name, disk_var)
+        # running software fades hold on to their lights
+        FadeScheduler.stop_all(self.clock.loop)
 
     def get_machine_var(self, name: str) -> Any:
         """Return the value of a machine variable.
@@ -770,10 +808,7 @@ class MachineController(LogMixin):
             does not exist.
 
         """
-        try:
-            return self.machine_vars[name]['value']
-        except KeyError:
-            return None
+        return self.machine_vars.get_value(name)
 
     def is_machine_var(self, name: str) -> bool:
         """Return true if machine variable exists."""
@@ -793,16 +828,7 @@ class MachineController(LogMixin):
                 the machine to disk to persist even during power off, but you
                 could set it so that those only stay persisted for an hour.
         """
-        if name not in self.machine_vars:
-            var = CaseInsensitiveDict()
-
-            var['value'] = None
-            var['persist'] = persist
-            var['expire_secs'] = expire_secs
-            self.machine_vars[name] = var
-        else:
-            self.machine_vars[name]['persist'] = persist
-            self.machine_vars[name]['expire_sec'] = expire_secs
+        self.machine_vars.configure(name, persist, expire_secs)
 
     def set_machine_var(self, name: str, value: Any) -> None:
         """Set the value of a machine variable.
@@ -811,53 +837,7 @@ class MachineController(LogMixin):
             name: String name of the variable you're setting the value for.
             value: The value you're setting. This can be any Type.
         """
-        if name not in self.machine_vars:
-            self.configure_machine_var(name=name, persist=False)
-            prev_value = None
-            change = True
-        else:
-            prev_value = self.machine_vars[name]['value']
-            try:
-                change = value - prev_value
-            except TypeError:
-                change = prev_value != value
-
-        # set value
-        self.machine_vars[name]['value'] = value
-
-        if change:
-            self._write_machine_var_to_disk(name)
-
-            self.debug_log("Setting machine_var '%s' to: %s, (prior: %s, "
-                           "change: %s)", name, value, prev_value,
-                           change)
-            self.events.post('machine_var_' + name,
-                             value=value,
-                             prev_value=prev_value,
-                             change=change)
-            '''event: machine_var_(name)
-
-            desc: Posted when a machine variable is added or changes value.
-            (Machine variables are like player variables, except they're
-            maintained machine-wide instead of per-player or per-game.)
-
-            args:
-
-            value: The new value of this machine variable.
-
-            prev_value: The previous value of this machine variable, e.g. what
-            it was before the current value.
-
-            change: If the machine variable just changed, this will be the
-            amount of the change. If it's not possible to determine a numeric
-            change (for example, if this machine variable is a list), then this
-            *change* value will be set to the boolean *True*.
-            '''
-
-            if self.machine_var_monitor:
-                for callback in self.monitors['machine_vars']:
-                    callback(name=name, value=value,
-                             prev_value=prev_value, change=change)
+        self.machine_vars.set_value(name, value)
 
     def remove_machine_var(self, name: str) -> None:
         """Remove a machine variable by name.
@@ -867,11 +847,8 @@ class MachineController(LogMixin):
         Args:
             name: String name of the variable you want to remove.
         """
-        try:
-            del self.machine_vars[name]
-            self.machine_var_data_manager.remove_key(name)
-        except KeyError:
-            pass
+        if self.machine_vars.remove(name):
+            self.machine_var_data_manager.remove_key(name.lower())
 
     def remove_machine_var_search(self, startswith: str='', endswith: str='') -> None:
         """Remove a machine variable by matching parts of its name.
@@ -883,9 +860,9 @@ class MachineController(LogMixin):
         For example, if you pass startswit='player' and endswith='score', this
         method will match and remove player1_score, player2_score, etc.
         """
-        for var in list(self.machine_vars.keys()):
+        for var in list(self.machine_vars):
             if var.startswith(startswith) and var.endswith(endswith):
-                del self.machine_vars[var]
+                self.machine_vars.remove(var)
                 self.machine_var_data_manager.remove_key(var)
 
     def get_platform_sections(self, platform_section: str, overwrite: str) -> "SmartVirtualHardwarePlatform":
@@ -934,4 +911,5 @@ class MachineController(LogMixin):
         '''
 
         ConfigValidator.unload_config_spec()
+        self._log_import_report()
         yield from self.reset()
@@ -0,0 +1,180 @@
+"""Store for machine variables."""
+import sys
+
+from typing import Any, Dict, Iterator, Optional, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:   # pragma: no cover
+    from mpf.core.machine import MachineController
+
+
+class MachineVariable(object):
+
+    """One machine variable."""
+
+    __slots__ = ["name", "value", "persist", "expire_secs", "event_name"]
+
+    def __init__(self, name: str, persist: bool, expire_secs: Optional[int]) -> None:
+        """Initialise machine variable."""
+        self.name = name
+        self.value = None       # type: Any
+        self.persist = persist
+        self.expire_secs = expire_secs
+        self.event_name = sys.intern('machine_var_' + name)
+
+
+class MachineVariables(object):
+
+    """Holds all machine variables.
+
+    Names are case insensitive. They are lowercased once when a variable is
+    created and every other spelling which is used to access it is cached.
+
+    A change only posts the machine_var_(name) event if there is a handler
+    for it (or events are monitored) and only calls monitors if there are
+    any. Persisted variables are marked dirty and written to the data manager
+    in one batch on the next loop iteration.
+    """
+
+    def __init__(self, machine: "MachineController") -> None:
+        """Initialise machine variable store."""
+        self.machine = machine
+        self.data_manager = None
+        self._vars = dict()             # type: Dict[str, MachineVariable]
+        self._lookup = dict()           # type: Dict[str, MachineVariable]
+        self._dirty = set()             # type: Set[MachineVariable]
+        self._save_handle = None
+
+    def _get(self, name: str) -> Optional[MachineVariable]:
+        """Return a variable by name in any spelling."""
+        try:
+            return self._lookup[name]
+        except KeyError:
+            var = self._vars.get(name.lower())
+            if var:
+                self._lookup[name] = var
+            return var
+
+    def __contains__(self, name: str) -> bool:
+        """Return true if variable exists."""
+        return self._get(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over all variable names."""
+        return iter(list(self._vars))
+
+    def items(self) -> Iterator[Tuple[str, MachineVariable]]:
+        """Return names and variables."""
+        return iter(list(self._vars.items()))
+
+    def get_value(self, name: str) -> Any:
+        """Return the value of a variable or None if it does not exist."""
+        var = self._get(name)
+        return var.value if var else None
+
+    def configure(self, name: str, persist: bool, expire_secs: int=None) -> MachineVariable:
+        """Create a variable or change its persistence."""
+        var = self._get(name)
+        if var:
+            var.persist = persist
+            var.expire_secs = expire_secs
+            return var
+
+        var = MachineVariable(sys.intern(name.lower()), persist, expire_secs)
+        self._vars[var.name] = var
+        self._lookup[name] = var
+        return var
+
+    def set_value(self, name: str, value: Any) -> None:
+        """Set the value of a variable and notify subscribers if it changed."""
+        var = self._get(name)
+        if not var:
+            var = self.configure(name, persist=False)
+            prev_value = None
+            change = True
+        else:
+            prev_value = var.value
+            if value == prev_value and type(value) is type(prev_value):
+                return
+            try:
+                change = value - prev_value
+            except TypeError:
+                change = prev_value != value
+
+        var.value = value
+
+        if not change:
+            return
+
+        if var.persist:
+            self._mark_dirty(var)
+
+        machine = self.machine
+        if var.event_name in machine.events.registered_handlers or machine.events.monitor_events:
+            machine.events.post(var.event_name,
+                                value=value,
+                                prev_value=prev_value,
+                                change=change)
+            '''event: machine_var_(name)
+
+            desc: Posted when a machine variable is added or changes value.
+            (Machine variables are like player variables, except they're
+            maintained machine-wide instead of per-player or per-game.)
+
+            args:
+
+            value: The new value of this machine variable.
+
+            prev_value: The previous value of this machine variable, e.g. what
+            it was before the current value.
+
+            change: If the machine variable just changed, this will be the
+            amount of the change. If it's not possible to determine a numeric
+            change (for example, if this machine variable is a list), then this
+            *change* value will be set to the boolean *True*.
+            '''
+
+        if machine.machine_var_monitor:
+            for callback in machine.monitors['machine_vars']:
+                callback(name=name, value=value,
+                         prev_value=prev_value, change=change)
+
+    def remove(self, name: str) -> bool:
+        """Remove a variable. Return true if it existed."""
+        var = self._get(name)
+        if not var:
+            return False
+
+        del self._vars[var.name]
+        self._dirty.discard(var)
+        for alias in [alias for alias, aliased_var in self._lookup.items() if aliased_var is var]:
+            del self._lookup[alias]
+        return True
+
+    def _mark_dirty(self, var: MachineVariable):
+        """Save var on the next loop iteration together with all other changes."""
+        self._dirty.add(var)
+        if not self._save_handle:
+            self._save_handle = self.machine.clock.loop.call_soon(self.save)
+
+    def save(self, **kwargs):
+        """Write all changed persistent variables to the data manager."""
+        del kwargs
+        self._save_handle = None
+        if not self._dirty:
+            return
+
+        dirty = self._dirty
+        self._dirty = set()
+
+        if not self.data_manager or not self.machine.config['mpf']['save_machine_vars_to_disk']:
+            return
+
+        current_time = self.machine.clock.get_time()
+        disk_vars = dict()
+        for var in dirty:
+            disk_var = {'value': var.value}
+            if var.expire_secs:
+                disk_var['expire'] = current_time + var.expire_secs
+            disk_vars[var.name] = disk_var
+
+        self.data_manager.save_keys(disk_vars)
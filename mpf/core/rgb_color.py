@@ -166,6 +166,8 @@ class RGBColor(object):
 
     """One RGB Color."""
 
+    __slots__ = ["_color"]
+
     def __init__(self, color: Union["RGBColor", str, List[int], Tuple[int, int, int]]=None) -> None:
         """Initialise color."""
         if isinstance(color, RGBColor):
@@ -179,7 +181,9 @@ class RGBColor(object):
 
     def __eq__(self, other):
         """Return true if equal."""
-        return RGBColor(other).rgb == self.rgb
+        if isinstance(other, RGBColor):
+            return other.rgb == self._color
+        return RGBColor(other).rgb == self._color
 
     def __ne__(self, other):
         """Return true if not equal."""
@@ -546,6 +550,10 @@ class RGBColorCorrectionProfile(object):
         """
         return self._name
 
+    def lookup(self, channel: int, value: int) -> int:
+        """Return the corrected value for one channel (0..2) of a color."""
+        return self._lookup_table[channel][value]
+
     def apply(self, color) -> RGBColor:
         """Apply the current color correction profile to the specified RGBColor object.
 
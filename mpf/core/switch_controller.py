@@ -8,13 +8,16 @@ import logging
 from collections import defaultdict, namedtuple
 import asyncio
 from functools import partial
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, TYPE_CHECKING, Iterable, Set, Tuple
 
 from mpf.core.case_insensitive_dict import CaseInsensitiveDict
 from mpf.core.machine import MachineController
 from mpf.core.mpf_controller import MpfController
 from mpf.devices.switch import Switch
 
+if TYPE_CHECKING:   # pragma: no cover
+    from mpf.core.input_journal import InputJournal
+
 MonitoredSwitchChange = namedtuple("MonitoredSwitchChange", ["name", "label", "platform", "num", "state"])
 SwitchHandler = namedtuple("SwitchHandler", ["switch_name", "callback", "state", "ms"])
 RegisteredSwitch = namedtuple("RegisteredSwitch", ["ms", "callback"])
@@ -56,6 +59,10 @@ class SwitchController(MpfController):
 
         self.monitors = list()      # type: List[Callable[[MonitoredSwitchChange], None]]
 
+        self.input_journal = None   # type: InputJournal
+        # set by the input journal while it is recording. only changes from
+        # platforms are recorded (see process_switch_by_num)
+
     def register_switch(self, name):
         """Add the name of a switch to the switch controller for tracking.
 
@@ -229,7 +236,7 @@ class SwitchController(MpfController):
 
         self.switches[switch_name] = SwitchState(state=state, time=timestamp)
 
-    def process_switch_by_num(self, num, state, platform, logical=False):
+    def process_switch_by_num(self, num, state, platform, logical=False, timestamp=None):
         """Process a switch state change by switch number.
 
         Args:
@@ -242,11 +249,15 @@ class SwitchController(MpfController):
                 open), then the logical and physical states will be the same.
                 NC (normally closed) switches will have physical and
                 logical states that are inverted from each other.
+            timestamp: Optional time.monotonic() when the platform received
+                the change. Only used for latency tracing.
 
         """
         for switch in self.machine.switches:
             if switch.hw_switch.number == num and switch.platform == platform:
-                self.process_switch_obj(obj=switch, state=state, logical=logical)
+                if self.input_journal:
+                    self.input_journal.record_switch(switch.name, state, logical)
+                self.process_switch_obj(obj=switch, state=state, logical=logical, timestamp=timestamp)
                 return
 
         self.debug_log("Unknown switch %s change to state %s on platform %s", num, state, platform)
@@ -292,7 +303,7 @@ class SwitchController(MpfController):
 
         self.process_switch_obj(obj, state, logical)
 
-    def process_switch_obj(self, obj: Switch, state, logical):
+    def process_switch_obj(self, obj: Switch, state, logical, timestamp=None):
         """Process a new switch state change for a switch by name.
 
         Args:
@@ -308,6 +319,8 @@ class SwitchController(MpfController):
                 hardware will send switch states in their raw (logical=False)
                 states, but other interfaces like the keyboard and OSC will use
                 logical=True.
+            timestamp: Optional time.monotonic() when the platform received
+                the change. Only used for latency tracing.
 
         This is the method that is called by the platform driver whenever a
         switch changes state. It's also used by the "other" modules that
@@ -370,8 +383,13 @@ class SwitchController(MpfController):
         # Update the switch controller's logical state for this switch
         self.set_state(obj.name, state)
 
+        trace = self.machine.latency_tracer.start(obj.name, state, timestamp)
+
         self._call_handlers(obj.name, state)
 
+        if trace:
+            self.machine.latency_tracer.finish(trace, "switch")
+
         self._cancel_timed_handlers(obj.name, state)
 
         for monitor in self.monitors:
@@ -430,8 +448,7 @@ class SwitchController(MpfController):
 
     def _future_done(self, handlers: List[SwitchHandler], future: asyncio.Future):
         del future
-        for handler in handlers:
-            self.remove_switch_handler_by_key(handler)
+        self.remove_switch_handlers_by_keys(handlers)
 
     @staticmethod
     def _wait_handler(_future: asyncio.Future, **kwargs):
@@ -569,6 +586,35 @@ class SwitchController(MpfController):
         self.remove_switch_handler(switch_handler.switch_name, switch_handler.callback, switch_handler.state,
                                    switch_handler.ms)
 
+    def remove_switch_handlers_by_keys(self, switch_handlers: Iterable[SwitchHandler]):
+        """Remove multiple switch handlers by keys returned from add_switch_handler.
+
+        Every switch and the timed switches are only visited once no matter how
+        many handlers are removed.
+        """
+        handlers_by_entry_key = {}     # type: Dict[str, Set[Tuple[Any, int]]]
+        timed_handlers = set()
+        for switch_handler in switch_handlers:
+            self.debug_log(
+                "Removing switch handler. Switch: %s, State: %s, ms: %s",
+                switch_handler.switch_name, switch_handler.state, switch_handler.ms)
+            entry_key = str(switch_handler.switch_name) + '-' + str(switch_handler.state)
+            handlers_by_entry_key.setdefault(entry_key, set()).add((switch_handler.callback, switch_handler.ms))
+            timed_handlers.add(TimedSwitchHandler(callback=switch_handler.callback,
+                                                  switch_name=switch_handler.switch_name,
+                                                  state=switch_handler.state,
+                                                  ms=switch_handler.ms))
+
+        for entry_key, handlers in handlers_by_entry_key.items():
+            if entry_key in self.registered_switches:
+                self.registered_switches[entry_key][:] = [
+                    settings for settings in self.registered_switches[entry_key]
+                    if (settings.callback, settings.ms) not in handlers]
+
+        if self.active_timed_switches:
+            for timed_entry in self.active_timed_switches.values():
+                timed_entry[:] = [entry for entry in timed_entry if entry not in timed_handlers]
+
     def remove_switch_handler(self, switch_name, callback, state=1, ms=0):
         """Remove a registered switch handler.
 
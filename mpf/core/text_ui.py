@@ -2,7 +2,7 @@
 from collections import OrderedDict
 from datetime import datetime
 import logging
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, Dict, Tuple
 
 from asciimatics.screen import Screen
 from psutil import cpu_percent, virtual_memory, Process
@@ -15,7 +15,21 @@ if TYPE_CHECKING:   # pragma: no cover
 
 
 class TextUi(MpfController):
-    """Handles the text-based UI"""
+    """Handles the text-based UI.
+
+    All output goes through a cell buffer. Only cells which changed since the
+    last redraw are printed and redraws are limited to max_refresh_rate per
+    second so that a busy machine is not slowed down by its own monitor.
+    Cells are printed in the order in which they were set. A cell which is
+    (partly) overwritten by another one is printed again the next time it is
+    set.
+    """
+
+    max_refresh_rate = 10
+    """Maximum number of screen redraws per second."""
+
+    stats_interval = 5
+    """Seconds between two reads of the system and process stats."""
 
     def __init__(self, machine: "MachineController") -> None:
         """Initialize TextUi."""
@@ -29,11 +43,22 @@ class TextUi(MpfController):
 
         self.start_time = datetime.now()
         self.machine = machine
+        self._cells = {}        # type: Dict[int, Dict[int, Tuple[str, int, int]]]
+        # cells on screen by row and column
+        self._dirty_cells = OrderedDict()   # type: Dict[Tuple[int, int], Tuple[str, int, int]]
+        self._render_handle = None
+        self._last_render = 0
+        self._last_tick = self.machine.clock.get_time()
+        self._last_stats = None
+        self._last_stats_time = 0
+        self._events_processed = 0
+        self._max_lag = 0
         self._tick_task = self.machine.clock.schedule_interval(self._tick, 1)
         self.screen = Screen.open()
         self.mpf_process = Process()
         self.ball_devices = list()
         self.switches = OrderedDict()
+        self._switches_by_name = {}
         self.player_start_row = 0
         self.column_positions = [0, .25, .5, .75]
         self.columns = [0] * len(self.column_positions)
@@ -61,6 +86,50 @@ class TextUi(MpfController):
         self._bcp_status = (0, 0, 0)  # type: Tuple[float, int, int]
 
         self._draw_screen()
+        self._render()
+
+    def _print_at(self, text, x, y, colour=7, bg=0):
+        """Print text at a position on the next redraw if it changed."""
+        cell = (text, colour, bg)
+        # cells are printed in order. a cell set again goes to the end
+        self._dirty_cells.pop((x, y), None)
+        if self._cells.get(y, {}).get(x) == cell:
+            return
+
+        # cells below this text have to be printed again when they are set
+        self._forget_overlapping_cells(text, x, y)
+        self._dirty_cells[(x, y)] = cell
+        if not self._render_handle:
+            delay = max(0, self._last_render + 1 / self.max_refresh_rate - self.machine.clock.get_time())
+            self._render_handle = self.machine.clock.schedule_once(self._render, delay)
+
+    def _forget_overlapping_cells(self, text, x, y):
+        """Remove cells from the cache which text at x, y overlaps."""
+        row = self._cells.get(y)
+        if not row:
+            return
+        end = x + len(text)
+        for other_x, (other_text, _, _) in list(row.items()):
+            if other_x != x and other_x < end and x < other_x + len(other_text):
+                del row[other_x]
+
+    def _render(self):
+        """Print all changed cells and refresh the screen."""
+        if self._render_handle:
+            self._render_handle.cancel()
+            self._render_handle = None
+        self._last_render = self.machine.clock.get_time()
+
+        if not self._dirty_cells:
+            return
+
+        for (x, y), (text, colour, bg) in self._dirty_cells.items():
+            self.screen.print_at(text, x, y, colour=colour, bg=bg)
+            # cells printed before in this redraw may be overwritten
+            self._forget_overlapping_cells(text, x, y)
+            self._cells.setdefault(y, {})[x] = (text, colour, bg)
+        self._dirty_cells.clear()
+
         self.screen.refresh()
 
     def _init(self, **kwargs):
@@ -96,21 +165,21 @@ class TextUi(MpfController):
             mpf._version.__version__)
         padding = int((self.screen.width - len(title)) / 2)
 
-        self.screen.print_at((' ' * padding) + title + (' ' * (padding + 1)),
-                             0, 0, colour=7, bg=1)
+        self._print_at((' ' * padding) + title + (' ' * (padding + 1)),
+                       0, 0, colour=7, bg=1)
 
-        self.screen.print_at('<CTRL+C> TO EXIT', width-16, 0, colour=0, bg=1)
+        self._print_at('<CTRL+C> TO EXIT', width-16, 0, colour=0, bg=1)
 
-        self.screen.print_at('ACTIVE MODES', self.columns[0], 2)
-        self.screen.print_at('SWITCHES', int((width * .5) - 8), 2)
-        self.screen.print_at('BALL COUNTS', self.columns[3], 2)
-        self.screen.print_at('-' * width, 0, 3)
+        self._print_at('ACTIVE MODES', self.columns[0], 2)
+        self._print_at('SWITCHES', int((width * .5) - 8), 2)
+        self._print_at('BALL COUNTS', self.columns[3], 2)
+        self._print_at('-' * width, 0, 3)
 
-        self.screen.print_at(self.machine.machine_path, 0, height-2, colour=3)
+        self._print_at(self.machine.machine_path, 0, height-2, colour=3)
 
         if 0 < self._asset_percent < 100:
-            self.screen.print_at(' ' * width, 0, int(height / 2) + 1, bg=3)
-            self.screen.print_at(
+            self._print_at(' ' * width, 0, int(height / 2) + 1, bg=3)
+            self._print_at(
                 'LOADING ASSETS: {}%'.format(self._asset_percent),
                 int(width / 2) - 10, int(height / 2) + 1, colour=0, bg=3)
 
@@ -118,8 +187,8 @@ class TextUi(MpfController):
             bcp_string = 'WAITING FOR MEDIA CONTROLLER {}...'.format(
                 self._pending_bcp_connection)
 
-            self.screen.print_at(' ' * width, 0, int(height / 2) - 1, bg=3)
-            self.screen.print_at(
+            self._print_at(' ' * width, 0, int(height / 2) - 1, bg=3)
+            self._print_at(
                 bcp_string, int((width - len(bcp_string)) / 2),
                 int(height / 2) - 1, colour=0, bg=3)
 
@@ -129,11 +198,11 @@ class TextUi(MpfController):
         self.player_start_row = (
             len(self.ball_devices) + len(self.machine.playfields)) + 7
 
-        self.screen.print_at('CURRENT PLAYER', self.columns[3],
-                             self.player_start_row-2)
-        self.screen.print_at('-' * (int(self.screen.width * .75) + 1),
-                             self.columns[3],
-                             self.player_start_row-1)
+        self._print_at('CURRENT PLAYER', self.columns[3],
+                       self.player_start_row-2)
+        self._print_at('-' * (int(self.screen.width * .75) + 1),
+                       self.columns[3],
+                       self.player_start_row-1)
         self._update_player()
 
     def _update_stats(self):
@@ -144,23 +213,38 @@ class TextUi(MpfController):
         mins, sec = divmod(rt.seconds + rt.days * 86400, 60)
         hours, mins = divmod(mins, 60)
         time_string = 'RUNNING {:d}:{:02d}:{:02d}'.format(hours, mins, sec)
-        self.screen.print_at(time_string, width - len(time_string),
-                             height-2, colour=2)
+        self._print_at(time_string, width - len(time_string),
+                       height-2, colour=2)
+
+        # psutil is expensive so only read stats every few seconds
+        now = self.machine.clock.get_time()
+        if self._last_stats is not None and now - self._last_stats_time < self.stats_interval:
+            self._print_stats(*self._last_stats)
+            return
+
+        self._last_stats_time = now
+        memory_info = self.mpf_process.memory_info()
+        self._last_stats = (round(virtual_memory().available / 1048576),
+                            round(cpu_percent(interval=None, percpu=False)),
+                            round(self.mpf_process.cpu_percent()),
+                            round(memory_info.rss / 1048576),
+                            round(memory_info.vms / 1048576))
+        self._print_stats(*self._last_stats)
+
+    # pylint: disable-msg=too-many-arguments
+    def _print_stats(self, free_memory, cpu, mpf_cpu, mpf_rss, mpf_vms):
+        height, width = self.screen.dimensions
 
         # System Stats
-        system_str = 'Free Memory (MB): {} CPU:{:3d}%'.format(
-            round(virtual_memory().available / 1048576),
-            round(cpu_percent(interval=None, percpu=False)))
-        self.screen.print_at(system_str, width-len(system_str), height-1,
-                             colour=2)
+        system_str = 'Free Memory (MB): {} CPU:{:3d}%'.format(free_memory, cpu)
+        self._print_at(system_str, width-len(system_str), height-1,
+                       colour=2)
 
         # MPF process stats
         stats_str = 'MPF (CPU RSS/VMS): {}% {}/{} MB    '.format(
-            round(self.mpf_process.cpu_percent()),
-            round(self.mpf_process.memory_info().rss / 1048576),
-            round(self.mpf_process.memory_info().vms / 1048576))
+            mpf_cpu, mpf_rss, mpf_vms)
 
-        self.screen.print_at(stats_str, 0, height-1, colour=6)
+        self._print_at(stats_str, 0, height-1, colour=6)
 
         # MC process stats
         if self._bcp_status != (0, 0, 0):
@@ -169,14 +253,38 @@ class TextUi(MpfController):
                 round(self._bcp_status[1] / 1048576),
                 round(self._bcp_status[2] / 1048576))
 
-            self.screen.print_at(bcp_string,
-                len(stats_str) - 2, height-1, colour=5)
+            self._print_at(bcp_string,
+                           len(stats_str) - 2, height-1, colour=5)
+
+    def _update_loop_health(self):
+        """Show event loop lag, events per second and queue depths."""
+        now = self.machine.clock.get_time()
+        elapsed = now - self._last_tick
+        self._last_tick = now
+
+        # the tick runs once per second. everything above that is lag
+        lag = max(0, elapsed - 1) * 1000
+        self._max_lag = max(self._max_lag, lag)
+
+        events_processed = self.machine.events.events_processed
+        events_per_second = (events_processed - self._events_processed) / elapsed if elapsed else 0
+        self._events_processed = events_processed
+
+        loop_string = 'LOOP LAG: {:.1f} ms (MAX {:.1f})  EVENTS/S: {:.0f}  ' \
+                      'QUEUES: EVENTS {} CALLBACKS {} LOOP {}'.format(
+                          lag, self._max_lag, events_per_second,
+                          len(self.machine.events.event_queue),
+                          len(self.machine.events.callback_queue),
+                          len(getattr(self.machine.clock.loop, "_ready", ())))
+        self._print_at(loop_string.ljust(self.screen.width - 1), 0,
+                       self.screen.height - 3, colour=6)
 
     def _update_switch_layout(self):
         start_row = 4
         cutoff = int(len(self.machine.switches) / 2) + start_row - 1
         row = start_row
         col = 1
+        self._switches_by_name = {}
 
         for sw in sorted(self.machine.switches):
             if sw.invert:
@@ -185,6 +293,7 @@ class TextUi(MpfController):
                 name = sw.name
 
             self.switches[sw] = (name, self.columns[col], row)
+            self._switches_by_name[sw.name] = sw
 
             if row == cutoff:
                 row = start_row
@@ -194,15 +303,23 @@ class TextUi(MpfController):
 
         self._update_switches()
 
-    def _update_switches(self, *args, **kwargs):
-        del args, kwargs
+    def _update_switches(self, change=None, **kwargs):
+        del kwargs
+        if change is not None:
+            # switch monitor. only redraw the switch which changed
+            sw = self._switches_by_name.get(change.name)
+            if sw:
+                self._update_switch(sw, self.switches[sw])
+            return
+
         for sw, info in self.switches.items():
-            if sw.state:
-                self.screen.print_at(*info, colour=0, bg=2)
-            else:
-                self.screen.print_at(*info)
+            self._update_switch(sw, info)
 
-        self.screen.refresh()
+    def _update_switch(self, sw, info):
+        if sw.state:
+            self._print_at(*info, colour=0, bg=2)
+        else:
+            self._print_at(*info)
 
     def _mode_change(self, *args, **kwargs):
         # Have to call this on the next frame since the mode controller's
@@ -215,15 +332,13 @@ class TextUi(MpfController):
         del args
         del kwargs
         modes = self.machine.mode_controller.active_modes
+        width = int(self.screen.width * .25) - 1
 
         for i, mode in enumerate(modes):
-            self.screen.print_at(' ' * (self.columns[0] - 1),
-                                 self.columns[0], i+4)
-            self.screen.print_at('{} ({})'.format(mode.name, mode.priority),
-                                 self.columns[0], i+4)
+            self._print_at('{} ({})'.format(mode.name, mode.priority).ljust(width),
+                           self.columns[0], i+4)
 
-        self.screen.print_at(' ' * (int(self.screen.width * .25) - 1),
-                             self.columns[0], len(modes) + 4)
+        self._print_at(' ' * width, self.columns[0], len(modes) + 4)
 
     def _update_ball_devices(self, **kwargs):
         del kwargs
@@ -232,52 +347,46 @@ class TextUi(MpfController):
 
         try:
             for pf in self.machine.playfields:
-                self.screen.print_at('{}: {} '.format(pf.name, pf.balls),
-                                     self.columns[3], row,
-                                     colour=2 if pf.balls else 7)
+                self._print_at('{}: {} '.format(pf.name, pf.balls),
+                               self.columns[3], row,
+                               colour=2 if pf.balls else 7)
                 row += 1
         except AttributeError:
             pass
 
         for bd in self.ball_devices:
             # extra spaces to overwrite previous chars if the str shrinks
-            self.screen.print_at('{}: {} ({})                   '.format(
+            self._print_at('{}: {} ({})                   '.format(
                 bd.name, bd.balls, bd.state), self.columns[3], row,
                 colour=2 if bd.balls else 7)
             row += 1
 
-    def _update_player(self, **kwargs):
+    def _print_player_rows(self, *rows):
+        width = int(self.screen.width * (1/len(self.columns))) + 1
         for i in range(3):
-            self.screen.print_at(
-                ' ' * (int(self.screen.width * (1/len(self.columns))) + 1),
-                self.columns[3],
-                self.player_start_row + i)
+            text = rows[i] if i < len(rows) else ''
+            self._print_at(text.ljust(width), self.columns[3],
+                           self.player_start_row + i)
+
+    def _update_player(self, **kwargs):
+        del kwargs
         try:
-            self.screen.print_at(
+            self._print_player_rows(
                 'PLAYER: {}'.format(self.machine.game.player.number),
-                self.columns[3], self.player_start_row)
-            self.screen.print_at(
                 'BALL: {}'.format(self.machine.game.player.ball),
-                self.columns[3], self.player_start_row + 1)
-            self.screen.print_at(
-                'SCORE: {:,}'.format(self.machine.game.player.score),
-                self.columns[3], self.player_start_row + 2)
+                'SCORE: {:,}'.format(self.machine.game.player.score))
         except AttributeError:
             self._update_player_no_game()
 
     def _update_player_no_game(self, **kwargs):
-        for i in range(3):
-            self.screen.print_at(
-                ' ' * (int(self.screen.width * (1/len(self.columns))) + 1),
-                self.columns[3],
-                self.player_start_row + i)
-
-        self.screen.print_at('NO GAME IN PROGRESS', self.columns[3],
-                             self.player_start_row)
+        del kwargs
+        self._print_player_rows('NO GAME IN PROGRESS')
 
     def _tick(self):
         if self.screen.has_resized():
             self.screen = Screen.open()
+            # everything has to be drawn again
+            self._cells = {}
             self._update_switch_layout()
             self._update_modes()
             self._draw_screen()
@@ -285,8 +394,8 @@ class TextUi(MpfController):
 
         self.machine.bcp.transport.send_to_all_clients("status_request")
         self._update_stats()
+        self._update_loop_health()
         self._update_ball_devices()
-        self.screen.refresh()
 
     def _bcp_connection_attempt(self, name, host, port, **kwargs):
         del name
@@ -297,8 +406,8 @@ class TextUi(MpfController):
     def _bcp_connected(self, **kwargs):
         del kwargs
         self._pending_bcp_connection = None
-        self.screen.print_at(' ' * self.screen.width,
-                             0, int(self.screen.height / 2) - 1)
+        self._print_at(' ' * self.screen.width,
+                       0, int(self.screen.height / 2) - 1)
 
         self._update_modes()
         self._update_switches()
@@ -319,8 +428,8 @@ class TextUi(MpfController):
     def _asset_load_complete(self, **kwargs):
         del kwargs
         self._asset_percent = 100
-        self.screen.print_at(' ' * self.screen.width,
-                             0, int(self.screen.height / 2) + 1)
+        self._print_at(' ' * self.screen.width,
+                       0, int(self.screen.height / 2) + 1)
 
         self._update_modes()
         self._update_switches()
@@ -332,6 +441,8 @@ class TextUi(MpfController):
 
         if self.screen:
             self.machine.clock.unschedule(self._tick_task)
+            if self._render_handle:
+                self._render_handle.cancel()
             logger = logging.getLogger()
             logger.addHandler(logging.StreamHandler())
             self.screen.close(True)
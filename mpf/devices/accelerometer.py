@@ -1,7 +1,7 @@
 """Contains the Accelerometer device."""
 
 import math
-from typing import Tuple
+from typing import Dict, Sequence, Set, Tuple
 
 from mpf.core.device_monitor import DeviceMonitor
 from mpf.core.machine import MachineController
@@ -39,6 +39,8 @@ class Accelerometer(SystemWideDevice):
         self.history = None     # type: Tuple[float, float, float]
         self.value = None       # type: Tuple[float, float, float]
         self.hw_device = None   # type: AccelerometerPlatformInterface
+        self._active_level_limits = set()   # type: Set[float]
+        self._last_hits = dict()            # type: Dict[float, float]
 
     def _initialize(self):
         """Initialise and configure accelerometer."""
@@ -72,13 +74,59 @@ class Accelerometer(SystemWideDevice):
             dy = y - self.history[1]
             dz = z - self.history[2]
 
-            alpha = 0.95
+            alpha = self.config['filter_alpha']
             self.history = (self.history[0] * alpha + x * (1 - alpha),
                             self.history[1] * alpha + y * (1 - alpha),
                             self.history[2] * alpha + z * (1 - alpha))
 
-        self._handle_hits(dx, dy, dz)
-        self._handle_level()
+        self._handle_hits(self._calculate_vector_length(dx, dy, dz))
+        self._handle_level(x, y, z)
+
+    def update_acceleration_samples(self, samples: Sequence[Tuple[float, float, float]]) -> None:
+        """Process a block of readings from hardware at once.
+
+        All samples run through the same filter as in update_acceleration.
+        Hits are only checked for the strongest sample and the level for the
+        average of the block. Therefore, every event is posted at most once
+        per block.
+        """
+        if not samples:
+            return
+
+        if len(samples) == 1:
+            self.update_acceleration(*samples[0])
+            return
+
+        if self.history:
+            history_x, history_y, history_z = self.history
+        else:
+            history_x, history_y, history_z = samples[0]
+
+        alpha = self.config['filter_alpha']
+        beta = 1 - alpha
+        max_hit = 0.0
+        sum_x = sum_y = sum_z = 0.0
+        for x, y, z in samples:
+            dx = x - history_x
+            dy = y - history_y
+            dz = z - history_z
+            hit = dx * dx + dy * dy + dz * dz
+            if hit > max_hit:
+                max_hit = hit
+
+            history_x = history_x * alpha + x * beta
+            history_y = history_y * alpha + y * beta
+            history_z = history_z * alpha + z * beta
+            sum_x += x
+            sum_y += y
+            sum_z += z
+
+        self.history = (history_x, history_y, history_z)
+        self.value = tuple(samples[-1])
+
+        count = len(samples)
+        self._handle_hits(math.sqrt(max_hit))
+        self._handle_level(sum_x / count, sum_y / count, sum_z / count)
 
     def get_level_xyz(self) -> float:
         """Return current 3D level."""
@@ -101,31 +149,62 @@ class Accelerometer(SystemWideDevice):
                                      self.config['level_z'],
                                      0.0, self.value[1], self.value[2])
 
-    def _handle_level(self) -> None:
-        deviation_xyz = self.get_level_xyz()
-        deviation_xz = self.get_level_xz()
-        deviation_yz = self.get_level_yz()
-
-        for max_deviation in self.config['level_limits']:
-            if deviation_xyz / math.pi * 180 > max_deviation:
-                self.debug_log("Deviation x: %s, y: %s, total: %s",
-                               deviation_xz / math.pi * 180,
-                               deviation_yz / math.pi * 180,
-                               deviation_xyz / math.pi * 180)
-                self.machine.events.post(
-                    self.config['level_limits'][max_deviation],
-                    deviation_xyz=deviation_xyz,
-                    deviation_xz=deviation_xz,
-                    deviation_yz=deviation_yz)
-
-    def _handle_hits(self, dx: float, dy: float, dz: float) -> None:
-        acceleration = self._calculate_vector_length(dx, dy, dz)
-        for min_acceleration in self.config['hit_limits']:
-            if acceleration > min_acceleration:
-                self.debug_log("Received hit of %s > %s. Posting %s",
-                               acceleration,
-                               min_acceleration,
-                               self.config['hit_limits'][min_acceleration]
-                               )
-                self.machine.events.post(
-                    self.config['hit_limits'][min_acceleration])
+    def _handle_level(self, x: float, y: float, z: float) -> None:
+        if not self.config['level_limits']:
+            return
+
+        level_x = self.config['level_x']
+        level_y = self.config['level_y']
+        level_z = self.config['level_z']
+        deviation_xyz = self._calculate_angle(level_x, level_y, level_z, x, y, z)
+        deviation = deviation_xyz / math.pi * 180
+        hysteresis = self.config['level_hysteresis']
+        deviation_xz = deviation_yz = None
+
+        for max_deviation, event in self.config['level_limits'].items():
+            if deviation <= max_deviation:
+                if hysteresis is not None and deviation < max_deviation - hysteresis:
+                    self._active_level_limits.discard(max_deviation)
+                continue
+
+            if hysteresis is not None:
+                if max_deviation in self._active_level_limits:
+                    continue
+                self._active_level_limits.add(max_deviation)
+
+            if deviation_xz is None:
+                deviation_xz = self._calculate_angle(level_x, 0.0, level_z, x, 0.0, z)
+                deviation_yz = self._calculate_angle(0.0, level_y, level_z, 0.0, y, z)
+
+            self.debug_log("Deviation x: %s, y: %s, total: %s",
+                           deviation_xz / math.pi * 180,
+                           deviation_yz / math.pi * 180,
+                           deviation)
+            self.machine.events.post(
+                event,
+                deviation_xyz=deviation_xyz,
+                deviation_xz=deviation_xz,
+                deviation_yz=deviation_yz)
+
+    def _handle_hits(self, acceleration: float) -> None:
+        if not self.config['hit_limits']:
+            return
+
+        debounce = self.config['hit_debounce'] / 1000
+        current_time = self.machine.clock.get_time() if debounce else None
+        for min_acceleration, event in self.config['hit_limits'].items():
+            if acceleration <= min_acceleration:
+                continue
+
+            if debounce:
+                last_hit = self._last_hits.get(min_acceleration)
+                if last_hit is not None and current_time - last_hit < debounce:
+                    continue
+                self._last_hits[min_acceleration] = current_time
+
+            self.debug_log("Received hit of %s > %s. Posting %s",
+                           acceleration,
+                           min_acceleration,
+                           event
+                           )
+            self.machine.events.post(event)
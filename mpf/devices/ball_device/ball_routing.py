@@ -0,0 +1,112 @@
+"""Precomputed routes between ball devices."""
+from collections import deque
+
+from typing import Dict, List, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:   # pragma: no cover
+    from mpf.devices.ball_device.ball_device import BallDevice
+    from mpf.core.machine import MachineController
+
+Path = Tuple["BallDevice", ...]
+
+
+class BallRoutingTable(object):
+
+    """Paths between all ball devices.
+
+    Paths are found by following eject_targets. They never pass a playfield
+    but may end at one. The table is built on the first lookup and stays
+    valid until invalidate is called. Whoever changes eject_targets of a
+    device has to call invalidate.
+
+    Lookups return the same paths as a depth-first search in the order of
+    eject_targets (and sources in the order of ball_devices) would.
+    """
+
+    def __init__(self, machine: "MachineController") -> None:
+        """Initialise routing table."""
+        self.machine = machine
+        self._paths = None          # type: Dict[BallDevice, Dict[BallDevice, Path]]
+        self._troughs = None        # type: Dict[BallDevice, Union[BallDevice, bool]]
+        self._source_paths = None   # type: Dict[BallDevice, List[Path]]
+
+    def invalidate(self):
+        """Forget all paths. They will be computed again on the next lookup."""
+        self._paths = None
+        self._troughs = None
+        self._source_paths = None
+
+    def build(self, **kwargs):
+        """Compute paths for all devices."""
+        del kwargs
+        devices = [device for device in self.machine.ball_devices if not device.is_playfield()]
+
+        self._paths = dict()
+        self._troughs = dict()
+        for device in devices:
+            self._add_paths(device)
+
+        sources = {device: [] for device in devices}    # type: Dict[BallDevice, List[BallDevice]]
+        for device in devices:
+            for target in device.config['eject_targets']:
+                if target in sources:
+                    sources[target].append(device)
+
+        self._source_paths = dict()
+        for device in devices:
+            self._add_source_paths(device, sources)
+
+    def _add_paths(self, device: "BallDevice"):
+        """Store the first path to every target and the first trough in search order."""
+        paths = self._paths[device] = dict()
+        self._troughs[device] = False
+        stack = [(device,)]
+        while stack:
+            path = stack.pop()
+            head = path[-1]
+            if 'trough' in head.tags and not self._troughs[device]:
+                self._troughs[device] = head
+            for target in head.config['eject_targets']:
+                paths.setdefault(target, path + (target,))
+            for target in reversed(head.config['eject_targets']):
+                if not target.is_playfield() and target not in path:
+                    stack.append(path + (target,))
+
+    def _add_source_paths(self, device: "BallDevice", sources: Dict["BallDevice", List["BallDevice"]]):
+        """Store the first path to every device upstream of device in search order."""
+        source_paths = []
+        found = set()
+        stack = [(device,)]
+        while stack:
+            path = stack.pop()
+            head = path[0]
+            if len(path) > 1 and head not in found:
+                found.add(head)
+                source_paths.append(path)
+            for source in reversed(sources[head]):
+                if source not in path:
+                    stack.append((source,) + path)
+
+        self._source_paths[device] = source_paths
+
+    def find_path_to_target(self, source: "BallDevice", target: "BallDevice") -> Union[deque, bool]:
+        """Return a new path from source to target or False if there is none."""
+        if self._paths is None:
+            self.build()
+        path = self._paths[source].get(target)
+        return deque(path) if path else False
+
+    def find_next_trough(self, source: "BallDevice") -> Union["BallDevice", bool]:
+        """Return the trough which source drains to or False."""
+        if self._troughs is None:
+            self.build()
+        return self._troughs[source]
+
+    def find_one_available_ball(self, target: "BallDevice") -> Union[deque, bool]:
+        """Return a new path from an upstream device with an available ball to target or False."""
+        if self._source_paths is None:
+            self.build()
+        for path in self._source_paths[target]:
+            if path[0].available_balls > 0:
+                return deque(path)
+        return False
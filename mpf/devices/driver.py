@@ -185,6 +185,8 @@ class Driver(SystemWideDevice):
         self.debug_log("Enabling Driver")
         self.hw_driver.enable(PulseSettings(power=pulse_power, duration=pulse_ms),
                               HoldSettings(power=hold_power))
+        if self.machine.latency_tracer.current:
+            self.machine.latency_tracer.record_output("driver")
         # inform bcp clients
         self.machine.bcp.interface.send_driver_event(action="enable", name=self.name, number=self.config['number'],
                                                      pulse_ms=pulse_ms, pulse_power=pulse_power, hold_power=hold_power)
@@ -221,6 +223,8 @@ class Driver(SystemWideDevice):
                              callback=self.disable)
             self.hw_driver.enable(PulseSettings(power=pulse_power, duration=0),
                                   HoldSettings(power=pulse_power))
+        if self.machine.latency_tracer.current:
+            self.machine.latency_tracer.record_output("driver")
         # inform bcp clients
         self.machine.bcp.interface.send_driver_event(action="pulse", name=self.name, number=self.config['number'],
                                                      pulse_ms=pulse_ms, pulse_power=pulse_power)
@@ -9,7 +9,7 @@ from typing import Tuple
 from mpf.core.platform import LightsPlatform
 
 from mpf.core.device_monitor import DeviceMonitor
-from mpf.core.rgb_color import RGBColor
+from mpf.core.rgb_color import RGBColor, rgb_min
 from mpf.core.system_wide_device import SystemWideDevice
 from mpf.platforms.interfaces.light_platform_interface import LightPlatformSoftwareFade
 
@@ -34,7 +34,13 @@ class DriverLight(LightPlatformSoftwareFade):
 @DeviceMonitor(_color="color")
 class Light(SystemWideDevice):
 
-    """A light in a pinball machine."""
+    """A light in a pinball machine.
+
+    The state which is touched on every light update lives in slots.
+    """
+
+    __slots__ = ["hw_drivers", "platforms", "default_fade_ms", "_color_correction_profile", "_brightness_lut",
+                 "_hw_driver_callbacks", "stack"]
 
     config_section = 'lights'
     collection = 'lights'
@@ -50,6 +56,8 @@ class Light(SystemWideDevice):
         self.default_fade_ms = None
 
         self._color_correction_profile = None
+        self._brightness_lut = None
+        self._hw_driver_callbacks = list()
 
         self.stack = list()
         """A list of dicts which represents different commands that have come
@@ -164,6 +172,10 @@ class Light(SystemWideDevice):
             channel = self.machine.config_validator.validate_config("light_channels", channel)
             self.hw_drivers[color] = self._load_hw_driver(channel)
 
+        # create the fade callbacks once instead of on every update
+        self._hw_driver_callbacks = [(hw_driver, partial(self._get_brightness_and_fade, color=color))
+                                     for color, hw_driver in self.hw_drivers.items()]
+
     def _load_hw_driver(self, channel):
         """Load one channel."""
         if channel['platform'] == "drivers":
@@ -176,6 +188,7 @@ class Light(SystemWideDevice):
 
     def _initialize(self):
         self._load_hw_drivers()
+        self.update_brightness_lut()
 
         self.config['default_on_color'] = RGBColor(self.config['default_on_color'])
 
@@ -212,6 +225,11 @@ class Light(SystemWideDevice):
 
         """
         self._color_correction_profile = profile
+        self.update_brightness_lut()
+
+    def update_brightness_lut(self):
+        """Fetch the brightness table for the current brightness setting and color correction profile."""
+        self._brightness_lut = self.machine.light_controller.get_brightness_lut(self._color_correction_profile)
 
     def color(self, color, fade_ms=None, priority=0, key=None):
         """Add or update a color entry in this light's stack, which is how you tell this light what color you want it to be.
@@ -280,35 +298,107 @@ class Light(SystemWideDevice):
         self.color(color=RGBColor(), fade_ms=fade_ms, priority=priority,
                    key=key)
 
-    def _add_to_stack(self, color, fade_ms, priority, key):
-        curr_color = self.get_color()
+    @staticmethod
+    def color_lights(lights, color, fade_ms=None, priority=0, key=None):
+        """Set the same color on a list of lights.
 
-        self._remove_from_stack_by_key(key)
+        This works like calling color() on every light. However, lights which
+        are in the same state share one stack entry (and therefore the fade
+        calculation) and every platform is only synced once.
 
+        Args:
+            lights: list of lights
+            color: RGBColor() instance, or a string color name, hex value, or
+                3-integer list/tuple of colors.
+            fade_ms: Fade in ms. None uses the default fade of every light.
+            priority: priority on stack
+            key: key for removal later on
+        """
+        if not isinstance(color, RGBColor):
+            color = RGBColor(color)
+
+        Light.set_colors([(light, color) for light in lights], fade_ms, priority, key)
+
+    @staticmethod
+    def set_colors(light_colors, fade_ms=None, priority=0, key=None):
+        """Set a color per light with the same fade, priority and key.
+
+        Like color_lights() but every light gets its own RGBColor. Lights
+        which fade between the same colors share one stack entry.
+
+        Args:
+            light_colors: list of (light, RGBColor) tuples
+            fade_ms: Fade in ms. None uses the default fade of every light.
+            priority: priority on stack
+            key: key for removal later on
+        """
+        if not light_colors:
+            return
+
+        entries = dict()
+        platforms = set()
+        for light, color in light_colors:
+            if priority < light._get_priority_from_key(key):    # pylint: disable-msg=protected-access
+                continue
+
+            light_fade_ms = light.default_fade_ms if fade_ms is None else fade_ms
+            start_color = light.get_color()
+            entry_key = (start_color.rgb, color.rgb, light_fade_ms)
+            if entry_key not in entries:
+                entries[entry_key] = light._create_stack_entry(     # pylint: disable-msg=protected-access
+                    color, light_fade_ms, priority, key, start_color)
+
+            light._add_stack_entry(entries[entry_key])      # pylint: disable-msg=protected-access
+            light._set_fades()      # pylint: disable-msg=protected-access
+            platforms.update(light.platforms)
+
+        for platform in platforms:
+            platform.light_sync()
+
+        machine = light_colors[0][0].machine
+        if machine.latency_tracer.current:
+            machine.latency_tracer.record_output("light")
+
+    def _create_stack_entry(self, color, fade_ms, priority, key, start_color):
+        """Return a stack entry which fades from start_color to color."""
+        current_time = self.machine.clock.get_time()
         if fade_ms:
-            new_color = curr_color
-            dest_time = self.machine.clock.get_time() + (fade_ms / 1000)
+            new_color = start_color
+            dest_time = current_time + (fade_ms / 1000)
         else:
             new_color = color
             dest_time = 0
 
-        self.stack.append(dict(priority=priority,
-                               start_time=self.machine.clock.get_time(),
-                               start_color=curr_color,
-                               dest_time=dest_time,
-                               dest_color=color,
-                               color=new_color,
-                               key=key))
+        return dict(priority=priority,
+                    start_time=current_time,
+                    start_color=start_color,
+                    dest_time=dest_time,
+                    dest_color=color,
+                    color=new_color,
+                    key=key)
 
+    def _add_stack_entry(self, entry):
+        """Add an entry to the stack and replace entries with the same key.
+
+        Entries are never changed after they have been created. Therefore, they
+        may be shared between lights.
+        """
+        self._remove_from_stack_by_key(entry['key'])
+        self.stack.append(entry)
         self.stack.sort(key=itemgetter('priority', 'start_time'), reverse=True)
 
+    def _add_to_stack(self, color, fade_ms, priority, key):
+        curr_color = self.get_color()
+        entry = self._create_stack_entry(color, fade_ms, priority, key, curr_color)
+        self._add_stack_entry(entry)
+
         self.debug_log("+-------------- Adding to stack ----------------+")
         self.debug_log("priority: %s", priority)
-        self.debug_log("start_time: %s", self.machine.clock.get_time())
+        self.debug_log("start_time: %s", entry['start_time'])
         self.debug_log("start_color: %s", curr_color)
-        self.debug_log("dest_time: %s", dest_time)
+        self.debug_log("dest_time: %s", entry['dest_time'])
         self.debug_log("dest_color: %s", color)
-        self.debug_log("color: %s", new_color)
+        self.debug_log("color: %s", entry['color'])
         self.debug_log("key: %s", key)
 
         self._schedule_update()
@@ -331,13 +421,19 @@ class Light(SystemWideDevice):
         self.debug_log("Removing key '%s' from stack", key)
         self.stack[:] = [x for x in self.stack if x['key'] != key]
 
+    def _set_fades(self):
+        for hw_driver, callback in self._hw_driver_callbacks:
+            hw_driver.set_fade(callback)
+
     def _schedule_update(self):
-        for color, hw_driver in self.hw_drivers.items():
-            hw_driver.set_fade(partial(self._get_brightness_and_fade, color=color))
+        self._set_fades()
 
         for platform in self.platforms:
             platform.light_sync()
 
+        if self.machine.latency_tracer.current:
+            self.machine.latency_tracer.record_output("light")
+
     def clear_stack(self):
         """Remove all entries from the stack and resets this light to 'off'."""
         self.stack[:] = []
@@ -383,35 +479,41 @@ class Light(SystemWideDevice):
         if self._color_correction_profile is None:
             return color
         else:
-
+            corrected_color = self._color_correction_profile.apply(color)
             self.debug_log("Applying color correction: %s (applied "
                            "'%s' color correction profile)",
-                           self._color_correction_profile.apply(color),
+                           corrected_color,
                            self._color_correction_profile.name)
 
-            return self._color_correction_profile.apply(color)
+            return corrected_color
 
-    def _get_color_and_fade(self, max_fade_ms: int) -> Tuple[RGBColor, int]:
+    def _get_rgb_and_fade(self, max_fade_ms: int) -> Tuple[Tuple[int, int, int], int]:
         try:
             color_settings = self.stack[0]
         except IndexError:
             # no stack
-            return RGBColor('off'), -1
+            return rgb_min, -1
 
         # no fade
         if not color_settings['dest_time']:
-            return color_settings['dest_color'], -1
+            return color_settings['dest_color'].rgb, -1
 
         current_time = self.machine.clock.get_time()
 
         # fade is done
         if current_time >= color_settings['dest_time']:
-            return color_settings['dest_color'], -1
+            return color_settings['dest_color'].rgb, -1
 
         target_time = current_time + (max_fade_ms / 1000.0)
         # check if fade will be done before max_fade_ms
         if target_time > color_settings['dest_time']:
-            return color_settings['dest_time'], int((color_settings['dest_time'] - current_time) / 1000)
+            return color_settings['dest_color'].rgb, int((color_settings['dest_time'] - current_time) * 1000)
+
+        # all channels and all lights which share this stack entry get the same result
+        light_controller = self.machine.light_controller
+        cached_settings, cached_time, cached_fade_ms, cached_result = light_controller.last_fade
+        if cached_settings is color_settings and cached_time == current_time and cached_fade_ms == max_fade_ms:
+            return cached_result
 
         # figure out the ratio of how far along we are
         try:
@@ -420,17 +522,33 @@ class Light(SystemWideDevice):
         except ZeroDivisionError:
             ratio = 1.0
 
-        return RGBColor.blend(color_settings['start_color'], color_settings['dest_color'], ratio), max_fade_ms
+        start_red, start_green, start_blue = color_settings['start_color'].rgb
+        dest_red, dest_green, dest_blue = color_settings['dest_color'].rgb
+        result = (start_red + int((dest_red - start_red) * ratio),
+                  start_green + int((dest_green - start_green) * ratio),
+                  start_blue + int((dest_blue - start_blue) * ratio)), max_fade_ms
+        light_controller.last_fade = (color_settings, current_time, max_fade_ms, result)
+        return result
 
-    def _get_brightness_and_fade(self, max_fade_ms: int, color: str) -> Tuple[float, int]:
-        uncorrected_color, fade_ms = self._get_color_and_fade(max_fade_ms)
-        corrected_color = self.gamma_correct(uncorrected_color)
-        corrected_color = self.color_correct(corrected_color)
+    def _get_color_and_fade(self, max_fade_ms: int) -> Tuple[RGBColor, int]:
+        rgb, fade_ms = self._get_rgb_and_fade(max_fade_ms)
+        return RGBColor(rgb), fade_ms
 
-        if color in ["red", "blue", "green"]:
-            brightness = getattr(corrected_color, color) / 255.0
+    def _get_brightness_and_fade(self, max_fade_ms: int, color: str) -> Tuple[float, int]:
+        rgb, fade_ms = self._get_rgb_and_fade(max_fade_ms)
+        lut = self._brightness_lut
+        if lut is None:
+            self.update_brightness_lut()
+            lut = self._brightness_lut
+
+        if color == "red":
+            brightness = lut[0][rgb[0]]
+        elif color == "green":
+            brightness = lut[1][rgb[1]]
+        elif color == "blue":
+            brightness = lut[2][rgb[2]]
         elif color == "white":
-            brightness = min(corrected_color.red, corrected_color.green, corrected_color.blue) / 255.0
+            brightness = min(lut[0][rgb[0]], lut[1][rgb[1]], lut[2][rgb[2]])
         else:
             raise AssertionError("Invalid color {}".format(color))
         return brightness, fade_ms
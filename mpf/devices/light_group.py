@@ -73,9 +73,8 @@ class LightGroup(SystemWideDevice):
         raise NotImplementedError("Implement")
 
     def color(self, color, fade_ms=None, priority=0, key=None):
-        """Call color on all lights in this group."""
-        for light in self.lights:
-            light.color(color, fade_ms, priority, key)
+        """Set color on all lights in this group and sync every platform once."""
+        Light.color_lights(self.lights, color, fade_ms, priority, key)
 
 
 class LightStrip(LightGroup):
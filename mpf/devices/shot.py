@@ -37,9 +37,19 @@ class Shot(ModeDevice, SystemWideDevice):
         self.player = None
         self.active_delays = set()
         self.switch_handlers_active = False
+        self._switch_handlers = list()
+        self._event_handlers = list()
         self.profiles = list()
         self.mode_config = {}
         self.groups = set()  # shot_groups this shot belongs to
+        self.member_groups = set()  # shot_groups which list this shot. enabled or not
+
+        self._profiles_by_mode = dict()
+        # first entry in profiles for every mode. rebuilt when profiles change
+        self._active_profile = None
+        # first enabled entry in profiles
+        self._mode_states = dict()
+        # (profile name, state name) for every mode. shared with member_groups
 
         # todo is this a hack??
         self.machine.events.add_handler('game_ended', self.disable)
@@ -115,19 +125,21 @@ class Shot(ModeDevice, SystemWideDevice):
             return
 
         for switch in self.config['switches']:
-            self.machine.switch_controller.add_switch_handler(
-                switch.name, self.hit, 1)
+            self._switch_handlers.append(self.machine.switch_controller.add_switch_handler(
+                switch.name, self.hit, 1))
 
-        for event in self.config['sequence']:
-            self.machine.events.add_handler(event, self._sequence_advance, event_name=event)
+        with self.machine.events.handler_batch():
+            for event in self.config['sequence']:
+                self._event_handlers.append(
+                    self.machine.events.add_handler(event, self._sequence_advance, event_name=event))
 
         for switch in self.config['cancel_switch']:
-            self.machine.switch_controller.add_switch_handler(
-                switch.name, self._cancel_switch_hit, 1)
+            self._switch_handlers.append(self.machine.switch_controller.add_switch_handler(
+                switch.name, self._cancel_switch_hit, 1))
 
         for switch in list(self.config['delay_switch'].keys()):
-            self.machine.switch_controller.add_switch_handler(
-                switch.name, self._delay_switch_hit, 1, return_info=True)
+            self._switch_handlers.append(self.machine.switch_controller.add_switch_handler(
+                switch.name, self._delay_switch_hit, 1, return_info=True))
 
         self.switch_handlers_active = True
 
@@ -138,19 +150,11 @@ class Shot(ModeDevice, SystemWideDevice):
         self._reset_all_sequences()
         self.delay.clear()
 
-        for switch in self.config['switches']:
-            self.machine.switch_controller.remove_switch_handler(
-                switch.name, self.hit, 1)
-
-        self.machine.events.remove_handler(self._sequence_advance)
-
-        for switch in self.config['cancel_switch']:
-            self.machine.switch_controller.remove_switch_handler(
-                switch.name, self._cancel_switch_hit, 1)
+        self.machine.switch_controller.remove_switch_handlers_by_keys(self._switch_handlers)
+        self._switch_handlers = list()
 
-        for switch in list(self.config['delay_switch'].keys()):
-            self.machine.switch_controller.remove_switch_handler(
-                switch.name, self._delay_switch_hit, 1)
+        self.machine.events.remove_handlers_by_keys(self._event_handlers)
+        self._event_handlers = list()
 
         self.switch_handlers_active = False
 
@@ -716,6 +720,22 @@ class Shot(ModeDevice, SystemWideDevice):
         except TypeError:
             profile['current_state_name'] = None
 
+        self._set_mode_state(mode, (profile['profile'], profile['current_state_name']))
+
+    def _set_mode_state(self, mode, state):
+        """Update the state of a mode and tell all groups about it."""
+        old_state = self._mode_states.get(mode)
+        if old_state == state:
+            return
+
+        if state:
+            self._mode_states[mode] = state
+        else:
+            del self._mode_states[mode]
+
+        for group in self.member_groups:
+            group.shot_state_changed(mode, old_state, state)
+
     @event_handler(2)
     def remove_active_profile(self, mode='default#$%', **kwargs):
         """Remove the active profile."""
@@ -773,6 +793,7 @@ class Shot(ModeDevice, SystemWideDevice):
     def add_profile(self, profile_dict):
         """Add a profile to shot."""
         self.profiles.append(profile_dict)
+        self._update_profile_index()
         self._update_show(mode=profile_dict['mode'], advance=False)
         self._sort_profiles()
 
@@ -834,15 +855,30 @@ class Shot(ModeDevice, SystemWideDevice):
         """Remove profile for mode."""
         self._stop_show(mode)  # todo
         self.profiles[:] = [x for x in self.profiles if x['mode'] != mode]
+        if mode in self._mode_states:
+            self._set_mode_state(mode, None)
         self._process_changed_profiles()
 
     def get_profile_by_key(self, key, value):
         """Return profile for a key value pair."""
+        if key == 'mode':
+            return self._profiles_by_mode.get(value)
+        if key == 'enable' and value is True:
+            return self._active_profile
         try:
             return [x for x in self.profiles if x[key] == value][0]
         except IndexError:
             return None
 
+    def _update_profile_index(self):
+        """Index profiles by mode and find the active one."""
+        self._profiles_by_mode = dict()
+        self._active_profile = None
+        for profile in self.profiles:
+            self._profiles_by_mode.setdefault(profile['mode'], profile)
+            if profile['enable'] and not self._active_profile:
+                self._active_profile = profile
+
     def _sort_profiles(self):
         self.profiles = sorted(self.profiles, key=lambda x: x['priority'],
                                reverse=True)
@@ -851,6 +887,7 @@ class Shot(ModeDevice, SystemWideDevice):
 
     def _process_changed_profiles(self):
         # todo bug? profile[0] disabled should still allow lower ones to work?
+        self._update_profile_index()
 
         if self.get_profile_by_key('enable', True):
             self._register_switch_handlers()
@@ -881,3 +918,15 @@ class Shot(ModeDevice, SystemWideDevice):
                        "group", group)
 
         self.groups.discard(group)
+
+    def add_member_group(self, group):
+        """Add a group which lists this shot.
+
+        The group is told about every state change of this shot from now on.
+        """
+        if group in self.member_groups:
+            return
+
+        self.member_groups.add(group)
+        for mode, state in self._mode_states.items():
+            group.shot_state_changed(mode, None, state)
@@ -36,6 +36,9 @@ class ShotGroup(ModeDevice, SystemWideDevice):
 
         self.mode_config = {}
 
+        self._state_counts = dict()
+        # number of member shots in each (profile, state) for every mode
+
     def _get_mode_config(self, mode):
         try:
             return self.mode_config[mode]
@@ -72,6 +75,21 @@ class ShotGroup(ModeDevice, SystemWideDevice):
 
         self._created_system_wide = True
 
+    def _initialize(self):
+        super()._initialize()
+        for shot in self.config['shots']:
+            shot.add_member_group(self)
+
+    def shot_state_changed(self, mode, old_state, new_state):
+        """Update the state counts when the (profile, state) of a member shot in mode changes."""
+        counts = self._state_counts.setdefault(mode, dict())
+        if old_state:
+            counts[old_state] -= 1
+            if not counts[old_state]:
+                del counts[old_state]
+        if new_state:
+            counts[new_state] = counts.get(new_state, 0) + 1
+
     def overload_config_in_mode(self, mode, config):
         """Overload config in mode."""
         self.mode_config[mode.name] = config
@@ -433,49 +451,41 @@ class ShotGroup(ModeDevice, SystemWideDevice):
         if not self._enabled:
             return
 
-        shot_states = set()
-
         self.debug_log("Checking for complete. mode: %s", mode)
 
-        for shot in self.config['shots']:
+        counts = self._state_counts.get(mode)
+        if not counts or len(counts) != 1:
+            return
 
-            mode_state = shot.get_profile_by_key('mode', mode)
+        (profile, state), count = next(iter(counts.items()))
+        if count != len(set(self.config['shots'])):
+            self.debug_log("Not all shots are used in this mode. Aborting"
+                           " check for complete")
+            return
 
-            if mode_state:
-                shot_states.add((mode_state['profile'],
-                                 mode_state['current_state_name']))
+        self.debug_log(
+            "Shot group is complete with profile :%s, state:"
+            "%s", profile, state)
 
-            else:
-                self.debug_log("Shot %s is not used in this mode. Aborting"
-                               " check for complete", shot)
-                return
-
-        if len(shot_states) == 1:
-            profile, state = shot_states.pop()
-
-            self.debug_log(
-                "Shot group is complete with profile :%s, state:"
-                "%s", profile, state)
-
-            self.machine.events.post(self.name + '_complete')
-            '''event: (shot_group)_complete
-            desc: All the member shots in the shot group called (shot_group)
-            are in the same state.
-            '''
-
-            self.machine.events.post(self.name + '_' + profile + '_complete')
-            '''event: (shot_group)_(profile)_complete
-            desc: All the member shots in the shot group called (shot_group)
-            with the profile called (profile) are in the same state.
-            '''
-
-            self.machine.events.post(self.name + '_' + profile + '_' + state +
-                                     '_complete')
-            '''event: (shot_group)_(profile)_(state)_complete
-            desc: All the member shots in the shot group called (shot_group)
-            with the profile called (profile) are in the same state with the
-            name (state).
-            '''
+        self.machine.events.post(self.name + '_complete')
+        '''event: (shot_group)_complete
+        desc: All the member shots in the shot group called (shot_group)
+        are in the same state.
+        '''
+
+        self.machine.events.post(self.name + '_' + profile + '_complete')
+        '''event: (shot_group)_(profile)_complete
+        desc: All the member shots in the shot group called (shot_group)
+        with the profile called (profile) are in the same state.
+        '''
+
+        self.machine.events.post(self.name + '_' + profile + '_' + state +
+                                 '_complete')
+        '''event: (shot_group)_(profile)_(state)_complete
+        desc: All the member shots in the shot group called (shot_group)
+        with the profile called (profile) are in the same state with the
+        name (state).
+        '''
 
     def add_control_events_in_mode(self, mode):
         """Add control events in mode."""
@@ -17,7 +17,13 @@ if TYPE_CHECKING:   # pragma: no cover
 @DeviceMonitor("state", "recycle_jitter_count")
 class Switch(SystemWideDevice):
 
-    """A switch in a pinball machine."""
+    """A switch in a pinball machine.
+
+    The state which is touched on every switch change lives in slots.
+    """
+
+    __slots__ = ["hw_switch", "platform", "state", "hw_state", "invert", "recycle_secs", "recycle_clear_time",
+                 "recycle_jitter_count"]
 
     config_section = 'switches'
     collection = 'switches'
@@ -0,0 +1,89 @@
+"""Adaptive poll rate for platforms which have to poll for switch changes."""
+import asyncio
+
+
+class AdaptivePollScheduler(object):
+
+    """Decides how long a platform waits between two polls.
+
+    After a poll which returned switch activity the platform polls again right
+    away. Otherwise it waits 1 / poll_hz. Short quiet gaps are normal during
+    play so the rate only drops once there was no switch activity for
+    idle_after seconds (e.g. in attract mode). From then on every idle poll
+    doubles the wait up to 1 / idle_poll_hz. If idle_poll_hz is higher than
+    poll_hz the platform always polls at poll_hz. After a backoff (e.g. a
+    desync) the next wait is 1 / idle_poll_hz, also during play.
+    """
+
+    def __init__(self, clock, poll_hz: int, idle_poll_hz: int, idle_after: float) -> None:
+        """Initialise poll scheduler."""
+        self.clock = clock
+        self.min_interval = 1 / poll_hz
+        self.max_interval = max(1 / idle_poll_hz, self.min_interval)
+        self.idle_after = idle_after
+        self.interval = self.min_interval
+        self._last_activity = clock.get_time()
+        self._backoff = False
+
+        self.polls = 0
+        self.active_polls = 0
+        self.total_poll_time = 0.0
+        self.max_poll_time = 0.0
+        self._poll_start = None     # type: float
+
+    def start_poll(self):
+        """Mark the start of a poll."""
+        self._poll_start = self.clock.get_time()
+
+    def end_poll(self, active: bool):
+        """Mark the end of a poll and adapt the interval.
+
+        Args:
+            active: True if the poll returned switch activity.
+        """
+        if self._poll_start is not None:
+            poll_time = self.clock.get_time() - self._poll_start
+            self.total_poll_time += poll_time
+            if poll_time > self.max_poll_time:
+                self.max_poll_time = poll_time
+            self._poll_start = None
+
+        self.polls += 1
+        if self._backoff:
+            # wait one idle interval after a backoff
+            self._backoff = False
+            self.interval = self.max_interval
+        elif active:
+            self.active_polls += 1
+            self._last_activity = self.clock.get_time()
+            self.interval = self.min_interval
+        elif self.clock.get_time() - self._last_activity >= self.idle_after:
+            self.interval = min(self.interval * 2, self.max_interval)
+        else:
+            self.interval = self.min_interval
+
+    def backoff(self):
+        """Wait the idle interval after the current poll (e.g. after a desync)."""
+        self._backoff = True
+        self.interval = self.max_interval
+
+    @asyncio.coroutine
+    def wait(self, active: bool):
+        """Wait until the next poll.
+
+        Args:
+            active: True if the last poll returned switch activity. There is
+                no wait in that case.
+        """
+        if not active:
+            yield from asyncio.sleep(self.interval, loop=self.clock.loop)
+
+    def get_stats(self) -> dict:
+        """Return poll timing stats."""
+        return {
+            "polls": self.polls,
+            "active_polls": self.active_polls,
+            "avg_poll_ms": self.total_poll_time / self.polls * 1000 if self.polls else None,
+            "max_poll_ms": self.max_poll_time * 1000,
+            "interval_ms": self.interval * 1000,
+        }
@@ -57,6 +57,7 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
         self.machine_type = None
         self.hw_switch_data = None
         self.io_boards = {}     # type: Dict[int, FastIoBoard]
+        self._receive_timestamp = None      # type: float
 
         self.fast_commands = {'ID': lambda x: None,  # processor ID
                               'WX': lambda x: None,  # watchdog
@@ -127,11 +128,13 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
         """Send Watchdog command."""
         self.net_connection.send('WD:' + str(hex(self.config['watchdog']))[2:])
 
-    def process_received_message(self, msg: str):
+    def process_received_message(self, msg: str, timestamp: float=None):
         """Send an incoming message from the FAST controller to the proper method for servicing.
 
         Args:
             msg: messaged which was received
+            timestamp: time.monotonic() when the message was received (only
+                set when latency tracing is enabled)
         """
         if msg == "!SRE":
             # ignore system interrupt
@@ -146,6 +149,7 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
 
         # Can't use try since it swallows too many errors for now
         if cmd in self.fast_commands:
+            self._receive_timestamp = timestamp
             self.fast_commands[cmd](payload)
         else:   # pragma: no cover
             self.log.warning("Received unknown serial command? %s. (This is ok"
@@ -207,6 +211,11 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
             msg = 'RS:' + ','.join(["%s%s" % (led.number, led.current_color) for led in dirty_leds])
             self.rgb_connection.send(msg)
 
+    def get_send_queue_stats(self) -> dict:
+        """Return the send queue depths and counters of all connections by processor."""
+        return {connection.remote_processor: connection.send_queue.get_stats()
+                for connection in self.serial_connections}
+
     def get_hw_switch_states(self):
         """Return hardware states."""
         return self.hw_switch_data
@@ -219,7 +228,8 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
         """
         self.machine.switch_controller.process_switch_by_num(state=0,
                                                              num=(msg, 1),
-                                                             platform=self)
+                                                             platform=self,
+                                                             timestamp=self._receive_timestamp)
 
     def receive_nw_closed(self, msg):
         """Process network switch closed.
@@ -229,7 +239,8 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
         """
         self.machine.switch_controller.process_switch_by_num(state=1,
                                                              num=(msg, 1),
-                                                             platform=self)
+                                                             platform=self,
+                                                             timestamp=self._receive_timestamp)
 
     def receive_local_open(self, msg):
         """Process local switch open.
@@ -239,7 +250,8 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
         """
         self.machine.switch_controller.process_switch_by_num(state=0,
                                                              num=(msg, 0),
-                                                             platform=self)
+                                                             platform=self,
+                                                             timestamp=self._receive_timestamp)
 
     def receive_local_closed(self, msg):
         """Process local switch closed.
@@ -249,7 +261,8 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
         """
         self.machine.switch_controller.process_switch_by_num(state=1,
                                                              num=(msg, 0),
-                                                             platform=self)
+                                                             platform=self,
+                                                             timestamp=self._receive_timestamp)
 
     def receive_sa(self, msg):
         """Receive all switch states.
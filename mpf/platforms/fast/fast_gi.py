@@ -9,6 +9,8 @@ class FASTGIString(LightPlatformSoftwareFade):
 
     """A FAST GI string in a WPC machine."""
 
+    __slots__ = ["log", "number", "send"]
+
     def __init__(self, number, sender, machine, software_fade_ms: int) -> None:
         """Initialise GI string."""
         super().__init__(machine.clock.loop, software_fade_ms)
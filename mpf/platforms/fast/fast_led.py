@@ -45,6 +45,8 @@ class FASTDirectLEDChannel(LightPlatformInterface):
 
     """Represents a single RGB LED channel connected to the Fast hardware platform."""
 
+    __slots__ = ["led", "channel"]
+
     def __init__(self, led: FASTDirectLED, channel) -> None:
         """Initialise LED."""
         self.led = led
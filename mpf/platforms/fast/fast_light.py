@@ -9,6 +9,8 @@ class FASTMatrixLight(LightPlatformSoftwareFade):
 
     """A direct light on a fast controller."""
 
+    __slots__ = ["log", "number", "send"]
+
     def __init__(self, number, sender, machine, fade_interval_ms: int) -> None:
         """Initialise light."""
         super().__init__(machine.clock.loop, fade_interval_ms)
@@ -0,0 +1,146 @@
+"""Prioritised send queue for FAST serial connections."""
+import asyncio
+from collections import deque, OrderedDict
+
+from typing import Any, Dict, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:   # pragma: no cover
+    from typing import Deque
+
+
+class FastSendQueue(object):
+
+    """Prioritised send queue of one FAST serial connection.
+
+    Commands are sent in three priority classes. Driver, rule, switch and all
+    other commands go first and keep their order. LED commands come next and
+    the watchdog last.
+
+    LED colors, DMD frames and watchdog commands which are still queued are
+    replaced by newer ones because only the latest state matters. Driver
+    commands are never coalesced since they may contain one-shot pulses.
+    """
+
+    PRIORITY_DEFAULT = 0
+    PRIORITY_LED = 1
+    PRIORITY_WATCHDOG = 2
+
+    led_commands = ("RS:", "RA:", "RF:")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialise send queue."""
+        self._queues = (deque(), deque(), deque())  # type: Tuple[Deque[Union[str, bytes, memoryview, Dict]], ...]
+        self._not_empty = asyncio.Event(loop=loop)
+
+        self.depth = 0
+        """Number of pending commands. Every pending LED color counts."""
+
+        self.max_depth = 0
+        """Highest number of pending commands seen."""
+
+        self.coalesced = 0
+        """Number of commands which were replaced before they were sent."""
+
+        self.sent = 0
+        """Number of messages taken from the queue."""
+
+    def put(self, msg: Union[str, bytes, memoryview]):
+        """Add a command or a DMD frame to the queue."""
+        cmd = msg[:3] if isinstance(msg, str) else None
+
+        if cmd is None:
+            self._put_frame(msg)
+        elif cmd == "RS:":
+            self._put_led_colors(msg)
+        elif cmd == "WD:":
+            queue = self._queues[self.PRIORITY_WATCHDOG]
+            if queue:
+                queue.clear()
+                self.coalesced += 1
+                self.depth -= 1
+            queue.append(msg)
+            self.depth += 1
+        elif cmd in self.led_commands:
+            self._queues[self.PRIORITY_LED].append(msg)
+            self.depth += 1
+        else:
+            self._queues[self.PRIORITY_DEFAULT].append(msg)
+            self.depth += 1
+
+        if self.depth > self.max_depth:
+            self.max_depth = self.depth
+
+        self._not_empty.set()
+
+    def _put_frame(self, frame: Union[bytes, memoryview]):
+        """Replace a DMD frame which has not been sent yet or queue the frame."""
+        queue = self._queues[self.PRIORITY_DEFAULT]
+        if queue and not isinstance(queue[-1], str):
+            queue[-1] = frame
+            self.coalesced += 1
+        else:
+            queue.append(frame)
+            self.depth += 1
+
+    def _put_led_colors(self, msg: str):
+        """Merge an RS command into the RS command at the end of the LED queue."""
+        queue = self._queues[self.PRIORITY_LED]
+        if queue and isinstance(queue[-1], dict):
+            colors = queue[-1]
+        else:
+            colors = OrderedDict()
+            queue.append(colors)
+
+        for led in msg[3:].split(","):
+            number = led[:-6]
+            if number in colors:
+                self.coalesced += 1
+            else:
+                self.depth += 1
+            colors[number] = led[-6:]
+
+    def get_nowait(self) -> Any:
+        """Return the next command or None if the queue is empty."""
+        for queue in self._queues:
+            if queue:
+                msg = queue.popleft()
+                if isinstance(msg, dict):
+                    self.depth -= len(msg)
+                    msg = "RS:" + ",".join(number + color for number, color in msg.items())
+                else:
+                    self.depth -= 1
+                self.sent += 1
+                return msg
+
+        return None
+
+    @asyncio.coroutine
+    def wait(self):
+        """Wait until a command is queued."""
+        while self.empty():
+            self._not_empty.clear()
+            yield from self._not_empty.wait()
+
+    @asyncio.coroutine
+    def get(self):
+        """Wait for the next command and return it."""
+        while True:
+            yield from self.wait()
+            msg = self.get_nowait()
+            if msg is not None:
+                return msg
+
+    def empty(self) -> bool:
+        """Return true if no commands are queued."""
+        return not any(self._queues)
+
+    def get_stats(self) -> dict:
+        """Return queue depths and counters."""
+        return {
+            "depth_default": len(self._queues[self.PRIORITY_DEFAULT]),
+            "depth_led": sum(len(msg) if isinstance(msg, dict) else 1 for msg in self._queues[self.PRIORITY_LED]),
+            "depth_watchdog": len(self._queues[self.PRIORITY_WATCHDOG]),
+            "max_depth": self.max_depth,
+            "coalesced": self.coalesced,
+            "sent": self.sent,
+        }
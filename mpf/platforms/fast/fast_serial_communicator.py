@@ -6,6 +6,7 @@ from mpf.platforms.base_serial_communicator import BaseSerialCommunicator
 
 # Minimum firmware versions needed for this module
 from mpf.platforms.fast.fast_io_board import FastIoBoard
+from mpf.platforms.fast.fast_send_queue import FastSendQueue
 
 DMD_MIN_FW = '0.88'
 NET_MIN_FW = '0.88'
@@ -63,7 +64,7 @@ class FastSerialCommunicator(BaseSerialCommunicator):
 
         self.received_msg = b''
 
-        self.send_queue = asyncio.Queue(loop=platform.machine.clock.loop)
+        self.send_queue = FastSendQueue(platform.machine.clock.loop)
 
         super().__init__(platform, port, baud)
 
@@ -142,6 +143,9 @@ class FastSerialCommunicator(BaseSerialCommunicator):
             min_version = DMD_MIN_FW
             # latest_version = DMD_LATEST_FW
             self.dmd = True
+            # pause the writer as soon as a frame cannot be written at once. frames will wait (and get replaced by
+            # newer frames) in the send queue until the serial port is ready again.
+            self.writer.transport.set_write_buffer_limits(high=0)
             self.max_messages_in_flight = self.platform.config['dmd_buffer']
             self.platform.debug_log("Setting DMD buffer size: %s",
                                     self.max_messages_in_flight)
@@ -229,17 +233,22 @@ class FastSerialCommunicator(BaseSerialCommunicator):
     def send(self, msg):
         """Send a message to the remote processor over the serial connection.
 
+        Messages are queued by priority. Driver and rule commands are sent
+        before LED updates and the watchdog. See FastSendQueue.
+
         Args:
             msg: String of the message you want to send. THe <CR> character will
                 be added automatically.
 
         """
-        self.send_queue.put_nowait(msg)
+        self.send_queue.put(msg)
 
     def _send(self, msg):
         debug = self.platform.config['debug']
         if self.dmd:
-            self.writer.write(b'BM:' + msg)
+            # two writes instead of writelines which would join header and frame into a new buffer
+            self.writer.write(b'BM:')
+            self.writer.write(msg)
             if debug:
                 self.platform.log.debug("Send: %s", "".join(" 0x%02x" % b for b in msg))
 
@@ -261,7 +270,7 @@ class FastSerialCommunicator(BaseSerialCommunicator):
     @asyncio.coroutine
     def _socket_writer(self):
         while True:
-            msg = yield from self.send_queue.get()
+            yield from self.send_queue.wait()
             try:
                 yield from asyncio.wait_for(self.send_ready.wait(), 1.0, loop=self.machine.clock.loop)
             except asyncio.TimeoutError:
@@ -269,9 +278,16 @@ class FastSerialCommunicator(BaseSerialCommunicator):
                                  "frequently report a bug!", self.port)
                 self.messages_in_flight = 0
 
-            self._send(msg)
+            # take the message only once it can be sent. until then newer
+            # commands may still overtake or be merged into queued ones
+            msg = self.send_queue.get_nowait()
+            if msg is not None:
+                self._send(msg)
+            if self.dmd:
+                yield from self.writer.drain()
 
     def _parse_msg(self, msg):
+        timestamp = self.machine.latency_tracer.stamp()
         self.received_msg += msg
 
         while True:
@@ -299,4 +315,4 @@ class FastSerialCommunicator(BaseSerialCommunicator):
                 continue
 
             if msg.decode() not in self.ignored_messages:
-                self.platform.process_received_message(msg.decode())
+                self.platform.process_received_message(msg.decode(), timestamp)
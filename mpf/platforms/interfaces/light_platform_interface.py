@@ -1,14 +1,20 @@
 """Interface for a light hardware devices."""
 import abc
-import asyncio
+import weakref
 from asyncio import AbstractEventLoop
 
-from typing import Callable, Tuple
+from typing import Callable, Tuple, List, Dict
 
 
 class LightPlatformInterface(metaclass=abc.ABCMeta):
 
-    """Interface for a light in hardware platforms."""
+    """Interface for a light in hardware platforms.
+
+    Machines have hundreds of light channels. Subclasses should declare
+    __slots__ for their attributes to keep them small.
+    """
+
+    __slots__ = []  # type: List[str]
 
     @abc.abstractmethod
     def set_fade(self, color_and_fade_callback: Callable[[int], Tuple[float, int]]):
@@ -21,14 +27,110 @@ class LightPlatformInterface(metaclass=abc.ABCMeta):
         pass
 
 
+class FadeScheduler(object):
+
+    """Advance all running fades of lights which share a loop and fade interval.
+
+    Instead of one timer per fading light there is a single timer which
+    updates every fading light once per tick. Lights join with add and leave
+    either with remove or when their fade finished.
+
+    Schedulers only hold a weak reference to their loop so they go away with
+    it. Call stop_all when the machine stops to drop all running fades.
+    """
+
+    __slots__ = ["_loop", "interval", "ticks", "_fades", "_timer"]
+
+    _schedulers = weakref.WeakKeyDictionary()    # type: weakref.WeakKeyDictionary
+
+    def __init__(self, loop: AbstractEventLoop, interval: int) -> None:
+        """Initialise fade scheduler."""
+        self._loop = weakref.ref(loop)
+        self.interval = interval
+        self.ticks = 0
+        self._fades = {}    # type: Dict[LightPlatformDirectFade, Callable[[int], Tuple[float, int]]]
+        self._timer = None
+
+    @classmethod
+    def get(cls, loop: AbstractEventLoop, interval: int) -> "FadeScheduler":
+        """Return the scheduler for loop and interval."""
+        schedulers = cls._schedulers.setdefault(loop, {})
+        if interval not in schedulers:
+            schedulers[interval] = cls(loop, interval)
+        return schedulers[interval]
+
+    @classmethod
+    def stop_all(cls, loop: AbstractEventLoop):
+        """Stop all fades on loop and forget its schedulers."""
+        for scheduler in cls._schedulers.pop(loop, {}).values():
+            scheduler.stop()
+
+    @property
+    def fading_lights(self) -> int:
+        """Return the number of lights which are fading."""
+        return len(self._fades)
+
+    def add(self, light: "LightPlatformDirectFade", color_and_fade_callback: Callable[[int], Tuple[float, int]]):
+        """Continue the fade of light on the next tick."""
+        self._fades[light] = color_and_fade_callback
+        if not self._timer:
+            self._schedule()
+
+    def remove(self, light: "LightPlatformDirectFade"):
+        """Stop the fade of light."""
+        self._fades.pop(light, None)
+        if not self._fades:
+            self.stop()
+
+    def stop(self):
+        """Stop all fades."""
+        self._fades.clear()
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+    def _schedule(self):
+        loop = self._loop()
+        if loop is None or loop.is_closed():
+            self._fades.clear()
+            return
+        self._timer = loop.call_later(self.interval / 1000, self._tick)
+
+    def _tick(self):
+        """Update all fading lights in one pass."""
+        # the timer fired. a new one is needed even if a light fails below
+        self._timer = None
+        self.ticks += 1
+        for light, color_and_fade_callback in list(self._fades.items()):
+            try:
+                max_fade_ms = light.get_max_fade_ms()
+                brightness, fade_ms = color_and_fade_callback(max_fade_ms)
+                light.set_brightness_and_fade(brightness, max(fade_ms, 0))
+            except Exception as e:     # pylint: disable-msg=broad-except
+                # only this fade ends. report it like a failed task would
+                del self._fades[light]
+                self._loop().call_exception_handler({
+                    'message': 'Fade of light {} failed'.format(light),
+                    'exception': e,
+                })
+                continue
+            if fade_ms < max_fade_ms:
+                del self._fades[light]
+
+        if self._fades:
+            self._schedule()
+
+
 class LightPlatformDirectFade(LightPlatformInterface, metaclass=abc.ABCMeta):
 
     """Implement a light which can set fade and brightness directly."""
 
+    __slots__ = ["loop", "_fade_scheduler"]
+
     def __init__(self, loop: AbstractEventLoop) -> None:
         """Initialise light."""
         self.loop = loop
-        self.task = None    # type: asyncio.Task
+        self._fade_scheduler = None     # type: FadeScheduler
 
     @abc.abstractmethod
     def get_max_fade_ms(self) -> int:
@@ -40,26 +142,18 @@ class LightPlatformDirectFade(LightPlatformInterface, metaclass=abc.ABCMeta):
         return self.get_max_fade_ms()
 
     def set_fade(self, color_and_fade_callback: Callable[[int], Tuple[float, int]]):
-        """Perform a fade with either a asyncio task or with a single command."""
+        """Perform a fade with either the fade scheduler or with a single command."""
         max_fade_ms = self.get_max_fade_ms()
 
         brightness, fade_ms = color_and_fade_callback(max_fade_ms)
         self.set_brightness_and_fade(brightness, max(fade_ms, 0))
+        if not self._fade_scheduler:
+            self._fade_scheduler = FadeScheduler.get(self.loop, self.get_fade_interval_ms())
         if fade_ms >= max_fade_ms:
             # we have to continue the fade later
-            if self.task:
-                self.task.cancel()
-            self.task = self.loop.create_task(self._fade(color_and_fade_callback))
-
-    @asyncio.coroutine
-    def _fade(self, color_and_fade_callback):
-        while True:
-            yield from asyncio.sleep(self.get_fade_interval_ms() / 1000, loop=self.loop)
-            max_fade_ms = self.get_max_fade_ms()
-            brightness, fade_ms = color_and_fade_callback(max_fade_ms)
-            self.set_brightness_and_fade(brightness, max(fade_ms, 0))
-            if fade_ms < max_fade_ms:
-                return
+            self._fade_scheduler.add(self, color_and_fade_callback)
+        else:
+            self._fade_scheduler.remove(self)
 
     @abc.abstractmethod
     def set_brightness_and_fade(self, brightness: float, fade_ms: int):
@@ -79,6 +173,8 @@ class LightPlatformSoftwareFade(LightPlatformDirectFade, metaclass=abc.ABCMeta):
 
     """Implement a light which cannot fade on its own."""
 
+    __slots__ = ["software_fade_ms"]
+
     def __init__(self, loop: AbstractEventLoop, software_fade_ms: int) -> None:
         """Initialise light with software fade."""
         super().__init__(loop)
@@ -13,8 +13,13 @@ class SwitchPlatformInterface(metaclass=abc.ABCMeta):
     SwitchPlatformInterface is an abstract base class that should be overridden for all
     switches interface classes on supported platforms.  This class ensures the proper required
     methods are implemented to support switch operations in MPF.
+
+    Machines have hundreds of switches. Subclasses should declare __slots__
+    for their attributes to keep them small.
     """
 
+    __slots__ = ["config", "number"]
+
     def __init__(self, config: "SwitchConfig", number: Any) -> None:
         """Initialise default attributes for switches."""
         self.config = config
@@ -1,7 +1,8 @@
 """LISY platform for System 1 and System 80."""
 import asyncio
-from typing import Generator, Dict
+from typing import Generator, Dict, List
 
+from mpf.platforms.adaptive_poll import AdaptivePollScheduler
 from mpf.platforms.interfaces.driver_platform_interface import DriverPlatformInterface, PulseSettings, HoldSettings
 from mpf.platforms.interfaces.hardware_sound_platform_interface import HardwareSoundPlatformInterface
 from mpf.platforms.interfaces.segment_display_platform_interface import SegmentDisplayPlatformInterface
@@ -22,7 +23,7 @@ class LisySwitch(SwitchPlatformInterface):
 
     """A switch in the LISY platform."""
 
-    pass
+    __slots__ = []  # type: List[str]
 
 
 class LisyDriver(DriverPlatformInterface):
@@ -68,6 +69,8 @@ class LisyLight(LightPlatformSoftwareFade):
 
     """A light in the LISY platform."""
 
+    __slots__ = ["number", "platform"]
+
     def __init__(self, number, platform):
         """Initialise Lisy Light."""
         super().__init__(platform.machine.clock.loop, 50)
@@ -125,6 +128,7 @@ class LisyHardwarePlatform(SwitchPlatform, LightsPlatform, DriverPlatform, Segme
         self._writer = None                 # type: asyncio.StreamWriter
         self._reader = None                 # type: asyncio.StreamReader
         self._poll_task = None
+        self._poll_scheduler = None         # type: AdaptivePollScheduler
         self._watchdog_task = None
         self._number_of_lamps = None
         self._number_of_solenoids = None
@@ -137,6 +141,9 @@ class LisyHardwarePlatform(SwitchPlatform, LightsPlatform, DriverPlatform, Segme
     def initialize(self):
         """Initialise platform."""
         self.config = self.machine.config_validator.validate_config("lisy", self.machine.config['lisy'])
+        self._poll_scheduler = AdaptivePollScheduler(self.machine.clock, self.config['poll_hz'],
+                                                     self.config['idle_poll_hz'],
+                                                     self.config['idle_poll_after'])
 
         self.configure_logging("lisy", self.config['console_log'], self.config['file_log'])
 
@@ -248,23 +255,31 @@ class LisyHardwarePlatform(SwitchPlatform, LightsPlatform, DriverPlatform, Segme
     @asyncio.coroutine
     def _poll(self):
         while True:
+            self._poll_scheduler.start_poll()
             self.send_byte(LisyDefines.SwitchesGetChangedSwitches)
             status = yield from self.read_byte()
-            if status == 127:
-                # no changes. sleep 1ms
-                yield from asyncio.sleep(.001, loop=self.machine.clock.loop)
-            else:
+            # 127 means no changes
+            active = status != 127
+            if active:
                 # bit 7 is state
                 switch_state = 1 if status & 0b10000000 else 0
                 # bits 0-6 are the switch number
                 switch_num = status & 0b01111111
 
                 # tell the switch controller about the new state
-                self.machine.switch_controller.process_switch_by_num(str(switch_num), switch_state, self)
+                self.machine.switch_controller.process_switch_by_num(str(switch_num), switch_state, self,
+                                                                     timestamp=self.machine.latency_tracer.stamp())
 
                 # store in dict as well
                 self._inputs[str(switch_num)] = bool(switch_state)
 
+            self._poll_scheduler.end_poll(active)
+            yield from self._poll_scheduler.wait(active)
+
+    def get_poll_stats(self) -> dict:
+        """Return poll timing stats."""
+        return self._poll_scheduler.get_stats()
+
     @asyncio.coroutine
     def _watchdog(self):
         """Periodically send watchdog."""
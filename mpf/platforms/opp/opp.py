@@ -438,6 +438,7 @@ class OppHardwarePlatform(LightsPlatform, SwitchPlatform, DriverPlatform):
             # Update the state which holds inputs that are active
             changes = opp_inp.oldState ^ new_state
             if changes != 0:
+                timestamp = self.machine.latency_tracer.stamp()
                 curr_bit = 1
                 for index in range(0, 32):
                     if (curr_bit & changes) != 0:
@@ -445,12 +446,14 @@ class OppHardwarePlatform(LightsPlatform, SwitchPlatform, DriverPlatform):
                             self.machine.switch_controller.process_switch_by_num(
                                 state=1,
                                 num=opp_inp.chain_serial + '-' + opp_inp.cardNum + '-' + str(index),
-                                platform=self)
+                                platform=self,
+                                timestamp=timestamp)
                         else:
                             self.machine.switch_controller.process_switch_by_num(
                                 state=0,
                                 num=opp_inp.chain_serial + '-' + opp_inp.cardNum + '-' + str(index),
-                                platform=self)
+                                platform=self,
+                                timestamp=timestamp)
                     curr_bit <<= 1
             opp_inp.oldState = new_state
 
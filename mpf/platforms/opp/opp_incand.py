@@ -33,6 +33,8 @@ class OPPIncand(LightPlatformSoftwareFade):
 
     """A driver of an incandescent wing card."""
 
+    __slots__ = ["incandCard", "number"]
+
     def __init__(self, incand_card, number, hardware_fade_ms, loop):
         """Initialise Incandescent wing card driver."""
         super().__init__(loop, hardware_fade_ms)
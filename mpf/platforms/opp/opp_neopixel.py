@@ -47,6 +47,8 @@ class OPPLightChannel(LightPlatformSoftwareFade):
 
     """A channel of a WS2812 LED."""
 
+    __slots__ = ["led", "index"]
+
     def __init__(self, led, index, hardware_fade_ms, loop):
         """Initialise led channel."""
         super().__init__(loop, hardware_fade_ms)
@@ -33,6 +33,8 @@ class OPPSwitch(SwitchPlatformInterface):
 
     """An OPP input on an OPP input card."""
 
+    __slots__ = ["card"]
+
     def __init__(self, card, number):
         """Initialise input."""
         super().__init__({}, number)
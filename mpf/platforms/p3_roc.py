@@ -11,7 +11,7 @@ https://github.com/preble/pyprocgame
 """
 
 import logging
-from typing import TYPE_CHECKING
+from typing import List, Tuple, TYPE_CHECKING
 
 from mpf.core.platform import I2cPlatform, AccelerometerPlatform, DriverConfig, SwitchConfig
 from mpf.platforms.interfaces.accelerometer_platform_interface import AccelerometerPlatformInterface
@@ -188,25 +188,31 @@ class P3RocHardwarePlatform(PROCBasePlatform, I2cPlatform, AccelerometerPlatform
         Also tickles the watchdog and flushes any queued commands to the P3-ROC.
         """
         # Get P3-ROC events
+        timestamp = self.machine.latency_tracer.stamp()
+        acceleration_samples = []
         for event in self.proc.get_events():
             event_type = event['type']
             event_value = event['value']
             if event_type == self.pinproc.EventTypeSwitchClosedDebounced:
                 self.machine.switch_controller.process_switch_by_num(state=1,
                                                                      num=event_value,
-                                                                     platform=self)
+                                                                     platform=self,
+                                                                     timestamp=timestamp)
             elif event_type == self.pinproc.EventTypeSwitchOpenDebounced:
                 self.machine.switch_controller.process_switch_by_num(state=0,
                                                                      num=event_value,
-                                                                     platform=self)
+                                                                     platform=self,
+                                                                     timestamp=timestamp)
             elif event_type == self.pinproc.EventTypeSwitchClosedNondebounced:
                 self.machine.switch_controller.process_switch_by_num(state=1,
                                                                      num=event_value,
-                                                                     platform=self)
+                                                                     platform=self,
+                                                                     timestamp=timestamp)
             elif event_type == self.pinproc.EventTypeSwitchOpenNondebounced:
                 self.machine.switch_controller.process_switch_by_num(state=0,
                                                                      num=event_value,
-                                                                     platform=self)
+                                                                     platform=self,
+                                                                     timestamp=timestamp)
 
             # The P3-ROC will always send all three values sequentially.
             # Therefore, we will trigger after the Z value
@@ -219,18 +225,21 @@ class P3RocHardwarePlatform(PROCBasePlatform, I2cPlatform, AccelerometerPlatform
             elif event_type == self.pinproc.EventTypeAccelerometerZ:
                 self.acceleration[2] = event_value
 
-                # trigger here
+                # collect all samples of this tick and process them at once
                 if self.accelerometer_device:
-                    self.accelerometer_device.update_acceleration(
+                    acceleration_samples.append((
                         self.scale_accelerometer_to_g(self.acceleration[0]),
                         self.scale_accelerometer_to_g(self.acceleration[1]),
-                        self.scale_accelerometer_to_g(self.acceleration[2]))
+                        self.scale_accelerometer_to_g(self.acceleration[2])))
                     self.debug_log("Got Accelerometer value Z. Value: %s", event_value)
 
             else:   # pragma: no cover
                 self.log.warning("Received unrecognized event from the P3-ROC. "
                                  "Type: %s, Value: %s", event_type, event_value)
 
+        if acceleration_samples:
+            self.accelerometer_device.update_acceleration_samples(acceleration_samples)
+
         self.proc.watchdog_tickle()
         self.proc.flush()
 
@@ -246,3 +255,7 @@ class PROCAccelerometer(AccelerometerPlatformInterface):
     def update_acceleration(self, x: float, y: float, z: float) -> None:
         """Call the callback."""
         self.callback.update_acceleration(x, y, z)
+
+    def update_acceleration_samples(self, samples: List[Tuple[float, float, float]]) -> None:
+        """Pass a block of samples to the callback."""
+        self.callback.update_acceleration_samples(samples)
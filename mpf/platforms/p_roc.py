@@ -155,6 +155,7 @@ class PRocHardwarePlatform(PROCBasePlatform, DmdPlatform):
         Also tickles the watchdog and flushes any queued commands to the P-ROC.
         """
         # Get P-ROC events (switches & DMD frames displayed)
+        timestamp = self.machine.latency_tracer.stamp()
         for event in self.proc.get_events():
             event_type = event['type']
             event_value = event['value']
@@ -162,16 +163,16 @@ class PRocHardwarePlatform(PROCBasePlatform, DmdPlatform):
                 pass
             elif event_type == self.pinproc.EventTypeSwitchClosedDebounced:
                 self.machine.switch_controller.process_switch_by_num(
-                    state=1, num=event_value, platform=self)
+                    state=1, num=event_value, platform=self, timestamp=timestamp)
             elif event_type == self.pinproc.EventTypeSwitchOpenDebounced:
                 self.machine.switch_controller.process_switch_by_num(
-                    state=0, num=event_value, platform=self)
+                    state=0, num=event_value, platform=self, timestamp=timestamp)
             elif event_type == self.pinproc.EventTypeSwitchClosedNondebounced:
                 self.machine.switch_controller.process_switch_by_num(
-                    state=1, num=event_value, platform=self)
+                    state=1, num=event_value, platform=self, timestamp=timestamp)
             elif event_type == self.pinproc.EventTypeSwitchOpenNondebounced:
                 self.machine.switch_controller.process_switch_by_num(
-                    state=0, num=event_value, platform=self)
+                    state=0, num=event_value, platform=self, timestamp=timestamp)
             else:
                 self.log.warning("Received unrecognized event from the P-ROC. "
                                  "Type: %s, Value: %s", event_type, event_value)
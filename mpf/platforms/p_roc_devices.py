@@ -11,6 +11,8 @@ class PROCSwitch(SwitchPlatformInterface):
 
     """P-ROC switch object which is use to store the configure rules and config."""
 
+    __slots__ = ["log", "notify_on_nondebounce", "hw_rules"]
+
     def __init__(self, config, number, notify_on_nondebounce):
         """Initialise P-ROC switch."""
         super().__init__(config, number)
@@ -97,6 +99,8 @@ class PROCMatrixLight(LightPlatformSoftwareFade):
 
     """A P-ROC matrix light device."""
 
+    __slots__ = ["log", "number", "proc"]
+
     def __init__(self, number, proc_driver, machine):
         """Initialise matrix light device."""
         super().__init__(machine.clock.loop, int(1 / machine.config['mpf']['default_light_hw_update_hz'] * 1000))
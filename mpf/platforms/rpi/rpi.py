@@ -1,6 +1,6 @@
 """Platform to control the hardware of a Raspberry Pi."""
 import asyncio
-from typing import Optional
+from typing import Optional, List
 
 from mpf.core.delays import DelayManager
 
@@ -10,8 +10,8 @@ from mpf.platforms.interfaces.switch_platform_interface import SwitchPlatformInt
 
 from mpf.platforms.interfaces.driver_platform_interface import DriverPlatformInterface, PulseSettings, HoldSettings
 
-from mpf.core.platform import SwitchPlatform, DriverPlatform, ServoPlatform, SwitchSettings, \
-    DriverSettings, DriverConfig, SwitchConfig
+from mpf.core.platform import SwitchPlatform, DriverPlatform, ServoPlatform, DriverConfig, SwitchConfig
+from mpf.platforms.software_rules import SoftwareRuleEngine, SoftwareRulesMixin
 
 # apiogpio is not a requirement for MPF so we fail with a nice error when loading
 try:
@@ -24,7 +24,7 @@ class RpiSwitch(SwitchPlatformInterface):
 
     """A switch on a RPI."""
 
-    pass
+    __slots__ = []  # type: List[str]
 
 
 class RpiDriver(DriverPlatformInterface):
@@ -86,11 +86,12 @@ class RpiServo(ServoPlatformInterface):
         self.platform.send_command(self.platform.pi.set_servo_pulsewidth(self.gpio, position_translated))
 
 
-class RaspberryPiHardwarePlatform(SwitchPlatform, DriverPlatform, ServoPlatform):
+class RaspberryPiHardwarePlatform(SoftwareRulesMixin, SwitchPlatform, DriverPlatform, ServoPlatform):
 
     """Control the hardware of a Raspberry Pi.
     
-    Works locally and remotely via network.
+    Works locally and remotely via network. The Pi has no hardware rules so
+    rules are evaluated in software when a switch changes.
     """
 
     def __init__(self, machine):
@@ -106,6 +107,7 @@ class RaspberryPiHardwarePlatform(SwitchPlatform, DriverPlatform, ServoPlatform)
 
         self._cmd_queue = None  # type: asyncio.Queue
         self._cmd_task = None   # type: asyncio.Task
+        self.software_rules = SoftwareRuleEngine(self)
 
     def initialize(self):
         """Initialise platform."""
@@ -188,28 +190,7 @@ class RaspberryPiHardwarePlatform(SwitchPlatform, DriverPlatform, ServoPlatform)
     def _switch_changed(self, gpio, level, tick):
         """Callback for switch change."""
         del tick
-        self.machine.switch_controller.process_switch_by_num(str(gpio), level, self)
-
-    def set_pulse_on_hit_and_release_rule(self, enable_switch: SwitchSettings, coil: DriverSettings):
-        """Raise exception."""
-        raise AssertionError("Not supported on the RPi currently. Write in the forum if you need it.")
-
-    def set_pulse_on_hit_and_enable_and_release_rule(self, enable_switch: SwitchSettings, coil: DriverSettings):
-        """Raise exception."""
-        raise AssertionError("Not supported on the RPi currently. Write in the forum if you need it.")
-
-    def set_pulse_on_hit_and_enable_and_release_and_disable_rule(self, enable_switch: SwitchSettings,
-                                                                 disable_switch: SwitchSettings, coil: DriverSettings):
-        """Raise exception."""
-        raise AssertionError("Not supported on the RPi currently. Write in the forum if you need it.")
-
-    def set_pulse_on_hit_rule(self, enable_switch: SwitchSettings, coil: DriverSettings):
-        """Raise exception."""
-        raise AssertionError("Not supported on the RPi currently. Write in the forum if you need it.")
-
-    def clear_hw_rule(self, switch: SwitchSettings, coil: DriverSettings):
-        """Raise exception."""
-        raise AssertionError("Not supported on the RPi currently. Write in the forum if you need it.")
+        self.software_rules.switch_changed(str(gpio), level)
 
     def configure_driver(self, config: DriverConfig, number: str, platform_settings: dict) -> "DriverPlatformInterface":
         """Configure an output on the Raspberry Pi."""
@@ -65,7 +65,11 @@ class SmartMatrixHardwarePlatform(RgbDmdPlatform):
 
 class SmartMatrixDevice(DmdPlatformInterface):
 
-    """A smartmatrix device."""
+    """A smartmatrix device.
+
+    Frames are only written when the serial port finished the last frame.
+    Until then only the latest frame is kept and all older frames are dropped.
+    """
 
     def __init__(self, config, machine):
         """Initialise smart matrix device."""
@@ -75,6 +79,15 @@ class SmartMatrixDevice(DmdPlatformInterface):
         self.machine = machine
         self.log = logging.getLogger('SmartMatrixDevice')
 
+        if self.config['old_cookie']:
+            self._header = b'\x01'
+        else:
+            self._header = b'\xBA\x11\x00\x03\x04\x00\x00\x00'
+
+        self._pending_frame = None
+        self._write_task = None
+        self.frames_dropped = 0
+
     @asyncio.coroutine
     def connect(self):
         """Connect to SmartMatrix device."""
@@ -82,9 +95,14 @@ class SmartMatrixDevice(DmdPlatformInterface):
         connector = self.machine.clock.open_serial_connection(
             url=self.config['port'], baudrate=self.config['baud'], limit=0)
         self.reader, self.writer = yield from connector
+        # pause writing as soon as a frame cannot be written at once
+        self.writer.transport.set_write_buffer_limits(high=0)
 
     def stop(self):
         """Stop device."""
+        if self._write_task:
+            self._write_task.cancel()
+            self._write_task = None
         if self.writer:
             self.log.info("Disconnecting from SmartMatrix RGB DMD hardware.")
             self.writer.close()
@@ -92,9 +110,42 @@ class SmartMatrixDevice(DmdPlatformInterface):
 
     def update(self, data):
         """Update DMD data."""
-        if self.writer:
-            if self.config['old_cookie']:
-                self.writer.write(bytearray([0x01]))
-            else:
-                self.writer.write(bytearray([0xBA, 0x11, 0x00, 0x03, 0x04, 0x00, 0x00, 0x00]))
-            self.writer.write(bytearray(data))
+        if not self.writer:
+            return
+
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data)
+
+        if self._write_task or self.writer.transport.get_write_buffer_size():
+            # the last frame is still being written. keep only the latest frame
+            if self._pending_frame is not None:
+                self.frames_dropped += 1
+            self._pending_frame = data
+            if not self._write_task:
+                self._write_task = self.machine.clock.loop.create_task(self._write_pending_frame())
+                self._write_task.add_done_callback(self._done)
+            return
+
+        # two writes instead of writelines which would join header and frame into a new buffer
+        self.writer.write(self._header)
+        self.writer.write(data)
+
+    @staticmethod
+    def _done(future):
+        """Evaluate result of task.
+
+        Will raise exceptions from within task.
+        """
+        try:
+            future.result()
+        except asyncio.CancelledError:
+            pass
+
+    @asyncio.coroutine
+    def _write_pending_frame(self):
+        """Write the pending frame as soon as the serial port is ready."""
+        yield from self.writer.drain()
+        self._write_task = None
+        frame = self._pending_frame
+        self._pending_frame = None
+        self.update(frame)
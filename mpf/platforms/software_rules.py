@@ -0,0 +1,126 @@
+"""Switch to driver rules evaluated in software for platforms without hardware rules."""
+from typing import Dict, List, Optional
+
+from mpf.core.platform import SwitchSettings, DriverSettings
+
+
+class SoftwareRule(object):
+
+    """A rule which links a switch to a driver."""
+
+    __slots__ = ["enable_switch", "disable_switch", "coil", "hold", "release_disable"]
+
+    # pylint: disable-msg=too-many-arguments
+    def __init__(self, enable_switch: SwitchSettings, disable_switch: Optional[SwitchSettings], coil: DriverSettings,
+                 hold: bool, release_disable: bool) -> None:
+        """Initialise rule."""
+        self.enable_switch = enable_switch
+        self.disable_switch = disable_switch
+        self.coil = coil
+        self.hold = hold
+        self.release_disable = release_disable
+
+
+class SoftwareRuleEngine(object):
+
+    """Evaluates switch to driver rules in software.
+
+    The platform calls switch_changed from its switch callback. Rules for the
+    switch fire the driver right away before the change is passed to the
+    switch controller. Nothing is scheduled on the loop and no events are
+    posted in between.
+
+    The recycle flag of DriverSettings is not supported.
+    """
+
+    def __init__(self, platform) -> None:
+        """Initialise rule engine."""
+        self.platform = platform
+        self._rules = dict()    # type: Dict[str, List[SoftwareRule]]
+
+    def add_rule(self, enable_switch: SwitchSettings, coil: DriverSettings, disable_switch: SwitchSettings=None,
+                 hold=False, release_disable=False):
+        """Add a rule.
+
+        Args:
+            enable_switch: Switch which pulses (or enables) the driver when it becomes active.
+            coil: The driver.
+            disable_switch: Optional switch which disables the driver when it becomes active.
+            hold: Enable the driver with its hold settings instead of pulsing it.
+            release_disable: Disable the driver when enable_switch is released.
+        """
+        rule = SoftwareRule(enable_switch, disable_switch, coil, hold, release_disable)
+        self._rules.setdefault(enable_switch.hw_switch.number, []).append(rule)
+        if disable_switch:
+            self._rules.setdefault(disable_switch.hw_switch.number, []).append(rule)
+
+    def clear_rule(self, switch: SwitchSettings, coil: DriverSettings):
+        """Remove all rules between switch and coil."""
+        number = switch.hw_switch.number
+        rules = [rule for rule in self._rules.get(number, []) if rule.coil.hw_driver is not coil.hw_driver]
+        if rules:
+            self._rules[number] = rules
+        else:
+            self._rules.pop(number, None)
+
+    def has_rules(self, number: str) -> bool:
+        """Return true if there are rules for a switch."""
+        return number in self._rules
+
+    def process_switch(self, number: str, state: int):
+        """Fire drivers for the new physical state of a switch."""
+        rules = self._rules.get(number)
+        if not rules:
+            return
+
+        for rule in rules:
+            if rule.enable_switch.hw_switch.number == number:
+                if bool(state) != rule.enable_switch.invert:
+                    if rule.hold:
+                        rule.coil.hw_driver.enable(rule.coil.pulse_settings, rule.coil.hold_settings)
+                    else:
+                        rule.coil.hw_driver.pulse(rule.coil.pulse_settings)
+                elif rule.release_disable:
+                    rule.coil.hw_driver.disable()
+            elif bool(state) != rule.disable_switch.invert:
+                rule.coil.hw_driver.disable()
+
+    def switch_changed(self, number: str, state: int, timestamp: float=None):
+        """Evaluate rules and pass the change on to the switch controller."""
+        self.process_switch(number, state)
+        self.platform.machine.switch_controller.process_switch_by_num(number, state, self.platform,
+                                                                      timestamp=timestamp)
+
+
+class SoftwareRulesMixin(object):
+
+    """Implements the hardware rule interface of DriverPlatform with a SoftwareRuleEngine.
+
+    Platforms which mix this in have to create software_rules in their
+    constructor and call software_rules.switch_changed from their switch
+    callback.
+    """
+
+    software_rules = None   # type: SoftwareRuleEngine
+
+    def set_pulse_on_hit_and_release_rule(self, enable_switch: SwitchSettings, coil: DriverSettings):
+        """Pulse driver on hit and disable it on release."""
+        self.software_rules.add_rule(enable_switch, coil, release_disable=True)
+
+    def set_pulse_on_hit_and_enable_and_release_rule(self, enable_switch: SwitchSettings, coil: DriverSettings):
+        """Pulse and hold driver on hit and disable it on release."""
+        self.software_rules.add_rule(enable_switch, coil, hold=True, release_disable=True)
+
+    def set_pulse_on_hit_and_enable_and_release_and_disable_rule(self, enable_switch: SwitchSettings,
+                                                                 disable_switch: SwitchSettings, coil: DriverSettings):
+        """Pulse and hold driver on hit and disable it on release or when disable_switch is hit."""
+        self.software_rules.add_rule(enable_switch, coil, disable_switch=disable_switch, hold=True,
+                                     release_disable=True)
+
+    def set_pulse_on_hit_rule(self, enable_switch: SwitchSettings, coil: DriverSettings):
+        """Pulse driver on hit."""
+        self.software_rules.add_rule(enable_switch, coil)
+
+    def clear_hw_rule(self, switch: SwitchSettings, coil: DriverSettings):
+        """Remove rules between switch and coil."""
+        self.software_rules.clear_rule(switch, coil)
@@ -5,6 +5,7 @@ import logging
 import random
 from typing import Optional, Generator
 
+from mpf.platforms.adaptive_poll import AdaptivePollScheduler
 from mpf.platforms.interfaces.light_platform_interface import LightPlatformDirectFade
 
 from mpf.platforms.interfaces.driver_platform_interface import DriverPlatformInterface, PulseSettings, HoldSettings
@@ -19,6 +20,8 @@ class SpikeSwitch(SwitchPlatformInterface):
 
     """A switch on a Stern Spike node board."""
 
+    __slots__ = ["node", "index", "platform"]
+
     def __init__(self, config, number, platform):
         """Initialise switch."""
         super().__init__(config, number)
@@ -32,6 +35,8 @@ class SpikeLight(LightPlatformDirectFade):
 
     """A light on a Stern Spike node board."""
 
+    __slots__ = ["node", "number", "platform"]
+
     def __init__(self, node, number, platform):
         """Initialise light."""
         super().__init__(platform.machine.clock.loop)
@@ -286,6 +291,7 @@ class SpikePlatform(SwitchPlatform, LightsPlatform, DriverPlatform):
         self._nodes = None
         self._bus_busy = asyncio.Lock(loop=self.machine.clock.loop)
         self._cmd_queue = asyncio.Queue(loop=self.machine.clock.loop)
+        self._poll_scheduler = None     # type: AdaptivePollScheduler
 
     @asyncio.coroutine
     def initialize(self):
@@ -300,6 +306,10 @@ class SpikePlatform(SwitchPlatform, LightsPlatform, DriverPlatform):
         if 0 not in self._nodes:
             raise AssertionError("Please include CPU node 0 in nodes for Spike.")
 
+        self._poll_scheduler = AdaptivePollScheduler(self.machine.clock, self.config['poll_hz'],
+                                                     self.config['idle_poll_hz'],
+                                                     self.config['idle_poll_after'])
+
         yield from self._connect_to_hardware(port, baud)
 
         self._poll_task = self.machine.clock.loop.create_task(self._poll())
@@ -322,17 +332,7 @@ class SpikePlatform(SwitchPlatform, LightsPlatform, DriverPlatform):
 
         yield from self._initialize()
 
-    @asyncio.coroutine
-    def _update_switches(self, node):
-        if node not in self._nodes:     # pragma: no cover
-            self.log.warning("Cannot read node %s because it is not configured.", node)
-            return False
-
-        new_inputs_str = yield from self._read_inputs(node)
-        if not new_inputs_str:      # pragma: no cover
-            self.log.info("Node: %s did not return any inputs.", node)
-            return True
-
+    def _process_inputs(self, node, new_inputs_str):
         new_inputs = self._input_to_int(new_inputs_str)
 
         if self.debug:
@@ -341,21 +341,21 @@ class SpikePlatform(SwitchPlatform, LightsPlatform, DriverPlatform):
 
         changes = self._inputs[node] ^ new_inputs
         if changes != 0:
+            timestamp = self.machine.latency_tracer.stamp()
             curr_bit = 1
             for index in range(0, 64):
                 if (curr_bit & changes) != 0:
                     self.machine.switch_controller.process_switch_by_num(
                         state=(curr_bit & new_inputs) == 0,
                         num=str(node) + "-" + str(index),
-                        platform=self)
+                        platform=self,
+                        timestamp=timestamp)
                 curr_bit <<= 1
         elif self.debug:    # pragma: no cover
             self.log.debug("Got input activity but inputs did not change.")
 
         self._inputs[node] = new_inputs
 
-        return True
-
     @asyncio.coroutine
     def _sender(self):
         while True:
@@ -384,55 +384,78 @@ class SpikePlatform(SwitchPlatform, LightsPlatform, DriverPlatform):
                 # wait one second
                 yield from asyncio.sleep(1, loop=self.machine.clock.loop)
 
+    def _resync(self):
+        """Drop everything in the read buffer after a desync."""
+        # pylint: disable-msg=protected-access
+        self._reader._buffer = bytearray()
+        self._poll_scheduler.backoff()
+
     @asyncio.coroutine
-    def _poll(self):
-        while True:
-            with (yield from self._bus_busy):
-                yield from self._send_raw(bytearray([0]))
-
-                try:
-                    result = yield from asyncio.wait_for(self._read_raw(1), 0.5, loop=self.machine.clock.loop)
-                except asyncio.TimeoutError:    # pragma: no cover
-                    self.log.warning("Spike watchdog expired.")
-                    # clear buffer
-                    # pylint: disable-msg=protected-access
-                    self._reader._buffer = bytearray()
-                    continue
+    def _poll_and_read_inputs(self):
+        """Poll for a ready node and read its inputs in one bus transaction.
+
+        Returns a tuple of the ready node and its inputs. The node is None if
+        no node is ready and -1 if the bus desynced.
+        """
+        with (yield from self._bus_busy):
+            yield from self._send_raw(bytearray([0]))
+
+            try:
+                result = yield from asyncio.wait_for(self._read_raw(1), 0.5, loop=self.machine.clock.loop)
+            except asyncio.TimeoutError:    # pragma: no cover
+                self.log.warning("Spike watchdog expired.")
+                return -1, None
 
             if not result:
                 self.log.warning("Empty poll result. Spike desynced.")
-                # give it a break of 50ms
-                yield from asyncio.sleep(.05, loop=self.machine.clock.loop)
-                # clear buffer
-                # pylint: disable-msg=protected-access
-                self._reader._buffer = bytearray()
-                continue
+                return -1, None
 
             ready_node = result[0]
 
-            if 0 < ready_node <= 0x0F or ready_node == 0xF0:
-                # valid node ids
-                if ready_node == 0xF0:
-                    # virtual cpu node returns 0xF0 instead of 0 to make it distinguishable
-                    ready_node = 0
-                result = yield from self._update_switches(ready_node)
-                if not result:
-                    self.log.warning("Spike desynced during input.")
-                    yield from asyncio.sleep(.05, loop=self.machine.clock.loop)
-                    # clear buffer
-                    # pylint: disable-msg=protected-access
-                    self._reader._buffer = bytearray()
-            elif ready_node > 0:    # pragma: no cover
+            if ready_node == 0:
+                # idle
+                return None, None
+
+            if not (0 < ready_node <= 0x0F or ready_node == 0xF0):     # pragma: no cover
                 # invalid node ids
                 self.log.warning("Spike desynced.")
-                # give it a break of 50ms
-                yield from asyncio.sleep(.05, loop=self.machine.clock.loop)
-                # clear buffer
-                # pylint: disable-msg=protected-access
-                self._reader._buffer = bytearray()
-            else:
-                # sleep only if spike is idle
-                yield from asyncio.sleep(1 / self.config['poll_hz'], loop=self.machine.clock.loop)
+                return -1, None
+
+            if ready_node == 0xF0:
+                # virtual cpu node returns 0xF0 instead of 0 to make it distinguishable
+                ready_node = 0
+
+            if ready_node not in self._nodes:     # pragma: no cover
+                self.log.warning("Cannot read node %s because it is not configured.", ready_node)
+                return -1, None
+
+            # read the inputs right away without giving up the bus
+            inputs = yield from self._send_cmd_and_read_response(
+                self._create_cmd_str(ready_node, SpikeNodebus.GetInputState, bytearray(), 10), 10)
+            return ready_node, inputs
+
+    @asyncio.coroutine
+    def _poll(self):
+        while True:
+            self._poll_scheduler.start_poll()
+            ready_node, inputs = yield from self._poll_and_read_inputs()
+            active = False
+
+            if ready_node == -1:
+                self._resync()
+            elif ready_node is not None and not inputs:
+                self.log.warning("Spike desynced during input.")
+                self._resync()
+            elif ready_node is not None:
+                self._process_inputs(ready_node, inputs)
+                active = True
+
+            self._poll_scheduler.end_poll(active)
+            yield from self._poll_scheduler.wait(active)
+
+    def get_poll_stats(self) -> dict:
+        """Return poll timing stats."""
+        return self._poll_scheduler.get_stats()
 
     def stop(self):
         """Stop hardware and close connections."""
@@ -519,38 +542,35 @@ class SpikePlatform(SwitchPlatform, LightsPlatform, DriverPlatform):
     @asyncio.coroutine
     def send_cmd_and_wait_for_response(self, node, cmd, data, response_len) -> Generator[int, None, Optional[bytearray]]:
         """Send cmd and wait for response."""
-        if node > 15:
-            raise AssertionError("Node must be 0-15.")
-        cmd_str = bytearray()
-        cmd_str.append((8 << 4) + node)
-        cmd_str.append(len(data) + 2)
-        cmd_str.append(cmd)
-        cmd_str.extend(data)
-        cmd_str.append(self._checksum(cmd_str))
-        cmd_str.append(response_len)
+        cmd_str = self._create_cmd_str(node, cmd, data, response_len)
         with (yield from self._bus_busy):
-            yield from self._send_raw(cmd_str)
-            if response_len:
-                try:
-                    response = yield from asyncio.wait_for(self._read_raw(response_len), 0.2,
-                                                           loop=self.machine.clock.loop)    # type: bytearray
-                except asyncio.TimeoutError:    # pragma: no cover
-                    self.log.warning("Failed to read %s bytes from Spike", response_len)
-                    return None
-
-                if self._checksum(response) != 0:   # pragma: no cover
-                    self.log.warning("Checksum mismatch for response: %s", "".join("%02x " % b for b in response))
-                    # we resync by flushing the input
-                    self._writer.transport.serial.reset_input_buffer()
-                    # pylint: disable-msg=protected-access
-                    self._reader._buffer = bytearray()
-                    return None
-
-                return response
-
-            return None
-
-    def _create_cmd_str(self, node, cmd, data):
+            return (yield from self._send_cmd_and_read_response(cmd_str, response_len))
+
+    @asyncio.coroutine
+    def _send_cmd_and_read_response(self, cmd_str, response_len) -> Generator[int, None, Optional[bytearray]]:
+        """Send cmd and read the response. The caller has to hold the bus."""
+        yield from self._send_raw(cmd_str)
+        if response_len:
+            try:
+                response = yield from asyncio.wait_for(self._read_raw(response_len), 0.2,
+                                                       loop=self.machine.clock.loop)    # type: bytearray
+            except asyncio.TimeoutError:    # pragma: no cover
+                self.log.warning("Failed to read %s bytes from Spike", response_len)
+                return None
+
+            if self._checksum(response) != 0:   # pragma: no cover
+                self.log.warning("Checksum mismatch for response: %s", "".join("%02x " % b for b in response))
+                # we resync by flushing the input
+                self._writer.transport.serial.reset_input_buffer()
+                # pylint: disable-msg=protected-access
+                self._reader._buffer = bytearray()
+                return None
+
+            return response
+
+        return None
+
+    def _create_cmd_str(self, node, cmd, data, response_len=0):
         if node > 15:
             raise AssertionError("Node must be 0-15.")
         cmd_str = bytearray()
@@ -559,7 +579,7 @@ class SpikePlatform(SwitchPlatform, LightsPlatform, DriverPlatform):
         cmd_str.append(cmd)
         cmd_str.extend(data)
         cmd_str.append(self._checksum(cmd_str))
-        cmd_str.append(0)
+        cmd_str.append(response_len)
         return cmd_str
 
     @asyncio.coroutine
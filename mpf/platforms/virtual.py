@@ -16,13 +16,21 @@ from mpf.platforms.interfaces.stepper_platform_interface import StepperPlatformI
 from mpf.core.platform import ServoPlatform, SwitchPlatform, DriverPlatform, AccelerometerPlatform, I2cPlatform, \
     DmdPlatform, RgbDmdPlatform, LightsPlatform, DriverConfig, SwitchConfig, SegmentDisplayPlatform, StepperPlatform
 from mpf.core.utility_functions import Util
+from mpf.platforms.software_rules import SoftwareRuleEngine, SoftwareRulesMixin
 from mpf.platforms.interfaces.driver_platform_interface import DriverPlatformInterface, PulseSettings, HoldSettings
 
 
-class VirtualHardwarePlatform(AccelerometerPlatform, I2cPlatform, ServoPlatform, LightsPlatform, SwitchPlatform,
-                              DriverPlatform, DmdPlatform, RgbDmdPlatform, SegmentDisplayPlatform, StepperPlatform):
+class VirtualHardwarePlatform(SoftwareRulesMixin, AccelerometerPlatform, I2cPlatform, ServoPlatform, LightsPlatform,
+                              SwitchPlatform, DriverPlatform, DmdPlatform, RgbDmdPlatform, SegmentDisplayPlatform,
+                              StepperPlatform):
 
-    """Base class for the virtual hardware platform."""
+    """Base class for the virtual hardware platform.
+
+    Rules are kept in a SoftwareRuleEngine. Switch changes which are passed to
+    the switch controller directly (e.g. from the keyboard or tests) do not
+    trigger them. Use software_rules.switch_changed to simulate a switch
+    change which comes from the hardware.
+    """
 
     def __init__(self, machine):
         """Initialise virtual platform."""
@@ -39,6 +47,7 @@ class VirtualHardwarePlatform(AccelerometerPlatform, I2cPlatform, ServoPlatform,
         self._next_driver = 1000
         self._next_switch = 1000
         self._next_light = 1000
+        self.software_rules = SoftwareRuleEngine(self)
 
     def __repr__(self):
         """Return string representation."""
@@ -173,10 +182,6 @@ class VirtualHardwarePlatform(AccelerometerPlatform, I2cPlatform, ServoPlatform,
         else:
             raise AssertionError("Unknown subtype {}".format(subtype))
 
-    def clear_hw_rule(self, switch, coil):
-        """Clear hw rule."""
-        pass
-
     def i2c_write8(self, address, register, value):
         """Write to I2C."""
         pass
@@ -193,22 +198,6 @@ class VirtualHardwarePlatform(AccelerometerPlatform, I2cPlatform, ServoPlatform,
         del register
         return None
 
-    def set_pulse_on_hit_and_enable_and_release_rule(self, enable_switch, coil):
-        """Set rule."""
-        pass
-
-    def set_pulse_on_hit_and_release_rule(self, enable_switch, coil):
-        """Set rule."""
-        pass
-
-    def set_pulse_on_hit_and_enable_and_release_and_disable_rule(self, enable_switch, disable_switch, coil):
-        """Set rule."""
-        pass
-
-    def set_pulse_on_hit_rule(self, enable_switch, coil):
-        """Set rule."""
-        pass
-
     def configure_dmd(self):
         """Configure DMD."""
         return VirtualDmd()
@@ -275,6 +264,8 @@ class VirtualSwitch(SwitchPlatformInterface):
 
     """Represents a switch in a pinball machine used with virtual hardware."""
 
+    __slots__ = ["log"]
+
     def __init__(self, config, number):
         """Initialise switch."""
         super().__init__(config, number)
@@ -285,6 +276,8 @@ class VirtualLight(LightPlatformInterface):
 
     """Virtual Light."""
 
+    __slots__ = ["settings", "number", "color_and_fade_callback"]
+
     def __init__(self, number, settings):
         """Initialise LED."""
         self.settings = settings
@@ -3,6 +3,7 @@
 import logging
 from typing import Any
 from typing import Set
+from typing import Tuple
 from typing import TYPE_CHECKING
 
 from mpf.core.switch_controller import MonitoredSwitchChange
@@ -35,6 +36,8 @@ class Auditor(object):
         self.switchnames_to_audit = set()       # type: Set[str]
         self.config = None                      # type: Any
         self.current_audits = None              # type: Any
+        self._dirty_audits = set()              # type: Set[Tuple[str, str]]
+        self._publish_handle = None
 
         self.enabled = False
         """Attribute that's viewed by other core components to let them know
@@ -113,6 +116,10 @@ class Auditor(object):
     def audit(self, audit_class, event, **kwargs):
         """Called to log an auditable event.
 
+        The counter is updated right away. The audits_* machine vars of all
+        audits which changed are set together after publish_interval, when
+        the audits are saved or when the auditor is disabled.
+
         Args:
             audit_class: A string of the section we want this event to be
                 logged to.
@@ -129,7 +136,23 @@ class Auditor(object):
             self.current_audits[audit_class][event] = 0
 
         self.current_audits[audit_class][event] += 1
-        self.machine.set_machine_var("audits_{}_{}".format(audit_class, event), self.current_audits[audit_class][event])
+
+        # publish machine vars in one batch
+        self._dirty_audits.add((audit_class, event))
+        if not self._publish_handle:
+            self._publish_handle = self.machine.clock.schedule_once(self._publish_audits,
+                                                                    self.config['publish_interval'] / 1000)
+
+    def _publish_audits(self):
+        """Set machine vars for all audits which changed since the last call."""
+        if self._publish_handle:
+            self._publish_handle.cancel()
+            self._publish_handle = None
+
+        for audit_class, event in self._dirty_audits:
+            self.machine.set_machine_var("audits_{}_{}".format(audit_class, event),
+                                         self.current_audits[audit_class][event])
+        self._dirty_audits.clear()
 
     def audit_switch(self, change: MonitoredSwitchChange):
         """Record switch change."""
@@ -152,7 +175,7 @@ class Auditor(object):
         """
         del kwargs
 
-        self.current_audits['events'][eventname] += 1
+        self.audit('events', eventname)
 
     def audit_player(self, **kwargs):
         """Called to write player data to the audit log.
@@ -225,6 +248,7 @@ class Auditor(object):
 
     def _save_audits(self, delay_secs=3, **kwargs):
         del kwargs
+        self._publish_audits()
         self.data_manager.save_all(data=self.current_audits,
                                    delay_secs=delay_secs)
 
@@ -233,6 +257,7 @@ class Auditor(object):
         del kwargs
         self.log.debug("Disabling the Auditor")
         self.enabled = False
+        self._publish_audits()
 
         # remove switch and event handlers
         self.machine.events.remove_handler(self.audit_event)
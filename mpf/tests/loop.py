@@ -384,6 +384,8 @@ class TestClock(ClockBase):
         self._mock_sockets = {}
         self._mock_servers = {}
         self._mock_serials = {}
+        self._mock_unix_sockets = {}
+        self._mock_unix_servers = {}
 
     def _create_event_loop(self):
         return self._test_loop
@@ -449,6 +451,48 @@ class TestClock(ClockBase):
         writer = asyncio.streams.StreamWriter(transport, protocol, reader, self.loop)
         return reader, writer
 
+    def mock_unix_socket(self, path, socket):
+        """Mock a Unix domain socket and use it for connections."""
+        self._mock_unix_sockets[path] = socket
+
+    def mock_unix_server(self, path, server):
+        """Mock a server on a Unix domain socket."""
+        self._mock_unix_servers[path] = server
+
+    @coroutine
+    def start_unix_server(self, client_connected_cb, path=None, **kwd):
+        """Mock listening server on a Unix domain socket."""
+        if path not in self._mock_unix_servers:
+            raise AssertionError("unix server not mocked for path {}".format(path))
+        server = self._mock_unix_servers[path]
+        if server.is_bound.done():
+            raise AssertionError("unix server already bound for path {}".format(path))
+
+        yield from server.bind(client_connected_cb)
+        return server
+
+    @coroutine
+    def open_unix_connection(self, path=None, *, limit=None, **kwds):
+        """Connect to a mocked Unix domain socket.
+
+        Raises FileNotFoundError if nothing is mocked at path like a real
+        connection to a socket which does not exist.
+        """
+        if path not in self._mock_unix_sockets:
+            raise FileNotFoundError("unix socket not mocked for path {}".format(path))
+        sock = self._mock_unix_sockets[path]
+        if sock.is_open:
+            raise AssertionError("unix socket already open for path {}".format(path))
+        sock.is_open = True
+
+        if not limit:
+            limit = asyncio.streams._DEFAULT_LIMIT
+        reader = asyncio.streams.StreamReader(limit=limit, loop=self.loop)
+        protocol = asyncio.streams.StreamReaderProtocol(reader, loop=self.loop)
+        transport = _SelectorSocketTransport(self.loop, sock, protocol)
+        writer = asyncio.streams.StreamWriter(transport, protocol, reader, self.loop)
+        return reader, writer
+
     def mock_serial(self, url, serial):
         """Mock a socket and use it for connections."""
         self._mock_serials[url] = serial
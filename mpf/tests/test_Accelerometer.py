@@ -152,3 +152,64 @@ class TestAccelerometer(MpfTestCase):
         self.machine_run()
         self.assertTrue(self._hit1)
         self.assertTrue(self._hit2)
+
+    def test_samples(self):
+        accelerometer = self.machine.accelerometers.test_accelerometer
+        accelerometer.config['hit_debounce'] = 100
+        accelerometer.config['level_hysteresis'] = 1
+
+        self._hit1 = 0
+        self._level1 = 0
+
+        def _hit1(**kwargs):
+            del kwargs
+            self._hit1 += 1
+
+        def _level1(**kwargs):
+            del kwargs
+            self._level1 += 1
+
+        self.machine.events.add_handler("event_hit1", _hit1)
+        self.machine.events.add_handler("event_level1", _level1)
+
+        # leveled with some noise
+        accelerometer.update_acceleration_samples([(0.0, 0.0, 1.0), (0.01, 0.02, 0.99), (0.0, 0.01, 1.0)])
+        self.machine_run()
+        self.assertEqual((0.0, 0.01, 1.0), accelerometer.value)
+        self.assertEqual(0, self._hit1)
+        self.assertEqual(0, self._level1)
+
+        # a nudge in the middle of the block posts only one hit
+        accelerometer.update_acceleration_samples([(0.0, 0.0, 1.0), (0.6, 0.0, 1.0), (0.7, 0.0, 1.0),
+                                                   (0.0, 0.0, 1.0)])
+        self.machine_run()
+        self.assertEqual(1, self._hit1)
+
+        # another nudge within hit_debounce is ignored
+        accelerometer.update_acceleration_samples([(0.7, 0.0, 1.0), (0.0, 0.0, 1.0)])
+        self.machine_run()
+        self.assertEqual(1, self._hit1)
+
+        self.advance_time_and_run(.1)
+        accelerometer.update_acceleration_samples([(0.7, 0.0, 1.0), (0.0, 0.0, 1.0)])
+        self.machine_run()
+        self.assertEqual(2, self._hit1)
+
+        # tilted by 3 degree. level event is posted once
+        tilted = (0.0, math.sin(math.radians(3)), math.cos(math.radians(3)))
+        for _ in range(5):
+            accelerometer.update_acceleration_samples([tilted, tilted])
+            self.machine_run()
+        self.assertEqual(1, self._level1)
+
+        # 1.5 degree is still within the hysteresis
+        accelerometer.update_acceleration(0.0, math.sin(math.radians(1.5)), math.cos(math.radians(1.5)))
+        accelerometer.update_acceleration(*tilted)
+        self.machine_run()
+        self.assertEqual(1, self._level1)
+
+        # leveled again
+        accelerometer.update_acceleration(0.0, 0.0, 1.0)
+        accelerometer.update_acceleration(*tilted)
+        self.machine_run()
+        self.assertEqual(2, self._level1)
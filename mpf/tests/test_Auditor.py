@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock
+
 from mpf.plugins.auditor import Auditor
 from mpf.tests.MpfTestCase import MpfTestCase
 
@@ -86,3 +88,27 @@ class TestAuditor(MpfTestCase):
         self.advance_time_and_run(1)
 
         self.assertEqual(2, auditor.current_audits['switches']['s_test'])
+
+    def test_batched_machine_vars(self):
+        auditor = self.machine.plugins[0]
+        auditor.enable()
+        self.advance_time_and_run()
+
+        self.machine.set_machine_var = MagicMock(wraps=self.machine.set_machine_var)
+        for _ in range(10):
+            self.hit_and_release_switch("s_test")
+        self.advance_time_and_run(.1)
+
+        # counted right away but not yet published
+        self.assertEqual(10, auditor.current_audits['switches']['s_test'])
+        self.assertMachineVarEqual(0, "audits_switches_s_test")
+        self.assertFalse(self.machine.set_machine_var.called)
+
+        self.advance_time_and_run(1)
+        self.assertMachineVarEqual(10, "audits_switches_s_test")
+        self.machine.set_machine_var.assert_called_once_with("audits_switches_s_test", 10)
+
+        # disable publishes pending audits
+        self.hit_and_release_switch("s_test")
+        auditor.disable()
+        self.assertMachineVarEqual(11, "audits_switches_s_test")
@@ -21,6 +21,45 @@ class TestBallDevice(MpfTestCase):
         del kwargs
         self._missing += 1
 
+    def test_routing(self):
+        trough = self.machine.ball_devices['test_trough']
+        launcher = self.machine.ball_devices['test_launcher']
+        target1 = self.machine.ball_devices['test_target1']
+        target2 = self.machine.ball_devices['test_target2']
+        target3 = self.machine.ball_devices['test_target3']
+        playfield = self.machine.playfield
+
+        self.assertEqual([trough, launcher, target1, playfield], list(trough.find_path_to_target(playfield)))
+        self.assertEqual([target2, target3, playfield], list(target2.find_path_to_target(playfield)))
+        self.assertEqual([target3, trough, launcher, target1], list(target3.find_path_to_target(target1)))
+        self.assertFalse(target1.find_path_to_target(trough))
+        # every lookup returns a new path
+        trough.find_path_to_target(playfield).popleft()
+        self.assertEqual(4, len(trough.find_path_to_target(playfield)))
+
+        self.assertEqual(trough, trough.find_next_trough())
+        self.assertEqual(target2, launcher.find_next_trough())
+        self.assertFalse(target1.find_next_trough())
+
+        self.assertFalse(target3.find_one_available_ball())
+        launcher.available_balls += 1
+        self.assertEqual([launcher, target2, target3], list(target3.find_one_available_ball()))
+        trough.available_balls += 1
+        self.assertEqual([launcher, target2, target3], list(target3.find_one_available_ball()))
+        launcher.available_balls -= 1
+        self.assertEqual([trough, launcher, target2, target3], list(target3.find_one_available_ball()))
+        trough.available_balls -= 1
+
+        # paths change only after the table is invalidated
+        target1.config['eject_targets'] = [target2]
+        self.assertEqual([trough, launcher, target1, playfield], list(trough.find_path_to_target(playfield)))
+        self.machine.ball_controller.routing.invalidate()
+        self.assertEqual([trough, launcher, target1, target2, target3, playfield],
+                         list(trough.find_path_to_target(playfield)))
+        self.assertEqual(target2, target1.find_next_trough())
+        target1.config['eject_targets'] = [playfield]
+        self.machine.ball_controller.routing.invalidate()
+
     def test_ball_count_during_eject(self):
         coil2 = self.machine.coils['eject_coil2']
         device2 = self.machine.ball_devices['test_launcher']
@@ -1,6 +1,7 @@
 """Test the bcp interface."""
 from unittest import mock
 
+from mpf.core.device_monitor import MonitoredAttribute
 from mpf.core.events import RegisteredHandler
 from mpf.tests.MpfBcpTestCase import MpfBcpTestCase
 
@@ -137,6 +138,33 @@ class TestBcpInterface(MpfBcpTestCase):
         self.hit_switch_and_run("s_test", .1)
         self.assertFalse(self._bcp_client.send_queue)
 
+    def test_device_monitor_without_subscribers(self):
+        switch_cls = type(self.machine.switches.s_test)
+        playfield_cls = type(self.machine.playfield)
+        # attributes are not tracked without monitors
+        self.assertNotIsInstance(switch_cls.__dict__["state"], MonitoredAttribute)
+        self.assertIsInstance(playfield_cls.__dict__["balls"], property)
+
+        monitor = mock.MagicMock()
+        self.machine.device_manager.add_monitor(monitor)
+        self.hit_switch_and_run("s_test", .1)
+        monitor.assert_called_once_with(self.machine.switches.s_test, "state", 0, 1)
+        monitor.reset_mock()
+
+        # property with setter
+        balls = self.machine.playfield.balls
+        self.machine.playfield.balls = balls + 1
+        monitor.assert_called_once_with(self.machine.playfield, "balls", balls, balls + 1)
+        self.assertEqual(balls + 1, self.machine.playfield.balls)
+        monitor.reset_mock()
+
+        self.machine.device_manager.remove_monitor(monitor)
+        self.assertNotIsInstance(switch_cls.__dict__["state"], MonitoredAttribute)
+        self.assertIsInstance(playfield_cls.__dict__["balls"], property)
+        self.release_switch_and_run("s_test", .1)
+        self.assertEqual(0, self.machine.switches.s_test.state)
+        self.assertFalse(monitor.called)
+
     def test_switch_monitor(self):
         self._bcp_client.send_queue.clear()
 
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from mpf.core.bcp.bcp_socket_client import decode_command_string, encode_command_string
 from mpf.tests.MpfTestCase import MpfTestCase
@@ -206,3 +206,20 @@ class TestBcpSocketMultipleClients(MpfTestCase):
         self.client_socket_2.recv_queue.append(b'receive_msg?param1=1&param2=2\n')
         self.advance_time_and_run()
         receiver.assert_called_once_with(param1="1", param2="2", client=self._bcp_client_2)
+
+    def testSendToAllClientsEncodesOnce(self):
+        self.advance_time_and_run()
+        # drop hello and reset
+        while not self.client_socket_1.send_queue.empty():
+            self.client_socket_1.send_queue.get_nowait()
+        while not self.client_socket_2.send_queue.empty():
+            self.client_socket_2.send_queue.get_nowait()
+
+        with patch("mpf.core.bcp.bcp_socket_client.encode_command_string",
+                   wraps=encode_command_string) as encoder:
+            self.machine.bcp.transport.send_to_all_clients("test_command", param1=1)
+            self.advance_time_and_run()
+
+        encoder.assert_called_once_with("test_command", param1=1)
+        self.assertEqual(b'test_command?param1=int:1\n', self.client_socket_1.send_queue.get_nowait())
+        self.assertEqual(b'test_command?param1=int:1\n', self.client_socket_2.send_queue.get_nowait())
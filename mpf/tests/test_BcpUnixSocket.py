@@ -0,0 +1,233 @@
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import unittest
+from typing import Tuple
+
+from mpf.core.bcp.bcp_server import BcpServer
+from mpf.core.bcp.bcp_socket_client import decode_command_string, encode_command_string
+from mpf.core.clock import ClockBase
+from mpf.tests.MpfTestCase import MpfTestCase
+from mpf.tests.test_BcpSocketClient import MockBcpQueueSocket
+from mpf.tests.loop import MockServer, MockQueueSocket
+
+SOCKET_PATH = "/tmp/mpf_test_bcp.sock"
+
+
+def _get_and_decode(client) -> Tuple[str, dict]:
+    data = client.send_queue.get_nowait()
+    return decode_command_string(data[0:-1].decode())
+
+
+class TestBcpUnixSocketClient(MpfTestCase):
+
+    def __init__(self, methodName='runTest'):
+        super().__init__(methodName)
+        self.machine_config_patches['bcp'] = {}
+        self.machine_config_patches['bcp']['servers'] = []
+        self.machine_config_patches['bcp']['connections'] = {'local_display': {'socket_path': SOCKET_PATH}}
+
+    def get_use_bcp(self):
+        return True
+
+    def _mock_loop(self):
+        # only the unix socket is mocked. connecting via TCP would fail
+        self.client_socket = MockBcpQueueSocket(self.loop)
+        self.clock.mock_unix_socket(SOCKET_PATH, self.client_socket)
+
+    def test_connect(self):
+        self.assertTrue(self.client_socket.is_open)
+        cmd, kwargs = _get_and_decode(self.client_socket)
+        self.assertEqual("hello", cmd)
+
+        self.mock_event("test_event")
+        self.client_socket.recv_queue.append((encode_command_string("trigger", name="test_event") + '\n').encode())
+        self.advance_time_and_run()
+        self.assertEventCalled("test_event")
+
+
+class TestBcpUnixSocketClientFallback(MpfTestCase):
+
+    def __init__(self, methodName='runTest'):
+        super().__init__(methodName)
+        self.machine_config_patches['bcp'] = {}
+        self.machine_config_patches['bcp']['servers'] = []
+        self.machine_config_patches['bcp']['connections'] = {'local_display': {'socket_path': SOCKET_PATH}}
+
+    def get_use_bcp(self):
+        return True
+
+    def _mock_loop(self):
+        # nothing listens on the unix socket
+        self.client_socket = MockBcpQueueSocket(self.loop)
+        self.clock.mock_socket("localhost", 5050, self.client_socket)
+
+    def test_fallback_to_tcp(self):
+        self.assertTrue(self.client_socket.is_open)
+        cmd, kwargs = _get_and_decode(self.client_socket)
+        self.assertEqual("hello", cmd)
+
+
+class TestBcpUnixSocketServer(MpfTestCase):
+
+    def __init__(self, methodName='runTest'):
+        super().__init__(methodName)
+        self.machine_config_patches['bcp'] = {}
+        self.machine_config_patches['bcp']['connections'] = []
+        self.machine_config_patches['bcp']['servers'] = {'url_style': {'socket_path': SOCKET_PATH}}
+
+    def get_use_bcp(self):
+        return True
+
+    def _mock_loop(self):
+        self.mock_server = MockServer(self.clock.loop)
+        self.clock.mock_server("127.0.0.1", 5051, self.mock_server)
+        self.mock_unix_server = MockServer(self.clock.loop)
+        self.clock.mock_unix_server(SOCKET_PATH, self.mock_unix_server)
+
+    def test_accept_client(self):
+        # both servers are listening
+        self.assertTrue(self.mock_server.is_bound.done())
+        self.assertTrue(self.mock_unix_server.is_bound.done())
+
+        client = MockQueueSocket(self.loop)
+        self.machine.clock.loop.run_until_complete(self.mock_unix_server.add_client(client))
+        self.advance_time_and_run()
+
+        cmd, kwargs = _get_and_decode(client)
+        self.assertEqual("hello", cmd)
+
+        self.mock_event("test_event")
+        client.recv_queue.append((encode_command_string("trigger", name="test_event") + '\n').encode())
+        self.advance_time_and_run()
+        self.assertEventCalled("test_event")
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix domain sockets are not supported")
+class TestBcpUnixSocketServerStaleSocket(MpfTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "bcp.sock")
+        self.server = BcpServer(self.machine, "127.0.0.1", 5051, "mpf.core.bcp.bcp_socket_client.BCPClientSocket",
+                                self.path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        super().tearDown()
+
+    def test_remove_stale_socket(self):
+        # nothing there
+        self.server._remove_stale_socket()
+
+        # nobody listens anymore
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(self.path)
+        sock.close()
+        self.server._remove_stale_socket()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_keep_socket_in_use(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(self.path)
+        sock.listen(1)
+        try:
+            with self.assertRaises(AssertionError):
+                self.server._remove_stale_socket()
+            self.assertTrue(os.path.exists(self.path))
+        finally:
+            sock.close()
+
+    def test_keep_other_files(self):
+        with open(self.path, "w") as f:
+            f.write("test")
+        self.server._remove_stale_socket()
+        self.assertTrue(os.path.exists(self.path))
+
+
+class _RealLoopClock(ClockBase):
+
+    def _create_event_loop(self):
+        return asyncio.new_event_loop()
+
+
+# the other end of the socket runs in a separate process
+CHILD_SERVER = """
+import socket, sys
+server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+server.bind(sys.argv[1])
+server.listen(1)
+print("ready", flush=True)
+conn, _ = server.accept()
+line = conn.makefile("rb").readline()
+conn.sendall(line.replace(b"ping", b"pong"))
+conn.close()
+"""
+
+CHILD_CLIENT = """
+import socket, sys
+client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+client.connect(sys.argv[1])
+client.sendall(b"ping?value=int:5\\n")
+sys.stdout.buffer.write(client.makefile("rb").readline())
+"""
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix domain sockets are not supported")
+class TestUnixSocketProcesses(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "bcp.sock")
+        self.clock = _RealLoopClock()
+
+    def tearDown(self):
+        self.clock.loop.close()
+        self.tmp_dir.cleanup()
+
+    def test_connect_to_other_process(self):
+        child = subprocess.Popen([sys.executable, "-c", CHILD_SERVER, self.path], stdout=subprocess.PIPE)
+        try:
+            self.assertEqual(b"ready\n", child.stdout.readline())
+
+            @asyncio.coroutine
+            def _ping():
+                reader, writer = yield from self.clock.open_unix_connection(self.path)
+                writer.write((encode_command_string("ping", value=5) + "\n").encode())
+                answer = yield from reader.readline()
+                writer.close()
+                return answer
+
+            answer = self.clock.loop.run_until_complete(asyncio.wait_for(_ping(), 10, loop=self.clock.loop))
+            self.assertEqual(("pong", {"value": 5}), decode_command_string(answer[0:-1].decode()))
+        finally:
+            child.wait(10)
+            child.stdout.close()
+
+    def test_accept_other_process(self):
+        received = []
+
+        @asyncio.coroutine
+        def _accept(reader, writer):
+            line = yield from reader.readline()
+            received.append(decode_command_string(line[0:-1].decode()))
+            writer.write(b"pong\n")
+            yield from writer.drain()
+            writer.close()
+
+        server = self.clock.loop.run_until_complete(
+            self.clock.start_unix_server(_accept, self.path, loop=self.clock.loop))
+        child = subprocess.Popen([sys.executable, "-c", CHILD_CLIENT, self.path], stdout=subprocess.PIPE)
+        try:
+            output = self.clock.loop.run_until_complete(
+                self.clock.loop.run_in_executor(None, child.communicate, None, 10))[0]
+        finally:
+            server.close()
+            self.clock.loop.run_until_complete(server.wait_closed())
+
+        self.assertEqual(b"pong\n", output)
+        self.assertEqual([("ping", {"value": 5})], received)
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+
+from mpf.benchmarks.results import BenchmarkResults
+
+
+class TestBenchmarkResults(unittest.TestCase):
+
+    def test_save_and_load(self):
+        results = BenchmarkResults()
+        results.add("events.post", 1000.0, "events/s")
+        results.add("modes.start_stop_time", 5.0, "ms", higher_is_better=False)
+
+        fd, filename = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            results.save(filename)
+            loaded = BenchmarkResults.load(filename)
+        finally:
+            os.remove(filename)
+
+        self.assertEqual(results.results, loaded.results)
+        self.assertEqual(results.info["mpf_version"], loaded.info["mpf_version"])
+
+    def test_compare(self):
+        baseline = BenchmarkResults()
+        baseline.add("events.post", 1000.0, "events/s")
+        baseline.add("lights.updates", 1000.0, "updates/s")
+        baseline.add("modes.start_stop_time", 5.0, "ms", higher_is_better=False)
+        baseline.add("removed", 5.0, "ms", higher_is_better=False)
+
+        current = BenchmarkResults()
+        current.add("events.post", 1200.0, "events/s")
+        current.add("lights.updates", 800.0, "updates/s")
+        current.add("modes.start_stop_time", 6.0, "ms", higher_is_better=False)
+        current.add("new", 5.0, "ms", higher_is_better=False)
+
+        comparisons = {comparison.name: comparison for comparison in current.compare(baseline, 0.1)}
+        self.assertEqual({"events.post", "lights.updates", "modes.start_stop_time"}, set(comparisons.keys()))
+
+        self.assertAlmostEqual(0.2, comparisons["events.post"].change)
+        self.assertFalse(comparisons["events.post"].regression)
+
+        self.assertAlmostEqual(-0.2, comparisons["lights.updates"].change)
+        self.assertTrue(comparisons["lights.updates"].regression)
+
+        # lower is better for durations
+        self.assertAlmostEqual(-0.2, comparisons["modes.start_stop_time"].change)
+        self.assertTrue(comparisons["modes.start_stop_time"].regression)
+
+        # within the threshold
+        comparisons = {comparison.name: comparison for comparison in current.compare(baseline, 0.25)}
+        self.assertFalse(comparisons["lights.updates"].regression)
@@ -1,3 +1,5 @@
+import math
+
 from mpf.tests.MpfTestCase import MpfTestCase
 from unittest.mock import MagicMock
 
@@ -121,3 +123,43 @@ class TestDelay(MpfTestCase):
         self.callback = MagicMock()
         self.advance_time_and_run(1)
         self.callback.assert_not_called()
+
+    def test_delays_in_same_tick(self):
+        calls = []
+        wheel = self.machine.clock.timer_wheel
+        # start just after a tick
+        now = self.machine.clock.get_time()
+        self.advance_time_and_run(math.ceil(now * 1000) / 1000 - now + .0002)
+        wakeups = wheel.wakeups
+
+        # all delays end within the same millisecond
+        self.machine.delay.add(100, lambda: calls.append("a"))
+        self.advance_time_and_run(.0003)
+        self.machine.delay.add(100, lambda: calls.append("b"), "b")
+        self.machine.delay.add(99.6, lambda: calls.append("c"))
+        for _ in range(50):
+            self.machine.delay.add(100, lambda: calls.append("x"))
+        self.machine.delay.remove("b")
+
+        self.advance_time_and_run(.1)
+        self.assertEqual([], calls)
+        self.advance_time_and_run(.0005)
+        # in order of their end time and only one loop callback
+        self.assertEqual(["c", "a"] + ["x"] * 50, calls)
+        self.assertEqual(wakeups + 1, wheel.wakeups)
+        self.assertEqual(0, len(wheel))
+        self.assertEqual({}, self.machine.delay.delays)
+
+    def test_delay_in_callback(self):
+        calls = []
+
+        def callback():
+            calls.append(self.machine.clock.get_time())
+            if len(calls) < 3:
+                self.machine.delay.add(0, callback)
+
+        self.machine.delay.add(10, callback)
+        start = self.machine.clock.get_time()
+        self.advance_time_and_run(.1)
+        self.assertEqual(3, len(calls))
+        self.assertAlmostEqual(start + .01, calls[2])
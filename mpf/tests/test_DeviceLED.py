@@ -314,3 +314,19 @@ class TestLed(MpfTestCase):
         self.assertEqual(80 / 255.0, led.hw_drivers["red"].current_brightness)
         self.assertEqual(80 / 255.0, led.hw_drivers["green"].current_brightness)
         self.assertEqual(80 / 255.0, led.hw_drivers["blue"].current_brightness)
+
+    def test_fade_ends_before_max_fade_ms(self):
+        led = self.machine.lights.led1
+        led.color(RGBColor((0, 0, 0)))
+        self.advance_time_and_run(1)
+
+        led.color(RGBColor((200, 100, 50)), fade_ms=100)
+        self.advance_time_and_run(.05)
+
+        # the remaining fade is shorter than the requested window
+        color, fade_ms = led._get_color_and_fade(1000)
+        self.assertEqual(RGBColor((200, 100, 50)), color)
+        self.assertTrue(0 < fade_ms <= 50)
+        brightness, fade_ms = led._get_brightness_and_fade(1000, "red")
+        self.assertEqual(200 / 255.0, brightness)
+        self.assertTrue(0 < fade_ms <= 50)
@@ -33,3 +33,28 @@ class TestDeviceManager(MpfTestCase):
                 self.assertEqual(sig.parameters['kwargs'].kind, inspect._VAR_KEYWORD,
                     "Method {}.{} kwargs param is missing '**'".format(
                     device_type, method_name))
+
+    def test_device_collections(self):
+        # the index has to match the device classes
+        for config_section, (collection, device_type) in self.machine.config['mpf']['device_collections'].items():
+            self.assertIn(device_type, self.machine.config['mpf']['device_modules'])
+            device_cls = Util.string_to_class(device_type)
+            self.assertEqual((collection, config_section), device_cls.get_config_info())
+            # config specs of devices are loaded before we know whether the device is used
+            self.assertFalse(device_cls.get_config_spec())
+
+    def test_lazy_device_modules(self):
+        # steppers are not used in this machine
+        self.assertNotIn("mpf.devices.stepper.Stepper", self.machine.import_times)
+        self.assertNotIn("steppers", self.machine.device_manager.device_classes)
+        self.assertIn("steppers", self.machine.device_manager.collections)
+        self.assertEqual(0, len(self.machine.steppers))
+
+        # playfields are always used
+        self.assertIn("mpf.devices.playfield.Playfield", self.machine.import_times)
+        self.assertIn("playfields", self.machine.device_manager.device_classes)
+        self.assertIn("playfield", self.machine.playfields)
+
+        # core modules and platforms are timed as well
+        self.assertIn("mpf.core.events.EventManager", self.machine.import_times)
+        self.assertIn("mpf.platforms.virtual.VirtualHardwarePlatform", self.machine.import_times)
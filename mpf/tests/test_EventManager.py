@@ -328,6 +328,38 @@ class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
         self.assertEqual(tuple(), self._handler2_args)
         self.assertEqual(dict(), self._handler2_kwargs)
 
+    def test_handler_batch(self):
+        keys = list()
+        with self.machine.events.handler_batch():
+            keys.append(self.machine.events.add_handler('test_event', self.event_handler1, priority=100))
+            keys.append(self.machine.events.add_handler('test_event', self.event_handler2, priority=200))
+            with self.machine.events.handler_batch():
+                keys.append(self.machine.events.add_handler('test_event', self.event_handler3, priority=200))
+                keys.append(self.machine.events.add_handler('test_event2', self.event_handler1))
+
+            # handlers are not sorted before the outermost batch ends
+            self.assertEqual([self.event_handler1, self.event_handler2, self.event_handler3],
+                             [h.callback for h in self.machine.events.registered_handlers['test_event']])
+
+        # same order as if they were added one by one
+        self.assertEqual([self.event_handler2, self.event_handler3, self.event_handler1],
+                         [h.callback for h in self.machine.events.registered_handlers['test_event']])
+
+        self.machine.events.post('test_event')
+        self.advance_time_and_run(1)
+        self.assertEqual([self.event_handler2, self.event_handler3, self.event_handler1], self._handlers_called)
+
+        # remove some handlers of test_event and all of test_event2 in one call
+        self.machine.events.remove_handlers_by_keys(keys[1:])
+        self.assertEqual([self.event_handler1],
+                         [h.callback for h in self.machine.events.registered_handlers['test_event']])
+        self.assertFalse(self.machine.events.does_event_exist('test_event2'))
+
+        # removing them again does nothing
+        self.machine.events.remove_handlers_by_keys(keys[1:])
+        self.machine.events.remove_handlers_by_keys(keys)
+        self.assertFalse(self.machine.events.does_event_exist('test_event'))
+
     def test_does_event_exist(self):
         self.machine.events.add_handler('test_event', self.event_handler1)
 
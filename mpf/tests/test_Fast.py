@@ -1,7 +1,11 @@
+import asyncio
+import unittest
+
 from mpf.core.platform import SwitchConfig
 from mpf.core.platform_controller import DriverRuleSettings
 from mpf.core.platform_controller import SwitchRuleSettings
 from mpf.core.rgb_color import RGBColor
+from mpf.platforms.fast.fast_send_queue import FastSendQueue
 from mpf.tests.MpfTestCase import MpfTestCase
 
 from mpf.tests.loop import MockSerial
@@ -69,13 +73,20 @@ class MockFastDmd(BaseMockFast):
     def __init__(self):
         super().__init__()
         self.type = "DMD"
+        self.header = b''
 
     def write(self, msg):
         msg_len = len(msg)
         if msg == (b' ' * 256 * 4) + b"\r":
             return msg_len
 
-        cmd = msg
+        # header and frame are written separately
+        if msg == b'BM:':
+            self.header = msg
+            return msg_len
+
+        cmd = self.header + msg
+        self.header = b''
 
         if cmd[:3] == "WD:":
             self.queue.append("WD:P")
@@ -599,6 +610,35 @@ class TestFast(MpfTestCase):
 
         self.assertFalse(self.dmd_cpu.expected_commands)
 
+    def test_flow_control(self):
+        connection = self.machine.default_platform.rgb_connection
+        written = []
+        original_write = self.rgb_cpu.write
+
+        def _write(msg):
+            written.append(msg.decode()[:-1])
+            return original_write(msg)
+
+        self.rgb_cpu.write = _write
+        self.rgb_cpu.expected_commands = {"TL:10,01": "TL:P"}
+
+        # the board did not confirm enough messages yet
+        connection.send_ready.clear()
+        connection.send("RS:97ffffff")
+        self.advance_time_and_run(.01)
+        connection.send("TL:10,01")
+        connection.send("RS:97001122")
+        self.advance_time_and_run(.01)
+        self.assertEqual([], written)
+
+        # the command queued later overtakes the LED update and the LED
+        # update is merged with the newer color
+        connection.send_ready.set()
+        self.advance_time_and_run(.1)
+        self.assertEqual(["TL:10,01", "RS:97001122"], written)
+        self.assertEqual("001122", self.rgb_cpu.leds['97'])
+        self.assertFalse(self.rgb_cpu.expected_commands)
+
     def test_lights_and_leds(self):
         self._test_matrix_light()
         self._test_pdb_gi_light()
@@ -748,3 +788,49 @@ class TestFast(MpfTestCase):
         device.color(RGBColor((2, 23, 42)))
         self.advance_time_and_run(1)
         self.assertEqual("02172a", self.rgb_cpu.leds['97'])
+
+
+class TestFastSendQueue(unittest.TestCase):
+
+    def test_priorities_and_coalescing(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        queue = FastSendQueue(loop)
+        self.assertTrue(queue.empty())
+        self.assertIsNone(queue.get_nowait())
+
+        queue.put("WD:3e8")
+        queue.put("RS:97ffffff,99000000")
+        queue.put("WD:3e8")
+        queue.put("RS:97001122,98aabbcc")
+        queue.put("DL:10,89,00,10,0A,ff,00,00,00")
+        queue.put("TL:10,01")
+        queue.put("RA:000000")
+        queue.put("RS:97102030")
+
+        self.assertEqual(8, queue.max_depth)
+        self.assertEqual(2, queue.coalesced)
+        self.assertEqual({"depth_default": 2, "depth_led": 5, "depth_watchdog": 1, "max_depth": 8,
+                          "coalesced": 2, "sent": 0}, queue.get_stats())
+
+        # drivers first and in order, then LEDs, watchdog last
+        self.assertEqual("DL:10,89,00,10,0A,ff,00,00,00", queue.get_nowait())
+        self.assertEqual("TL:10,01", queue.get_nowait())
+        self.assertEqual("RS:97001122,99000000,98aabbcc", queue.get_nowait())
+        self.assertEqual("RA:000000", queue.get_nowait())
+        self.assertEqual("RS:97102030", loop.run_until_complete(queue.get()))
+        self.assertEqual("WD:3e8", queue.get_nowait())
+        self.assertTrue(queue.empty())
+        self.assertEqual(0, queue.depth)
+        self.assertEqual(6, queue.sent)
+
+        # bytes (e.g. DMD frames) are sent in order
+        queue.put(b'\x00\x01')
+        self.assertEqual(b'\x00\x01', queue.get_nowait())
+
+        # only the latest pending DMD frame is sent
+        queue.put(b'\x00\x01')
+        queue.put(memoryview(b'\x00\x02'))
+        self.assertEqual(3, queue.coalesced)
+        self.assertEqual(b'\x00\x02', queue.get_nowait())
+        self.assertTrue(queue.empty())
@@ -0,0 +1,201 @@
+"""Test the input journal."""
+import os
+import tempfile
+
+from mpf.core.input_journal import read_journal, KIND_SWITCH, KIND_BCP
+from mpf.tests.MpfBcpTestCase import MpfBcpTestCase
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class TestInputJournal(MpfBcpTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/input_journal/'
+
+    def setUp(self):
+        super().setUp()
+        fd, self.filename = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+
+    def tearDown(self):
+        super().tearDown()
+        os.remove(self.filename)
+
+    def _record_events(self):
+        events = []
+        start = self.machine.clock.get_time()
+        for event in ("s_test_active", "s_test_inactive", "s_test_nc_active", "s_bcp_active", "journal_trigger"):
+            self.machine.events.add_handler(
+                event, lambda event_name=event, **kwargs: events.append(
+                    (event_name, round(self.machine.clock.get_time() - start, 3))))
+        return events
+
+    def _platform_switch(self, name, state, logical=False):
+        switch = self.machine.switches[name]
+        self.machine.switch_controller.process_switch_by_num(switch.hw_switch.number, state, switch.platform,
+                                                             logical)
+
+    def _feed_inputs(self):
+        self.advance_time_and_run(.1)
+        self._platform_switch("s_test", 1)
+        self.advance_time_and_run(.25)
+        self._platform_switch("s_test", 0)
+        self.advance_time_and_run(.5)
+        self._platform_switch("s_test_nc", 1, logical=True)
+        self.advance_time_and_run(.2)
+        self._bcp_client.receive_queue.put_nowait(('switch', {'name': 's_bcp', 'state': 1}))
+        self.advance_time_and_run(.3)
+        self._bcp_client.receive_queue.put_nowait(('trigger', {'name': 'journal_trigger', 'value': 7}))
+        self.advance_time_and_run(1)
+
+    def test_record_and_replay(self):
+        journal = self.machine.input_journal
+        self.assertFalse(journal.recording)
+
+        events = self._record_events()
+        journal.start_recording(self.filename)
+        self._feed_inputs()
+        journal.stop_recording()
+        self.assertFalse(self.machine.switch_controller.input_journal)
+
+        with open(self.filename, "rb") as f:
+            entries = list(read_journal(f.read()))
+
+        self.assertEqual([KIND_SWITCH, KIND_SWITCH, KIND_SWITCH, KIND_BCP, KIND_BCP], [e.kind for e in entries])
+        self.assertEqual(("s_test", 1, False), entries[0].args)
+        self.assertEqual(("s_test", 0, False), entries[1].args)
+        # states are recorded as passed in
+        self.assertEqual(("s_test_nc", 1, True), entries[2].args)
+        # switch changes caused by BCP are only recorded as BCP command
+        self.assertEqual(("local_display", "switch", {'name': 's_bcp', 'state': 1}), entries[3].args)
+        self.assertEqual(("local_display", "trigger", {'name': 'journal_trigger', 'value': 7}), entries[4].args)
+        self.assertAlmostEqual(.1, entries[0].offset, delta=.01)
+        self.assertAlmostEqual(.35, entries[1].offset, delta=.01)
+
+        recorded_events = list(events)
+        self.assertEqual(["s_test_active", "s_test_inactive", "s_test_nc_active", "s_bcp_active", "journal_trigger"],
+                         [event for event, _ in recorded_events])
+
+        # bring switches back into their initial state
+        self.release_switch_and_run("s_test_nc", 1)
+        self.release_switch_and_run("s_bcp", 1)
+
+        events.clear()
+        replayed_events = self._record_events()
+        done = []
+        self.machine.events.add_handler("input_journal_replay_done", lambda **kwargs: done.append(True))
+        journal.replay(self.filename)
+        self.assertTrue(journal.replaying)
+        self.advance_time_and_run(5)
+
+        self.assertTrue(done)
+        self.assertFalse(journal.replaying)
+        self.assertEqual(recorded_events, replayed_events)
+
+    def test_flush(self):
+        journal = self.machine.input_journal
+        journal.start_recording(self.filename)
+        self._platform_switch("s_test", 1)
+        self._platform_switch("s_test", 0)
+        # nothing is written before the next flush
+        self.assertEqual(0, os.path.getsize(self.filename))
+
+        self.advance_time_and_run(1)
+        with open(self.filename, "rb") as f:
+            self.assertEqual(2, len(list(read_journal(f.read()))))
+
+        # a partially written record is ignored
+        with open(self.filename, "ab") as f:
+            f.write(b"\x00\x01")
+        with open(self.filename, "rb") as f:
+            self.assertEqual(2, len(list(read_journal(f.read()))))
+
+        journal.stop_recording()
+
+    def test_rawbytes(self):
+        received = []
+        self.machine.bcp.interface.register_command_callback(
+            "test_raw", lambda client, **kwargs: received.append(kwargs))
+
+        journal = self.machine.input_journal
+        journal.start_recording(self.filename)
+        # raw bytes may contain newlines
+        self._bcp_client.receive_queue.put_nowait(('test_raw', {'name': 'frame', 'rawbytes': b'\x00\n\x01\xff'}))
+        self.advance_time_and_run(.1)
+        journal.stop_recording()
+
+        with open(self.filename, "rb") as f:
+            entries = list(read_journal(f.read()))
+        self.assertEqual([("local_display", "test_raw", {'name': 'frame', 'rawbytes': b'\x00\n\x01\xff'})],
+                         [e.args for e in entries])
+
+        received.clear()
+        journal.replay(self.filename)
+        self.advance_time_and_run(1)
+        self.assertEqual([{'name': 'frame', 'rawbytes': b'\x00\n\x01\xff'}], received)
+
+
+class TestInputJournalSmartVirtual(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'test_smart_virtual.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/smart_virtual_platform/'
+
+    def get_platform(self):
+        return 'smart_virtual'
+
+    def setUp(self):
+        super().setUp()
+        fd, self.filename = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+
+    def tearDown(self):
+        super().tearDown()
+        os.remove(self.filename)
+
+    def _drain_ball(self):
+        switch = self.machine.switches.outhole
+        self.machine.switch_controller.process_switch_by_num(switch.hw_switch.number, 1, switch.platform, True)
+
+    def test_simulated_switches_are_not_recorded(self):
+        journal = self.machine.input_journal
+        outhole = self.machine.ball_devices.outhole
+        trough = self.machine.ball_devices.trough
+        # make room for one ball in the trough
+        self.release_switch_and_run("trough3", 1)
+        self.assertEqual(2, trough.balls)
+
+        self.mock_event("balldevice_outhole_ball_eject_success")
+        journal.start_recording(self.filename)
+        self.advance_time_and_run(.1)
+        self._drain_ball()
+        self.advance_time_and_run(5)
+        journal.stop_recording()
+        self.assertEventCalled("balldevice_outhole_ball_eject_success", 1)
+        self.assertEqual(0, outhole.balls)
+        self.assertEqual(3, trough.balls)
+
+        # the outhole eject and the ball entering the trough are simulated
+        with open(self.filename, "rb") as f:
+            entries = list(read_journal(f.read()))
+        self.assertEqual([(KIND_SWITCH, ("outhole", 1, True))], [(e.kind, e.args) for e in entries])
+
+        # the replay drains the ball once. the eject is simulated again
+        self.release_switch_and_run("trough3", 1)
+        self.assertEqual(2, trough.balls)
+        self.mock_event("balldevice_outhole_ball_eject_success")
+        switch_changes = []
+        self.machine.switch_controller.add_monitor(switch_changes.append)
+        journal.replay(self.filename)
+        self.advance_time_and_run(5)
+        self.assertFalse(journal.replaying)
+        self.assertEventCalled("balldevice_outhole_ball_eject_success", 1)
+        self.assertEqual(0, outhole.balls)
+        self.assertEqual(3, trough.balls)
+        self.assertEqual([("outhole", 1), ("outhole", 0)],
+                         [(change.name, change.state) for change in switch_changes if change.name == "outhole"])
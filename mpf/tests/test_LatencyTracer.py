@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock
+
+from mpf.commands.latency import Command
+from mpf.core.latency_tracer import LatencyHistogram
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class TestLatencyTracer(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/latency_tracer/'
+
+    def test_trace_switch_to_outputs(self):
+        self.assertTrue(self.machine.latency_tracer.enabled)
+        self.hit_and_release_switch("s_bumper")
+        self.advance_time_and_run()
+
+        self.assertEqual("red", self.machine.lights.l_bumper.get_color().name)
+        stats = self.machine.latency_tracer.get_stats()
+        self.assertEqual(2, stats["s_bumper"]["switch"]["count"])
+        self.assertEqual(1, stats["s_bumper"]["driver"]["count"])
+        self.assertEqual(1, stats["s_bumper"]["light"]["count"])
+        self.assertLessEqual(1, stats["s_bumper"]["event"]["count"])
+        self.assertIsNone(self.machine.latency_tracer.current)
+
+        # no trace outside of switch changes
+        self.machine.coils.c_bumper.pulse()
+        self.assertEqual(1, self.machine.latency_tracer.get_stats()["s_bumper"]["driver"]["count"])
+
+        # switches without handlers only record the switch stage
+        self.hit_and_release_switch("s_other")
+        self.advance_time_and_run()
+        self.assertEqual(["switch"], list(self.machine.latency_tracer.get_stats()["s_other"].keys()))
+
+    def test_platform_timestamp(self):
+        switch = self.machine.switches.s_bumper
+        timestamp = self.machine.latency_tracer.stamp() - 0.005
+        self.machine.switch_controller.process_switch_by_num(switch.hw_switch.number, 1, switch.platform,
+                                                             timestamp=timestamp)
+        self.advance_time_and_run()
+        stats = self.machine.latency_tracer.get_stats()
+        self.assertLessEqual(5, stats["s_bumper"]["switch"]["min"])
+        self.assertLessEqual(5, stats["s_bumper"]["driver"]["min"])
+
+    def test_bcp_and_report(self):
+        self.hit_and_release_switch("s_bumper")
+        self.advance_time_and_run()
+
+        stats = self.machine.latency_tracer.get_stats()
+        client = MagicMock()
+        self.machine.bcp.transport.send_to_client = MagicMock()
+        self.machine.latency_tracer._bcp_receive_latency_stats(client=client, reset=True)
+        self.machine.bcp.transport.send_to_client.assert_called_once_with(client, "latency_stats", stats=stats)
+        self.assertEqual({}, self.machine.latency_tracer.get_stats())
+
+    def test_histogram(self):
+        histogram = LatencyHistogram()
+        self.assertIsNone(histogram.percentile(50))
+        for value in (0.05, 0.3, 0.3, 0.7, 3, 300):
+            histogram.add(value)
+
+        self.assertEqual(6, histogram.count)
+        self.assertEqual(0.05, histogram.min)
+        self.assertEqual(300, histogram.max)
+        self.assertEqual(0.5, histogram.percentile(50))
+        self.assertEqual(300, histogram.percentile(99))
+
+        data = histogram.to_dict()
+        self.assertEqual(data, LatencyHistogram.from_dict(data).to_dict())
+
+        report = Command.format_report({"s_bumper": {"switch": data}})
+        self.assertIn("s_bumper", report)
+        self.assertIn("300.000", report)
+        self.assertEqual("No latencies recorded.", Command.format_report({}))
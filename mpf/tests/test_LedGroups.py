@@ -1,4 +1,6 @@
 """Test led groups."""
+from unittest.mock import MagicMock
+
 from mpf.core.rgb_color import RGBColor
 from mpf.tests.MpfTestCase import MpfTestCase
 
@@ -20,6 +22,33 @@ class TestLedPlayer(MpfTestCase):
         self.assertLightColor("stripe1_light_13", "red")
         self.assertLightColor("stripe1_light_14", "red")
 
+    def test_color_with_fade(self):
+        self.machine.default_platform.light_sync = MagicMock()
+        self.machine.lights["stripe1_light_12"].color("green", priority=10, key="other")
+
+        self.machine.light_stripes['stripe1'].color("blue", fade_ms=1000, priority=5, key="test")
+        # only synced once for all lights
+        self.assertEqual(2, self.machine.default_platform.light_sync.call_count)
+        # lights in the same state share the stack entry
+        self.assertIs(self.machine.lights["stripe1_light_10"].stack[0],
+                      self.machine.lights["stripe1_light_14"].stack[0])
+        self.assertEqual("other", self.machine.lights["stripe1_light_12"].stack[0]['key'])
+
+        self.advance_time_and_run(.5)
+        self.assertLightColor("stripe1_light_10", [0, 0, 127])
+        self.assertLightColor("stripe1_light_14", [0, 0, 127])
+        self.assertLightColor("stripe1_light_12", "green")
+        self.advance_time_and_run(.5)
+        self.assertLightColor("stripe1_light_10", "blue")
+        self.assertLightColor("stripe1_light_14", "blue")
+
+        # lower priority with the same key does not replace the entry
+        self.machine.light_stripes['stripe1'].color("red", priority=1, key="test")
+        self.assertLightColor("stripe1_light_10", "blue")
+
+        self.machine.lights["stripe1_light_12"].remove_from_stack_by_key("other")
+        self.assertLightColor("stripe1_light_12", "blue")
+
     def test_config(self):
         # stripe 1
         self.assertEqual("10-r", self.machine.lights["stripe1_light_10"].hw_drivers["red"].number)
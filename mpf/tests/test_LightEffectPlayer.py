@@ -0,0 +1,75 @@
+"""Test light effect player."""
+from unittest.mock import MagicMock
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class TestLightEffectPlayer(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/light_effect_player/'
+
+    def test_sweep(self):
+        self.post_event("play_sweep")
+        self.advance_time_and_run(.5)
+        # the band is in the center of the stripe
+        self.assertLightColor("stripe1_light_10", "off")
+        self.assertLightColor("stripe1_light_11", "off")
+        self.assertLightColor("stripe1_light_12", "red")
+        self.assertLightColor("stripe1_light_13", "off")
+        self.assertLightColor("stripe1_light_14", "off")
+        self.assertEqual(10, self.machine.lights["stripe1_light_12"].stack[0]['priority'])
+
+        self.advance_time_and_run(.1)
+        self.assertLightColor("stripe1_light_12", [102, 0, 0])
+        self.assertLightColor("stripe1_light_13", [153, 0, 0])
+
+        # one sync per frame for all lights
+        self.machine.default_platform.light_sync = MagicMock()
+        self.advance_time_and_run(.1)
+        self.assertEqual(1, self.machine.default_platform.light_sync.call_count)
+
+        self.post_event("stop_sweep")
+        self.advance_time_and_run(.1)
+        for number in range(10, 15):
+            self.assertFalse(self.machine.lights["stripe1_light_{}".format(number)].stack)
+
+    def test_chase(self):
+        self.post_event("play_chase")
+        self.advance_time_and_run(.1)
+        self.assertLightColor("stripe1_light_10", "blue")
+        self.assertLightColor("stripe1_light_11", "off")
+        self.assertLightColor("stripe1_light_12", "blue")
+
+        self.advance_time_and_run(.5)
+        self.assertLightColor("stripe1_light_10", "off")
+        self.assertLightColor("stripe1_light_11", "blue")
+        self.assertLightColor("stripe1_light_12", "off")
+
+        # playing again replaces the effect
+        self.post_event("play_chase")
+        self.advance_time_and_run(.1)
+        self.assertLightColor("stripe1_light_10", "blue")
+        self.assertEqual(1, len(self.machine.lights["stripe1_light_10"].stack))
+
+    def test_gradient(self):
+        self.post_event("play_gradient")
+        self.advance_time_and_run(.1)
+        self.assertLightColor("led1", "off")
+        self.assertLightColor("led2", "white")
+
+    def test_show(self):
+        show = self.machine.shows["effect_show"].play()
+        self.advance_time_and_run(.5)
+        for number in range(10, 15):
+            color = self.machine.lights["stripe1_light_{}".format(number)].get_color()
+            self.assertEqual(0, color.red)
+            self.assertEqual(0, color.blue)
+
+        show.stop()
+        self.advance_time_and_run(.1)
+        for number in range(10, 15):
+            self.assertFalse(self.machine.lights["stripe1_light_{}".format(number)].stack)
@@ -0,0 +1,162 @@
+import asyncio
+import gc
+import unittest
+import weakref
+
+from mpf.platforms.interfaces.light_platform_interface import LightPlatformSoftwareFade, FadeScheduler
+from mpf.tests.loop import TimeTravelLoop
+
+
+class SoftwareFadeLight(LightPlatformSoftwareFade):
+
+    __slots__ = ["brightness_log"]
+
+    def __init__(self, loop, software_fade_ms):
+        super().__init__(loop, software_fade_ms)
+        self.brightness_log = []
+
+    def set_brightness(self, brightness: float):
+        self.brightness_log.append(brightness)
+
+    def get_board_name(self):
+        return "Test"
+
+
+class LinearFade(object):
+
+    """Fade from 0 to 1 within fade_ms."""
+
+    def __init__(self, loop, fade_ms):
+        self.loop = loop
+        self.start = loop.time()
+        self.fade_ms = fade_ms
+        self.calls = 0
+
+    def __call__(self, max_fade_ms):
+        self.calls += 1
+        remaining_ms = int(round(self.fade_ms - (self.loop.time() - self.start) * 1000))
+        if remaining_ms <= 0:
+            return 1.0, -1
+        if remaining_ms <= max_fade_ms:
+            return 1.0, remaining_ms
+        return 1.0 - (remaining_ms - max_fade_ms) / self.fade_ms, max_fade_ms
+
+
+class TestFadeScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = TimeTravelLoop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def advance_time(self, delta):
+        self.loop.run_until_complete(asyncio.sleep(delay=delta, loop=self.loop))
+
+    def test_one_timer_for_all_lights(self):
+        lights = [SoftwareFadeLight(self.loop, 10) for _ in range(200)]
+        fades = []
+        for light in lights:
+            fade = LinearFade(self.loop, 100)
+            fades.append(fade)
+            light.set_fade(fade)
+
+        scheduler = FadeScheduler.get(self.loop, 10)
+        self.assertEqual(200, scheduler.fading_lights)
+        self.assertEqual(0, scheduler.ticks)
+
+        self.advance_time(.2)
+        # the fade took ten ticks for all lights together
+        self.assertEqual(10, scheduler.ticks)
+        self.assertEqual(0, scheduler.fading_lights)
+        for light, fade in zip(lights, fades):
+            self.assertEqual(11, fade.calls)
+            self.assertEqual(1.0, light.brightness_log[-1])
+            self.assertEqual(11, len(light.brightness_log))
+
+        # no timer is left once all fades are done
+        self.advance_time(.1)
+        self.assertEqual(10, scheduler.ticks)
+
+    def test_new_fade_replaces_running_fade(self):
+        light = SoftwareFadeLight(self.loop, 10)
+        fade = LinearFade(self.loop, 100)
+        light.set_fade(fade)
+        self.advance_time(.035)
+        self.assertEqual(4, fade.calls)
+
+        # a fade without software steps stops the old one
+        light.set_fade(lambda max_fade_ms: (0.0, -1))
+        self.advance_time(.1)
+        self.assertEqual(4, fade.calls)
+        self.assertEqual(0.0, light.brightness_log[-1])
+        self.assertEqual(0, FadeScheduler.get(self.loop, 10).fading_lights)
+
+    def test_intervals_do_not_share_a_scheduler(self):
+        slow_light = SoftwareFadeLight(self.loop, 50)
+        fast_light = SoftwareFadeLight(self.loop, 10)
+        slow_light.set_fade(LinearFade(self.loop, 100))
+        fast_light.set_fade(LinearFade(self.loop, 100))
+
+        self.assertIsNot(FadeScheduler.get(self.loop, 10), FadeScheduler.get(self.loop, 50))
+        self.advance_time(.2)
+        self.assertEqual(3, len(slow_light.brightness_log))
+        self.assertEqual(11, len(fast_light.brightness_log))
+
+    def test_failing_fade_does_not_stop_others(self):
+        lights = [SoftwareFadeLight(self.loop, 10) for _ in range(3)]
+        fades = [LinearFade(self.loop, 100) for _ in range(3)]
+        for light, fade in zip(lights, fades):
+            light.set_fade(fade)
+
+        def _fail(max_fade_ms):
+            raise AssertionError("Broken fade {}".format(max_fade_ms))
+
+        errors = []
+        self.loop.set_exception_handler(lambda loop, context: errors.append(context))
+        FadeScheduler.get(self.loop, 10).add(lights[1], _fail)
+        self.advance_time(.2)
+
+        self.assertEqual(1, len(errors))
+        self.assertIsInstance(errors[0]['exception'], AssertionError)
+        self.assertEqual(1.0, lights[0].brightness_log[-1])
+        self.assertEqual(1.0, lights[2].brightness_log[-1])
+        self.assertEqual(11, len(lights[2].brightness_log))
+
+        # new fades still start
+        fade = LinearFade(self.loop, 50)
+        lights[1].set_fade(fade)
+        self.advance_time(.1)
+        self.assertEqual(6, fade.calls)
+        self.assertEqual(0, FadeScheduler.get(self.loop, 10).fading_lights)
+
+
+class TestFadeSchedulerLifetime(unittest.TestCase):
+
+    def test_stop_all(self):
+        loop = TimeTravelLoop()
+        light = SoftwareFadeLight(loop, 10)
+        fade = LinearFade(loop, 100)
+        light.set_fade(fade)
+        scheduler = FadeScheduler.get(loop, 10)
+
+        FadeScheduler.stop_all(loop)
+        self.assertEqual(0, scheduler.fading_lights)
+        self.assertNotIn(loop, FadeScheduler._schedulers)
+        loop.run_until_complete(asyncio.sleep(delay=.1, loop=loop))
+        self.assertEqual(1, fade.calls)
+        loop.close()
+
+    def test_closed_loops_are_freed(self):
+        loop_refs = []
+        for _ in range(5):
+            loop = TimeTravelLoop()
+            light = SoftwareFadeLight(loop, 10)
+            light.set_fade(LinearFade(loop, 100))
+            loop.run_until_complete(asyncio.sleep(delay=.2, loop=loop))
+            loop.close()
+            loop_refs.append(weakref.ref(loop))
+        del loop, light
+        gc.collect()
+
+        self.assertEqual([None] * 5, [loop_ref() for loop_ref in loop_refs])
@@ -139,6 +139,12 @@ class TestLisy(MpfTestCase):
         # turns inactive (because of NC)
         self.assertSwitchState("s_test77_nc", False)
 
+        # short quiet gaps do not slow down polling
+        stats = self.machine.default_platform.get_poll_stats()
+        self.assertEqual(3, stats["active_polls"])
+        self.assertLess(stats["active_polls"], stats["polls"])
+        self.assertAlmostEqual(1, stats["interval_ms"])
+
         # pulse coil
         self.serialMock.expected_commands = {
             b'\x18\x00\x0a': None,      # set pulse_ms to 10ms
@@ -0,0 +1,81 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class TestLoopMonitor(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/loop_monitor/'
+
+    def setUp(self):
+        super().setUp()
+        # callbacks only take time when they call _block_loop
+        self.monotonic = 0
+        self.time_patch = patch("mpf.core.loop_monitor.time")
+        self.time_patch.start().monotonic.side_effect = lambda: self.monotonic
+        # forget whatever was slow during startup
+        self.machine.loop_monitor.slow_callbacks.clear()
+        self.machine.loop_monitor.slow_callback_count = 0
+
+    def tearDown(self):
+        self.time_patch.stop()
+        super().tearDown()
+
+    def _block_loop(self):
+        self.monotonic += .02
+
+    def test_lag_and_publish(self):
+        self.assertTrue(self.machine.loop_monitor.enabled)
+        self.advance_time_and_run(5.05)
+
+        stats = self.machine.loop_monitor.get_stats()
+        self.assertLessEqual(50, stats["lag"]["count"])
+        self.assertIsNotNone(self.machine.get_machine_var("loop_lag_p99"))
+        self.assertEqual(0, self.machine.get_machine_var("loop_slow_callbacks"))
+
+    def test_slow_callbacks(self):
+        self.machine.clock.loop.call_soon(self._block_loop)
+        self.advance_time_and_run()
+
+        slow_callbacks = self.machine.loop_monitor.slow_callbacks
+        self.assertEqual(1, len(slow_callbacks))
+        self.assertTrue(slow_callbacks[0].name.endswith("test_LoopMonitor.TestLoopMonitor._block_loop"))
+        self.assertAlmostEqual(20, slow_callbacks[0].duration)
+        self.assertIn("_block_loop", slow_callbacks[0].stack[0])
+
+        # task steps are recorded with the name of the coroutine
+        @asyncio.coroutine
+        def _slow_task():
+            yield from asyncio.sleep(.1, loop=self.loop)
+            self._block_loop()
+
+        self.loop.create_task(_slow_task())
+        self.advance_time_and_run()
+        self.assertEqual(2, self.machine.loop_monitor.slow_callback_count)
+        self.assertIn("_slow_task", slow_callbacks[-1].name)
+
+        # only the last callbacks are kept
+        self.machine.clock.loop.call_soon(self._block_loop)
+        self.advance_time_and_run()
+        self.assertEqual(3, self.machine.loop_monitor.slow_callback_count)
+        self.assertEqual(2, len(slow_callbacks))
+
+        client = MagicMock()
+        self.machine.bcp.transport.send_to_client = MagicMock()
+        stats = self.machine.loop_monitor.get_stats()
+        self.machine.loop_monitor._bcp_receive_loop_stats(client=client, reset=True)
+        self.machine.bcp.transport.send_to_client.assert_called_once_with(client, "loop_stats", stats=stats)
+        self.assertEqual(0, self.machine.loop_monitor.slow_callback_count)
+
+    def test_stop(self):
+        original_run = self.machine.loop_monitor._original_run
+        self.machine.loop_monitor.stop()
+        self.assertIs(original_run, asyncio.Handle._run)
+        self.machine.clock.loop.call_soon(self._block_loop)
+        self.advance_time_and_run()
+        self.assertEqual(0, self.machine.loop_monitor.slow_callback_count)
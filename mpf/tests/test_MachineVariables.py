@@ -1,4 +1,6 @@
 """Test the bonus mode."""
+from unittest.mock import MagicMock
+
 from mpf.tests.MpfTestCase import MpfTestCase
 from mpf._version import version, extended_version
 
@@ -55,3 +57,75 @@ class TestMalformedMachineVariables(MpfTestCase):
         self.assertEqual(118208660, self.machine.get_machine_var("player2_score"))
         self.assertFalse(self.machine.is_machine_var("player5_score"))
         self.assertEqual(None, self.machine.get_machine_var("player5_score"))
+
+
+class TestMixedCaseMachineVariables(MpfTestCase):
+
+    def _get_mock_data(self):
+        return {"machine_vars": {"Mixed_Score": {"value": 1},
+                                 "mixed_score": {"value": 2},
+                                 "MIXED_SCORE": {"value": 3},
+                                 "Other_Score": {"value": 4, "expire": 1000000000000}}}
+
+    def testLowercasedOnLoad(self):
+        data_manager = self.machine.machine_var_data_manager
+        # the lowercase spelling wins
+        self.assertEqual(2, self.machine.get_machine_var("Mixed_Score"))
+        self.assertEqual(4, self.machine.get_machine_var("other_score"))
+        self.assertEqual({"mixed_score": {"value": 2}, "other_score": {"value": 4, "expire": 1000000000000}},
+                         data_manager.data)
+
+        self.machine.remove_machine_var("Other_Score")
+        self.assertNotIn("other_score", data_manager.data)
+        self.machine.remove_machine_var_search(startswith="mixed")
+        self.assertEqual({}, data_manager.data)
+
+
+class TestMachineVariableStore(MpfTestCase):
+
+    def testCaseInsensitive(self):
+        self.machine.set_machine_var("Test_Var", 7)
+        self.assertEqual(7, self.machine.get_machine_var("test_var"))
+        self.assertEqual(7, self.machine.get_machine_var("TEST_VAR"))
+        self.assertTrue(self.machine.is_machine_var("TEST_var"))
+        self.assertIn("test_var", list(self.machine.machine_vars))
+
+        self.machine.remove_machine_var("TEST_VAR")
+        self.assertFalse(self.machine.is_machine_var("Test_Var"))
+        self.assertIsNone(self.machine.get_machine_var("test_var"))
+
+    def testEventsOnlyWithHandlers(self):
+        self.machine.events.post = MagicMock(wraps=self.machine.events.post)
+        self.machine.set_machine_var("test_var", 1)
+        self.machine.set_machine_var("test_var", 2)
+        self.assertFalse(self.machine.events.post.called)
+
+        handler = MagicMock()
+        self.machine.events.add_handler("machine_var_test_var", handler)
+        self.machine.set_machine_var("Test_Var", 5)
+        self.advance_time_and_run()
+        handler.assert_called_once_with(value=5, prev_value=2, change=3)
+
+        # no change
+        handler.reset_mock()
+        self.machine.set_machine_var("test_var", 5)
+        self.advance_time_and_run()
+        self.assertFalse(handler.called)
+
+    def testBatchedPersistence(self):
+        data_manager = self.machine.machine_var_data_manager
+        data_manager.save_all = MagicMock()
+        self.machine.configure_machine_var("credits", persist=True, expire_secs=100)
+        self.machine.configure_machine_var("other", persist=True)
+        self.machine.set_machine_var("credits", 1)
+        self.machine.set_machine_var("credits", 2)
+        self.machine.set_machine_var("other", "a")
+        self.machine.set_machine_var("not_persisted", 3)
+        self.assertNotIn("credits", data_manager.data)
+
+        self.advance_time_and_run()
+        data_manager.save_all.assert_called_once_with(delay_secs=0)
+        self.assertEqual(2, data_manager.data["credits"]["value"])
+        self.assertLess(self.machine.clock.get_time(), data_manager.data["credits"]["expire"])
+        self.assertEqual({"value": "a"}, data_manager.data["other"])
+        self.assertNotIn("not_persisted", data_manager.data)
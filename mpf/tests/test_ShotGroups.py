@@ -156,6 +156,33 @@ class TestShotGroups(MpfFakeGameTestCase):
         self.assertEqual("lit", self.machine.shots.shot_4.get_profile_by_key('mode', None)[
             'current_state_name'])
 
+    def test_state_counts(self):
+        self.start_game()
+        group = self.machine.shot_groups.test_group
+        mode = self.machine.modes.mode_shot_groups
+
+        self.assertEqual({("default", "unlit"): 4}, group._state_counts[None])
+        self.hit_and_release_switch("switch_1")
+        self.assertEqual({("default", "unlit"): 3, ("default", "lit"): 1}, group._state_counts[None])
+
+        mode.start()
+        self.advance_time_and_run()
+        self.assertEqual({("three_states_loop", "one"): 3},
+                         self.machine.shot_groups.test_group_in_mode._state_counts[mode])
+
+        mode.stop()
+        self.advance_time_and_run()
+        self.assertFalse(self.machine.shot_groups.test_group_in_mode._state_counts[mode])
+        self.assertEqual({("default", "unlit"): 3, ("default", "lit"): 1}, group._state_counts[None])
+
+        self.mock_event("test_group_default_lit_complete")
+        self.hit_and_release_switch("switch_2")
+        self.hit_and_release_switch("switch_3")
+        self.assertEqual(0, self._events['test_group_default_lit_complete'])
+        self.hit_and_release_switch("switch_4")
+        self.assertEqual(1, self._events['test_group_default_lit_complete'])
+        self.assertEqual({("default", "lit"): 4}, group._state_counts[None])
+
     def test_shot_group_in_mode(self):
         self.start_game()
 
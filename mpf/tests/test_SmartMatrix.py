@@ -8,11 +8,14 @@ class SmartMatrixSerial(MockSerial):
         super().__init__()
         self.type = None
         self.receive_data = b''
+        self.blocked = False
 
     def write_ready(self):
-        return True
+        return not self.blocked
 
     def write(self, msg):
+        if self.blocked:
+            return 0
         self.receive_data += msg
         return len(msg)
 
@@ -52,3 +55,18 @@ class TestSmartMatrix(MpfTestCase):
         self.machine.rgb_dmds.smartmatrix_2.update([0x00, 0x01, 0x02, 0x03])
         self.advance_time_and_run()
         self.assertEqual(b'\x01\x00\x01\x02\x03', self.serial2.receive_data)
+
+    def test_smart_matrix_drops_stale_frames(self):
+        header = b'\xba\x11\x00\x03\x04\x00\x00\x00'
+        self.serial1.blocked = True
+        self.machine.rgb_dmds.smartmatrix_1.update(b'\x01\x01')
+        self.machine.rgb_dmds.smartmatrix_1.update(b'\x02\x02')
+        self.machine.rgb_dmds.smartmatrix_1.update(b'\x03\x03')
+        self.advance_time_and_run()
+        self.assertEqual(b'', self.serial1.receive_data)
+
+        # serial is ready again. the second frame got dropped
+        self.serial1.blocked = False
+        self.advance_time_and_run()
+        self.assertEqual(header + b'\x01\x01' + header + b'\x03\x03', self.serial1.receive_data)
+        self.assertEqual(1, self.machine.rgb_dmds.smartmatrix_1.hw_device.frames_dropped)
@@ -0,0 +1,81 @@
+from mpf.platforms.interfaces.driver_platform_interface import PulseSettings
+
+from mpf.core.platform import SwitchSettings, DriverSettings
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class TestSoftwareRules(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/flippers/'
+
+    def get_platform(self):
+        return 'virtual'
+
+    def _switch_changed(self, number, state):
+        self.machine.default_platform.software_rules.switch_changed(number, state)
+
+    def test_flipper(self):
+        main_coil = self.machine.coils.c_flipper_main.hw_driver
+        states_in_handler = []
+        self.machine.switch_controller.add_switch_handler(
+            "s_flipper", lambda: states_in_handler.append(main_coil.state))
+
+        self.machine.flippers.f_test_single.enable()
+        start = self.machine.clock.get_time()
+        self._switch_changed("1", 1)
+        # driver fired before the switch controller ran any handlers and without waiting for the loop
+        self.assertEqual("enabled", main_coil.state)
+        self.assertEqual(["enabled"], states_in_handler)
+        self.assertEqual(start, self.machine.clock.get_time())
+        self.assertSwitchState("s_flipper", 1)
+
+        self._switch_changed("1", 0)
+        self.assertEqual("disabled", main_coil.state)
+        self.assertSwitchState("s_flipper", 0)
+
+        # no rule after disable
+        self.machine.flippers.f_test_single.disable()
+        self._switch_changed("1", 1)
+        self.assertEqual("disabled", main_coil.state)
+        self.assertSwitchState("s_flipper", 1)
+
+    def test_flipper_with_eos(self):
+        main_coil = self.machine.coils.c_flipper_main.hw_driver
+        hold_coil = self.machine.coils.c_flipper_hold.hw_driver
+        self.machine.flippers.f_test_hold_eos.enable()
+
+        self._switch_changed("1", 1)
+        self.assertEqual("enabled", main_coil.state)
+        self.assertEqual("enabled", hold_coil.state)
+
+        # eos disables the main coil
+        self._switch_changed("2", 1)
+        self.assertEqual("disabled", main_coil.state)
+        self.assertEqual("enabled", hold_coil.state)
+
+        self._switch_changed("2", 0)
+        self._switch_changed("1", 0)
+        self.assertEqual("disabled", main_coil.state)
+        self.assertEqual("disabled", hold_coil.state)
+
+    def test_pulse_on_hit(self):
+        platform = self.machine.default_platform
+        coil = self.machine.coils.c_flipper_main.hw_driver
+        switch = SwitchSettings(hw_switch=self.machine.switches.s_flipper.hw_switch, invert=True, debounce=False)
+        driver = DriverSettings(hw_driver=coil, pulse_settings=PulseSettings(power=1.0, duration=23),
+                                hold_settings=None, recycle=False)
+        platform.set_pulse_on_hit_rule(switch, driver)
+
+        # inverted switch. 0 is active
+        self._switch_changed("1", 1)
+        self.assertEqual("disabled", coil.state)
+        self._switch_changed("1", 0)
+        self.assertEqual("pulsed_23", coil.state)
+
+        platform.clear_hw_rule(switch, driver)
+        self.assertFalse(platform.software_rules.has_rules("1"))
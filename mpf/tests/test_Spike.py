@@ -85,7 +85,7 @@ class MockSpikeSocket(MockSerial):
         self.crashed = False
 
 
-class SpikePlatformTest(MpfTestCase):
+class BaseSpikePlatformTest(MpfTestCase):
 
     def _checksummed_cmd(self, msg, read_back=0):
         checksum = SpikePlatform._checksum(msg)
@@ -197,6 +197,9 @@ class SpikePlatformTest(MpfTestCase):
         del self.serialMock.permanent_commands[self._checksummed_cmd(b'\x80\x03\xf0\x22')]
         del self.serialMock.permanent_commands[self._checksummed_cmd(b'\x80\x03\xf0\x11')]
 
+
+class SpikePlatformTest(BaseSpikePlatformTest):
+
     def testPlatform(self):
         self._testCoils()
         self._testCoilRules()
@@ -367,3 +370,75 @@ class SpikePlatformTest(MpfTestCase):
         self.machine.lights.backlight.color([100, 100, 100])
         self.advance_time_and_run(.1)
         self.assertFalse(self.serialMock.expected_commands)
+
+
+class SpikePollTest(BaseSpikePlatformTest):
+
+    def __init__(self, methodName='runTest'):
+        super().__init__(methodName)
+        self.machine_config_patches['spike'] = {'poll_hz': 1000, 'idle_poll_hz': 100, 'idle_poll_after': '1s'}
+
+    def _switch_change(self, inputs):
+        self.serialMock.expected_commands = {
+            b'\x00': b'\x01',
+            self._checksummed_cmd(b'\x81\x02\x11', 10): self._checksummed_response(inputs),    # read inputs
+        }
+        self.advance_time_and_run(.01)
+        self.assertFalse(self.serialMock.expected_commands)
+
+    def _polls_in(self, secs):
+        polls = self.machine.default_platform.get_poll_stats()["polls"]
+        self.advance_time_and_run(secs)
+        return self.machine.default_platform.get_poll_stats()["polls"] - polls
+
+    def testAdaptivePolling(self):
+        platform = self.machine.default_platform
+
+        # nothing happened since startup. polling is idle
+        stats = platform.get_poll_stats()
+        self.assertEqual(0, stats["active_polls"])
+        self.assertAlmostEqual(10, stats["interval_ms"])
+        self.assertAlmostEqual(10, self._polls_in(.1), delta=1)
+
+        # activity brings back the full rate right away
+        self._switch_change(b'\xff\xf7\xff\xff\xff\xff\xff\xff\x00')
+        self.assertSwitchState("s_start", True)
+        stats = platform.get_poll_stats()
+        self.assertEqual(1, stats["active_polls"])
+        self.assertAlmostEqual(1, stats["interval_ms"])
+        self.assertIsNotNone(stats["avg_poll_ms"])
+        self.assertGreaterEqual(stats["max_poll_ms"], stats["avg_poll_ms"])
+
+        # quiet gaps during play keep the full poll rate
+        self.advance_time_and_run(.5)
+        self.assertAlmostEqual(1, platform.get_poll_stats()["interval_ms"])
+        self.assertAlmostEqual(100, self._polls_in(.1), delta=5)
+
+        self._switch_change(b'\xff\xff\xff\xff\xff\xff\xff\xff\x00')
+        self.assertSwitchState("s_start", False)
+        self.assertEqual(2, platform.get_poll_stats()["active_polls"])
+
+        # no switch activity for idle_poll_after. back off to idle_poll_hz
+        self.advance_time_and_run(1.5)
+        self.assertAlmostEqual(10, platform.get_poll_stats()["interval_ms"])
+        self.assertAlmostEqual(10, self._polls_in(.1), delta=1)
+
+    def testDesyncDuringPlay(self):
+        platform = self.machine.default_platform
+        self._switch_change(b'\xff\xf7\xff\xff\xff\xff\xff\xff\x00')
+        self.advance_time_and_run(.1)
+        self.assertAlmostEqual(1, platform.get_poll_stats()["interval_ms"])
+
+        # an invalid node id. wait one idle interval before polling again
+        self.serialMock.expected_commands = {
+            b'\x00': b'\x20',
+        }
+        self.advance_time_and_run(.002)
+        self.assertFalse(self.serialMock.expected_commands)
+        self.assertAlmostEqual(10, platform.get_poll_stats()["interval_ms"])
+        self.assertEqual(0, self._polls_in(.007))
+
+        # then polling continues at the full rate
+        self.advance_time_and_run(.005)
+        self.assertAlmostEqual(1, platform.get_poll_stats()["interval_ms"])
+        self.assertAlmostEqual(100, self._polls_in(.1), delta=5)
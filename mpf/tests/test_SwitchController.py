@@ -130,6 +130,34 @@ class TestSwitchController(MpfTestCase):
         self.advance_time_and_run(.1)
         cb.assert_called_with()
 
+    def test_remove_switch_handlers_by_keys(self):
+        cb = MagicMock()
+        timed_cb = MagicMock()
+        other_cb = MagicMock()
+        handlers = [
+            self.machine.switch_controller.add_switch_handler("s_test", cb),
+            self.machine.switch_controller.add_switch_handler("s_test", timed_cb, ms=300),
+            self.machine.switch_controller.add_switch_handler("s_test_events", cb, state=0),
+        ]
+        self.machine.switch_controller.add_switch_handler("s_test", other_cb)
+
+        self.hit_switch_and_run("s_test", .1)
+        self.assertEqual(1, cb.call_count)
+        self.assertEqual(1, other_cb.call_count)
+
+        # the timed handler is running
+        self.machine.switch_controller.remove_switch_handlers_by_keys(handlers)
+        self.advance_time_and_run(1)
+        timed_cb.assert_not_called()
+
+        self.release_switch_and_run("s_test", .1)
+        self.hit_switch_and_run("s_test", 1)
+        self.hit_switch_and_run("s_test_events", .1)
+        self.release_switch_and_run("s_test_events", .1)
+        self.assertEqual(1, cb.call_count)
+        timed_cb.assert_not_called()
+        self.assertEqual(2, other_cb.call_count)
+
     def test_activation_and_deactivation_events(self):
         self.mock_event("test_active")
         self.mock_event("test_active2")
@@ -0,0 +1,152 @@
+import logging
+from unittest.mock import MagicMock, patch, call
+
+from mpf.core.text_ui import TextUi
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class TestTextUi(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/switch_controller/'
+
+    def _create_screen(self):
+        screen = MagicMock()
+        screen.width = 80
+        screen.height = 25
+        screen.dimensions = (25, 80)
+        screen.has_resized.return_value = False
+        return screen
+
+    def setUp(self):
+        super().setUp()
+        self.screen = self._create_screen()
+        self.machine.options['text_ui'] = True
+        with patch("mpf.core.text_ui.Screen") as screen_cls:
+            screen_cls.open.return_value = self.screen
+            self.ui = TextUi(self.machine)
+        self.machine.options['text_ui'] = False
+        self.advance_time_and_run(1)
+        self.screen.reset_mock()
+
+    def tearDown(self):
+        # stop adds a console log handler
+        handlers = list(logging.getLogger().handlers)
+        self.ui.stop()
+        for handler in logging.getLogger().handlers[:]:
+            if handler not in handlers:
+                logging.getLogger().removeHandler(handler)
+        super().tearDown()
+
+    def _printed(self, rows=(5, 6)):
+        # the stats at the bottom change every second
+        return [c for c in self.screen.method_calls if c[0] == "print_at" and c[1][2] in rows]
+
+    def test_refresh_rate(self):
+        self.ui._print_at("a", 0, 5)
+        self.ui._print_at("b", 0, 5)
+        self.ui._print_at("c", 0, 6)
+        self.screen.print_at.assert_not_called()
+
+        # all changes are printed with one refresh
+        self.advance_time_and_run(.1)
+        self.assertEqual([call.print_at("b", 0, 5, colour=7, bg=0),
+                          call.print_at("c", 0, 6, colour=7, bg=0)], self._printed())
+        self.assertEqual(1, self.screen.refresh.call_count)
+
+        # not more than max_refresh_rate redraws per second
+        self.screen.reset_mock()
+        self.ui._print_at("d", 0, 5)
+        self.advance_time_and_run(.05)
+        self.screen.print_at.assert_not_called()
+        self.advance_time_and_run(.06)
+        self.assertEqual([call.print_at("d", 0, 5, colour=7, bg=0)], self._printed())
+        self.assertEqual(1, self.screen.refresh.call_count)
+
+    def test_unchanged_cells_are_not_printed(self):
+        self.ui._print_at("a", 0, 5)
+        self.advance_time_and_run(.2)
+        self.screen.reset_mock()
+
+        self.ui._print_at("a", 0, 5)
+        self.advance_time_and_run(.2)
+        self.screen.print_at.assert_not_called()
+        self.screen.refresh.assert_not_called()
+
+        # changed and changed back before the redraw
+        self.ui._print_at("b", 0, 5)
+        self.ui._print_at("a", 0, 5)
+        self.advance_time_and_run(.2)
+        self.screen.print_at.assert_not_called()
+
+        # other colour
+        self.ui._print_at("a", 0, 5, colour=3)
+        self.advance_time_and_run(.2)
+        self.assertEqual([call.print_at("a", 0, 5, colour=3, bg=0)], self._printed())
+
+    def test_overwritten_cells_are_printed_again(self):
+        self.ui._print_at("sw1", 10, 5)
+        self.ui._print_at("sw2", 30, 5)
+        self.advance_time_and_run(.2)
+        self.screen.reset_mock()
+
+        # a line over both switches. afterwards only sw1 is set again
+        self.ui._print_at(" " * 80, 0, 5)
+        self.ui._print_at("sw1", 10, 5)
+        self.advance_time_and_run(.2)
+        self.assertEqual([call.print_at(" " * 80, 0, 5, colour=7, bg=0),
+                          call.print_at("sw1", 10, 5, colour=7, bg=0)], self._printed())
+
+        # sw2 has been overwritten
+        self.screen.reset_mock()
+        self.ui._print_at("sw1", 10, 5)
+        self.ui._print_at("sw2", 30, 5)
+        self.advance_time_and_run(.2)
+        self.assertEqual([call.print_at("sw2", 30, 5, colour=7, bg=0)], self._printed())
+
+        # a cell set before a line in the same redraw is overwritten by it
+        self.screen.reset_mock()
+        self.ui._print_at("sw3", 50, 5)
+        self.ui._print_at(" " * 80, 0, 5)
+        self.advance_time_and_run(.2)
+        self.screen.reset_mock()
+        self.ui._print_at("sw3", 50, 5)
+        self.ui._print_at("sw1", 10, 5)
+        self.advance_time_and_run(.2)
+        self.assertEqual([call.print_at("sw3", 50, 5, colour=7, bg=0),
+                          call.print_at("sw1", 10, 5, colour=7, bg=0)], self._printed())
+
+    def test_bcp_connected_redraws_row(self):
+        height = self.screen.height
+        self.ui._bcp_connection_attempt("local_display", "localhost", 5050)
+        self.ui._print_at("sw", 10, int(height / 2) - 1)
+        self.advance_time_and_run(.2)
+        self.screen.reset_mock()
+
+        self.ui._bcp_connected()
+        self.ui._print_at("sw", 10, int(height / 2) - 1)
+        self.advance_time_and_run(.2)
+        self.assertEqual([call.print_at(" " * 80, 0, int(height / 2) - 1, colour=7, bg=0),
+                          call.print_at("sw", 10, int(height / 2) - 1, colour=7, bg=0)],
+                         self._printed(rows=[int(height / 2) - 1]))
+
+    def test_resize(self):
+        self.ui._print_at("sw1", 10, 5)
+        self.advance_time_and_run(.2)
+
+        new_screen = self._create_screen()
+        self.screen.has_resized.return_value = True
+        with patch("mpf.core.text_ui.Screen") as screen_cls, patch.object(self.machine, "bcp"):
+            screen_cls.open.return_value = new_screen
+            self.ui._tick()
+
+        # everything is printed on the new screen. also unchanged cells
+        self.ui._print_at("sw1", 10, 5)
+        self.advance_time_and_run(.2)
+        printed = [c for c in new_screen.method_calls if c[0] == "print_at"]
+        self.assertIn(call.print_at("sw1", 10, 5, colour=7, bg=0), printed)
+        self.assertIn(call.print_at("SWITCHES", 32, 2, colour=7, bg=0), printed)
+        self.screen = new_screen